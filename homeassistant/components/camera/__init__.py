@@ -78,7 +78,7 @@ from .const import (  # noqa: F401
     SERVICE_RECORD,
     StreamType,
 )
-from .img_util import scale_jpeg_camera_image
+from .image_cache import async_get_image_cache
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
 
 _LOGGER = logging.getLogger(__name__)
@@ -195,7 +195,10 @@ async def _async_get_image(
                     assert width is not None
                     assert height is not None
                     return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
+                        content_type,
+                        await async_get_image_cache(camera.hass).async_scale_jpeg(
+                            camera.entity_id, image, width, height
+                        ),
                     )
 
                 return image
@@ -828,11 +831,19 @@ class CameraImageView(CameraView):
         width = request.query.get("width")
         height = request.query.get("height")
         try:
-            image = await _async_get_image(
-                camera,
-                CAMERA_IMAGE_TIMEOUT,
-                int(width) if width else None,
-                int(height) if height else None,
+            width_int = int(width) if width else None
+            height_int = int(height) if height else None
+            # Viewers requesting the same camera and size
+            # at the same time share one fetch
+            image = await async_get_image_cache(camera.hass).async_get_image(
+                (camera.entity_id, width_int, height_int),
+                partial(
+                    _async_get_image,
+                    camera,
+                    CAMERA_IMAGE_TIMEOUT,
+                    width_int,
+                    height_int,
+                ),
             )
         except (HomeAssistantError, ValueError) as ex:
             raise web.HTTPInternalServerError from ex
@@ -26,6 +26,10 @@ CONF_DURATION: Final = "duration"
 
 CAMERA_STREAM_SOURCE_TIMEOUT: Final = 10
 CAMERA_IMAGE_TIMEOUT: Final = 10
+# Scaled camera images are kept until unused for CAMERA_IMAGE_CACHE_MAX_AGE
+# seconds or until they use more than CAMERA_IMAGE_CACHE_MAX_BYTES
+CAMERA_IMAGE_CACHE_MAX_AGE: Final = 60
+CAMERA_IMAGE_CACHE_MAX_BYTES: Final = 16 * 1024 * 1024
 
 
 class StreamType(StrEnum):
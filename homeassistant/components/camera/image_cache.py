@@ -0,0 +1,143 @@
+"""Cache of scaled camera images."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine
+from datetime import datetime
+from functools import partial
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.hass_dict import HassKey
+
+from .const import CAMERA_IMAGE_CACHE_MAX_AGE, CAMERA_IMAGE_CACHE_MAX_BYTES, DOMAIN
+from .img_util import scale_jpeg_camera_image
+
+if TYPE_CHECKING:
+    from . import Image
+
+DATA_IMAGE_CACHE: HassKey[CameraImageCache] = HassKey(f"{DOMAIN}.image_cache")
+
+type _CacheKey = tuple[str, int | None, int | None]
+
+
+class CameraImageCache:
+    """Share camera image fetches and reuse scaled images.
+
+    Concurrent requests for the same camera and size share one fetch.
+    Scaled images are kept per camera and size together with the frame
+    they were scaled from, so the frame is only decoded and scaled again
+    once the camera returns a new frame. Scaled images not used for
+    max_age are dropped by a sweep scheduled while images are cached,
+    and the least recently used ones are dropped once they use more
+    than max_bytes.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_bytes: int, max_age: float) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+        self._bytes = 0
+        self._pending: dict[_CacheKey, asyncio.Future[Image]] = {}
+        self._scaled: OrderedDict[_CacheKey, tuple[float, bytes, bytes]] = OrderedDict()
+        self._sweep_job = HassJob(
+            self._async_sweep, "camera image cache sweep", cancel_on_shutdown=True
+        )
+        self._sweep_unsub: CALLBACK_TYPE | None = None
+
+    async def async_get_image(
+        self, key: _CacheKey, fetch: Callable[[], Coroutine[Any, Any, Image]]
+    ) -> Image:
+        """Return the image of a fetch for key, joining a running one."""
+        if (future := self._pending.get(key)) is None:
+            future = self._pending[key] = self._hass.async_create_background_task(
+                fetch(), f"camera image fetch {key[0]}"
+            )
+            future.add_done_callback(partial(self._async_fetch_done, key))
+        # Shield the fetch so a request going away does
+        # not cancel it for the other requests
+        return await asyncio.shield(future)
+
+    @callback
+    def _async_fetch_done(self, key: _CacheKey, future: asyncio.Future[Image]) -> None:
+        """Forget a finished fetch."""
+        del self._pending[key]
+
+    async def async_scale_jpeg(
+        self, entity_id: str, image: Image, width: int, height: int
+    ) -> bytes:
+        """Scale a jpeg image of a camera, reusing the result for the same frame."""
+        key = (entity_id, width, height)
+        content = image.content
+        now = time.monotonic()
+        if (cached := self._scaled.get(key)) is not None:
+            _, source, scaled = cached
+            if source == content:
+                self._scaled[key] = (now + self._max_age, source, scaled)
+                self._scaled.move_to_end(key)
+                return scaled
+        scaled = await self._hass.async_add_executor_job(
+            scale_jpeg_camera_image, image, width, height
+        )
+        self._async_store(key, now + self._max_age, content, scaled)
+        return scaled
+
+    @callback
+    def _async_store(
+        self, key: _CacheKey, expire_time: float, source: bytes, scaled: bytes
+    ) -> None:
+        """Store a scaled image and drop expired or excess ones."""
+        if key in self._scaled:
+            self._async_drop(key)
+        if (size := len(source) + len(scaled)) > self._max_bytes:
+            return
+        self._scaled[key] = (expire_time, source, scaled)
+        self._bytes += size
+        now = time.monotonic()
+        # Expiry is extended on use, so the least recently
+        # used images are also the first ones to expire
+        while (oldest := next(iter(self._scaled))) != key and (
+            self._bytes > self._max_bytes or self._scaled[oldest][0] <= now
+        ):
+            self._async_drop(oldest)
+        if self._sweep_unsub is None:
+            self._async_schedule_sweep(now)
+
+    @callback
+    def _async_schedule_sweep(self, now: float) -> None:
+        """Schedule a sweep for when the oldest scaled image expires."""
+        expire_time = next(iter(self._scaled.values()))[0]
+        self._sweep_unsub = async_call_later(
+            self._hass, max(expire_time - now, 0), self._sweep_job
+        )
+
+    @callback
+    def _async_sweep(self, _now: datetime) -> None:
+        """Drop the expired scaled images."""
+        self._sweep_unsub = None
+        now = time.monotonic()
+        while self._scaled and next(iter(self._scaled.values()))[0] <= now:
+            self._async_drop(next(iter(self._scaled)))
+        if self._scaled:
+            self._async_schedule_sweep(now)
+
+    @callback
+    def _async_drop(self, key: _CacheKey) -> None:
+        """Drop the scaled image for key."""
+        _, source, scaled = self._scaled.pop(key)
+        self._bytes -= len(source) + len(scaled)
+
+
+@callback
+def async_get_image_cache(hass: HomeAssistant) -> CameraImageCache:
+    """Return the camera image cache, creating it on first use."""
+    if (image_cache := hass.data.get(DATA_IMAGE_CACHE)) is None:
+        image_cache = hass.data[DATA_IMAGE_CACHE] = CameraImageCache(
+            hass, CAMERA_IMAGE_CACHE_MAX_BYTES, CAMERA_IMAGE_CACHE_MAX_AGE
+        )
+    return image_cache
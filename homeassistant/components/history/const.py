@@ -5,3 +5,6 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Smaller chunks would send more messages than the connection can queue
+MIN_HISTORY_CHUNK_SIZE = 100
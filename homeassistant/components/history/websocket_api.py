@@ -7,12 +7,14 @@ from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
+import threading
 from typing import Any, cast
 
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import (
@@ -39,7 +41,11 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    MAX_PENDING_HISTORY_STATES,
+    MIN_HISTORY_CHUNK_SIZE,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -65,7 +71,6 @@ def async_setup(hass: HomeAssistant) -> None:
 
 def _ws_get_significant_states(
     hass: HomeAssistant,
-    msg_id: int,
     start_time: dt,
     end_time: dt | None,
     entity_ids: list[str] | None,
@@ -76,24 +81,99 @@ def _ws_get_significant_states(
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
     return json_bytes(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
+        history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
         )
     )
 
 
+def _ws_stream_significant_states(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    cancel: threading.Event,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+) -> None:
+    """Fetch history significant_states and send them in chunks in the executor.
+
+    The next chunk is only fetched from the database once the writer
+    of the connection has written the previous one to the client, so a
+    slow client cannot make the pending messages of the connection pile
+    up.
+    """
+    loop = hass.loop
+    with session_scope(hass=hass, read_only=True) as session:
+        for states in history.stream_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            chunk_size,
+        ):
+            if cancel.is_set():
+                return
+            asyncio.run_coroutine_threadsafe(
+                _async_send_chunk_and_wait_drained(
+                    connection,
+                    json_bytes(messages.event_message(msg_id, {"states": states})),
+                ),
+                loop,
+            ).result()
+
+
+async def _async_send_chunk_and_wait_drained(
+    connection: ActiveConnection, message: bytes
+) -> None:
+    """Send a chunk of history and wait until it is written to the client."""
+    connection.send_message(message)
+    await connection.async_wait_drained()
+
+
+@callback
+def _async_send_history_done(connection: ActiveConnection, msg_id: int) -> None:
+    """Send the last message of a chunked history response."""
+    if connection.subscriptions.pop(msg_id, None) is None:
+        return
+    connection.send_message(
+        json_bytes(messages.event_message(msg_id, {"states": {}, "done": True}))
+    )
+
+
+@callback
+def _async_send_empty_history(
+    connection: ActiveConnection, msg_id: int, chunked: bool
+) -> None:
+    """Send an empty history response."""
+    if not chunked:
+        connection.send_result(msg_id, {})
+        return
+    connection.send_result(msg_id)
+    connection.send_message(
+        json_bytes(messages.event_message(msg_id, {"states": {}, "done": True}))
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -104,14 +184,21 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunk_size"): vol.All(int, vol.Range(min=MIN_HISTORY_CHUNK_SIZE)),
     }
 )
 @websocket_api.async_response
 async def ws_get_history_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle history during period websocket command."""
+    """Handle history during period websocket command.
+
+    If chunk_size is set the states are not part of the result, they
+    are sent as events with at most chunk_size rows each followed by
+    an event with done set once all states are sent.
+    """
     start_time_str = msg["start_time"]
+    chunk_size: int | None = msg.get("chunk_size")
     end_time_str = msg.get("end_time")
 
     if start_time := dt_util.parse_datetime(start_time_str):
@@ -130,7 +217,7 @@ async def ws_get_history_during_period(
         end_time = None
 
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg["id"], chunk_size is not None)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -150,17 +237,23 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg["id"], chunk_size is not None)
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
-    connection.send_message(
+    if chunk_size is not None:
+        msg_id: int = msg["id"]
+        cancel = threading.Event()
+        connection.subscriptions[msg_id] = cancel.set
+        connection.send_result(msg_id)
         await get_instance(hass).async_add_executor_job(
-            _ws_get_significant_states,
+            _ws_stream_significant_states,
             hass,
-            msg["id"],
+            connection,
+            msg_id,
+            cancel,
             start_time,
             end_time,
             entity_ids,
@@ -168,8 +261,39 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            chunk_size,
         )
+        # The job waits for each chunk to be queued
+        # so they have all been queued before done
+        _async_send_history_done(connection, msg_id)
+        return
+
+    instance = get_instance(hass)
+    # Identical requests, e.g. from several dashboards opened at
+    # the same time, share one query
+    payload = await instance.query_cache.async_get(
+        (
+            "history_during_period",
+            start_time,
+            end_time,
+            tuple(entity_ids),
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        ),
+        instance.states_generation,
+        _ws_get_significant_states,
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
     )
+    connection.send_message(messages.construct_result_message(msg["id"], payload))
 
 
 def _generate_stream_message(
@@ -213,7 +337,6 @@ def _generate_websocket_response(
 
 def _generate_historical_response(
     hass: HomeAssistant,
-    msg_id: int,
     start_time: dt,
     end_time: dt,
     entity_ids: list[str] | None,
@@ -221,9 +344,12 @@ def _generate_historical_response(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
-    send_empty: bool,
-) -> tuple[float, dt | None, bytes | None]:
-    """Generate a historical response."""
+) -> tuple[float, bytes | None]:
+    """Generate a historical response.
+
+    Returns the time of the last state and the json of the
+    stream message or None if there were no states.
+    """
     states = cast(
         dict[str, list[dict[str, Any]]],
         history.get_significant_states(
@@ -249,19 +375,15 @@ def _generate_historical_response(
             last_time_ts = cast(float, state_last_time)
 
     if last_time_ts == 0:
-        # If we did not send any states ever, we need to send an empty response
-        # so the websocket client knows it should render/process/consume the
-        # data.
-        if not send_empty:
-            return last_time_ts, None, None
-        last_time_dt = end_time
-    else:
-        last_time_dt = dt_util.utc_from_timestamp(last_time_ts)
+        return last_time_ts, None
 
     return (
         last_time_ts,
-        last_time_dt,
-        _generate_websocket_response(msg_id, start_time, last_time_dt, states),
+        json_bytes(
+            _generate_stream_message(
+                states, start_time, dt_util.utc_from_timestamp(last_time_ts)
+            )
+        ),
     )
 
 
@@ -277,13 +399,17 @@ async def _async_send_historical_states(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    open_ended: bool = False,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
+    """Fetch history significant_states and send them to the client.
+
+    If open_ended is set, end_time is the current time and the
+    query is shared with identical queries until new states are
+    committed.
+    """
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
+    args = (
         hass,
-        msg_id,
         start_time,
         end_time,
         entity_ids,
@@ -291,11 +417,37 @@ async def _async_send_historical_states(
         significant_changes_only,
         minimal_response,
         no_attributes,
-        send_empty,
     )
-    if payload:
-        connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    if open_ended:
+        last_time_ts, payload = await instance.query_cache.async_get(
+            (
+                "history_stream",
+                start_time,
+                tuple(entity_ids) if entity_ids else None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            ),
+            instance.states_generation,
+            _generate_historical_response,
+            *args,
+        )
+    else:
+        last_time_ts, payload = await instance.async_add_executor_job(
+            _generate_historical_response, *args
+        )
+    if payload is None:
+        # If we did not send any states ever, we need to send an empty response
+        # so the websocket client knows it should render/process/consume the
+        # data.
+        if send_empty:
+            connection.send_message(
+                _generate_websocket_response(msg_id, start_time, end_time, {})
+            )
+        return None
+    connection.send_message(messages.construct_event_message(msg_id, payload))
+    return dt_util.utc_from_timestamp(last_time_ts)
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
@@ -534,6 +686,7 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        open_ended=True,
     )
 
     if msg_id not in connection.subscriptions:
@@ -45,6 +45,7 @@ from .const import (  # noqa: F401
     LOGBOOK_ENTRY_NAME,
     LOGBOOK_ENTRY_SOURCE,
 )
+from .helpers import ContextOriginIndex
 from .models import LazyEventPartialState, LogbookConfig
 
 CONFIG_SCHEMA = vol.Schema(
@@ -137,7 +138,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         EventType[Any] | str,
         tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]],
     ] = {}
-    hass.data[DOMAIN] = LogbookConfig(external_events, filters, entities_filter)
+    context_origins = ContextOriginIndex(hass)
+    context_origins.async_setup()
+    hass.data[DOMAIN] = LogbookConfig(
+        external_events, filters, entities_filter, context_origins
+    )
     websocket_api.async_setup(hass)
     rest_api.async_setup(hass, config, filters, entities_filter)
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
@@ -160,6 +165,8 @@ def _process_logbook_platform(hass: HomeAssistant, domain: str, platform: Any) -
         describe_callback: Callable[[LazyEventPartialState], dict[str, Any]],
     ) -> None:
         """Teach logbook how to describe a new event."""
+        if event_name not in external_events and logbook_config.context_origins:
+            logbook_config.context_origins.async_track_event_type(event_name)
         external_events[event_name] = (domain, describe_callback)
 
     platform.async_describe_events(hass, _async_describe_event)
@@ -5,12 +5,15 @@ from __future__ import annotations
 from collections.abc import Callable, Mapping
 from typing import Any
 
+from lru import LRU
+
 from homeassistant.components.sensor import ATTR_STATE_CLASS
 from homeassistant.const import (
     ATTR_DEVICE_ID,
     ATTR_DOMAIN,
     ATTR_ENTITY_ID,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STOP,
     EVENT_LOGBOOK_ENTRY,
     EVENT_STATE_CHANGED,
 )
@@ -27,9 +30,83 @@ from homeassistant.core import (
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.util.event_type import EventType
+from homeassistant.util.ulid import ulid_to_bytes
 
 from .const import ALWAYS_CONTINUOUS_DOMAINS, AUTOMATION_EVENTS, BUILT_IN_EVENTS, DOMAIN
-from .models import LogbookConfig
+from .models import EventAsRow, LogbookConfig, async_event_to_row
+
+# Number of recent contexts the origin is remembered for
+MAX_CONTEXT_ORIGINS = 4096
+
+
+class ContextOriginIndex:
+    """Remember the event which started each recent context.
+
+    Queries only return rows inside the requested window, so the origin
+    of a context which started before the window is not part of the
+    result. The index keeps the first event seen for the most recent
+    contexts so their origin can still be shown.
+
+    The index is written in the event loop and read from the executor
+    while humanifying query results. Events are only converted to rows
+    when they are read.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._origins: LRU[bytes, Event[Any]] = LRU(MAX_CONTEXT_ORIGINS)
+        self._unsubs: list[CALLBACK_TYPE] = []
+        self._stopped = False
+
+    @callback
+    def async_setup(self) -> None:
+        """Start indexing the built-in events."""
+        for event_type in BUILT_IN_EVENTS:
+            self.async_track_event_type(event_type)
+        self._unsubs.append(
+            self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_add_event,
+                event_filter=_async_has_new_state,
+            )
+        )
+        self._hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop)
+
+    @callback
+    def async_track_event_type(self, event_type: EventType[Any] | str) -> None:
+        """Index events of the given type."""
+        if not self._stopped:
+            self._unsubs.append(
+                self._hass.bus.async_listen(event_type, self._async_add_event)
+            )
+
+    @callback
+    def _async_stop(self, event: Event[Any]) -> None:
+        """Stop indexing events."""
+        self._stopped = True
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+        self._origins.clear()
+
+    @callback
+    def _async_add_event(self, event: Event[Any]) -> None:
+        """Remember the event if it is the first one of its context."""
+        if (context_id_bin := ulid_to_bytes(event.context.id)) not in self._origins:
+            self._origins[context_id_bin] = event
+
+    def get(self, context_id_bin: bytes) -> EventAsRow | None:
+        """Return the origin of the context if it is known."""
+        if (event := self._origins.get(context_id_bin)) is None:
+            return None
+        return async_event_to_row(event)
+
+
+@callback
+def _async_has_new_state(event_data: EventStateChangedData) -> bool:
+    """Return if the state_changed event has a new state."""
+    return event_data["new_state"] is not None
 
 
 def async_filter_entities(hass: HomeAssistant, entity_ids: list[str]) -> list[str]:
@@ -61,7 +61,7 @@ from .const import (
     LOGBOOK_ENTRY_STATE,
     LOGBOOK_ENTRY_WHEN,
 )
-from .helpers import is_sensor_continuous
+from .helpers import ContextOriginIndex, is_sensor_continuous
 from .models import (
     CONTEXT_ID_BIN_POS,
     CONTEXT_ONLY_POS,
@@ -99,6 +99,7 @@ class LogbookRun:
     include_entity_name: bool
     timestamp: bool
     memoize_new_contexts: bool = True
+    context_origins: ContextOriginIndex | None = None
 
 
 class EventProcessor:
@@ -133,8 +134,10 @@ class EventProcessor:
             entity_name_cache=EntityNameCache(self.hass),
             include_entity_name=include_entity_name,
             timestamp=timestamp,
+            context_origins=logbook_config.context_origins,
         )
         self.context_augmenter = ContextAugmenter(self.logbook_run)
+        self.live = False
 
     @property
     def limited_select(self) -> bool:
@@ -149,6 +152,7 @@ class EventProcessor:
         self.logbook_run.event_cache.clear()
         self.logbook_run.context_lookup.clear()
         self.logbook_run.memoize_new_contexts = False
+        self.live = True
 
     def get_events(
         self,
@@ -216,6 +220,7 @@ def _humanify(
     include_entity_name = logbook_run.include_entity_name
     timestamp = logbook_run.timestamp
     memoize_new_contexts = logbook_run.memoize_new_contexts
+    context_origins = logbook_run.context_origins
     get_context = context_augmenter.get_context
     context_id_bin: bytes
     data: dict[str, Any]
@@ -224,7 +229,15 @@ def _humanify(
     for row in rows:
         context_id_bin = row[CONTEXT_ID_BIN_POS]
         if memoize_new_contexts and context_id_bin not in context_lookup:
-            context_lookup[context_id_bin] = row
+            # The context may have started before the first row of the query
+            if (
+                context_origins is not None
+                and (origin_row := context_origins.get(context_id_bin)) is not None
+                and origin_row[TIME_FIRED_TS_POS] < row[TIME_FIRED_TS_POS]
+            ):
+                context_lookup[context_id_bin] = origin_row
+            else:
+                context_lookup[context_id_bin] = row
         if row[CONTEXT_ONLY_POS]:
             continue
         event_type = row[EVENT_TYPE_POS]
@@ -320,6 +333,7 @@ class ContextAugmenter:
         self.external_events = logbook_run.external_events
         self.event_cache = logbook_run.event_cache
         self.include_entity_name = logbook_run.include_entity_name
+        self.context_origins = logbook_run.context_origins
 
     def get_context(
         self, context_id_bin: bytes | None, row: Row | EventAsRow | None
@@ -335,6 +349,8 @@ class ContextAugmenter:
             and (origin_event := context.origin_event) is not None
         ):
             return async_event_to_row(origin_event)
+        if context_id_bin is not None and self.context_origins is not None:
+            return self.context_origins.get(context_id_bin)
         return None
 
     def augment(self, data: dict[str, Any], context_row: Row | EventAsRow) -> None:
@@ -9,6 +9,7 @@ from datetime import datetime as dt, timedelta
 import logging
 from typing import Any
 
+from lru import LRU
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
@@ -20,6 +21,7 @@ from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.hass_dict import HassKey
 
 from .const import DOMAIN
 from .helpers import (
@@ -39,6 +41,8 @@ BIG_QUERY_RECENT_HOURS = 24
 
 _LOGGER = logging.getLogger(__name__)
 
+DATA_LIVE_HUB: HassKey[LogbookLiveHub] = HassKey(f"{DOMAIN}_live_hub")
+
 
 @dataclass(slots=True)
 class LogbookLiveStream:
@@ -51,6 +55,61 @@ class LogbookLiveStream:
     wait_sync_task: asyncio.Task | None = None
 
 
+class LogbookLiveHub:
+    """Humanify live events once for all logbook streams.
+
+    Once a stream is live its logbook entries only depend on the event,
+    so every stream receiving an event gets the same entry. The entries
+    are serialized once and shared between the streams.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self._event_processor = EventProcessor(
+            hass, (), timestamp=True, include_entity_name=False
+        )
+        self._event_processor.switch_to_live()
+        # Events can wait in the queue of a stream for up to
+        # EVENT_COALESCE_TIME so keep as many entries as a
+        # stream can have pending
+        self._entries: LRU[Event, bytes | None] = LRU(MAX_PENDING_LOGBOOK_EVENTS)
+
+    @callback
+    def async_get_entries(self, events: list[Event]) -> list[bytes]:
+        """Return the serialized logbook entries for the events."""
+        entries = self._entries
+        serialized_entries: list[bytes] = []
+        humanified = False
+        entry: bytes | None
+        for event in events:
+            if event in entries:
+                entry = entries[event]
+            else:
+                humanified = True
+                if logbook_events := self._event_processor.humanify(
+                    async_event_to_row(e) for e in (event,)
+                ):
+                    entry = json_bytes(logbook_events[0])
+                else:
+                    entry = None
+                entries[event] = entry
+            if entry is not None:
+                serialized_entries.append(entry)
+        if humanified:
+            # The processor lives as long as the hub, the events
+            # are only needed while they are humanified
+            self._event_processor.logbook_run.event_cache.clear()
+        return serialized_entries
+
+
+@callback
+def _async_get_live_hub(hass: HomeAssistant) -> LogbookLiveHub:
+    """Return the live hub, creating it on first use."""
+    if (live_hub := hass.data.get(DATA_LIVE_HUB)) is None:
+        live_hub = hass.data[DATA_LIVE_HUB] = LogbookLiveHub(hass)
+    return live_hub
+
+
 @callback
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the logbook websocket API."""
@@ -213,6 +272,7 @@ async def _async_events_consumer(
     msg_id: int,
     stream_queue: asyncio.Queue[Event],
     event_processor: EventProcessor,
+    live_hub: LogbookLiveHub,
 ) -> None:
     """Stream events from the queue."""
     subscriptions_setup_complete_timestamp = (
@@ -232,16 +292,27 @@ async def _async_events_consumer(
         while not stream_queue.empty():
             events.append(stream_queue.get_nowait())
 
-        if logbook_events := event_processor.humanify(
-            async_event_to_row(e) for e in events
-        ):
-            connection.send_message(
-                json_bytes(
-                    messages.event_message(
-                        msg_id,
-                        {"events": logbook_events},
+        if not event_processor.live:
+            # Until the stream is live, contexts are looked
+            # up from the historical events it has seen
+            if logbook_events := event_processor.humanify(
+                async_event_to_row(e) for e in events
+            ):
+                connection.send_message(
+                    json_bytes(
+                        messages.event_message(
+                            msg_id,
+                            {"events": logbook_events},
+                        )
                     )
                 )
+            continue
+
+        if entries := live_hub.async_get_entries(events):
+            connection.send_message(
+                messages.construct_event_message(
+                    msg_id, b"".join((b'{"events":[', b",".join(entries), b"]}"))
+                )
             )
 
 
@@ -397,6 +468,7 @@ async def ws_event_stream(
             msg_id,
             stream_queue,
             event_processor,
+            _async_get_live_hub(hass),
         )
     )
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
+from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable, Iterator
 import contextlib
 from dataclasses import dataclass
 from functools import lru_cache, partial
@@ -267,12 +267,100 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+class _TopicNode:
+    """A level of the topic filters in a SubscriptionTrie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicNode] = {}
+        self.subscriptions: set[Subscription] = set()
+
+
+class SubscriptionTrie:
+    """Index wildcard subscriptions by the levels of their topic filter.
+
+    Matching a topic only visits the nodes for its levels and the +
+    and # nodes along the way, so the cost depends on the depth of
+    the topic instead of the number of subscriptions.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TopicNode()
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over the subscriptions."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.subscriptions
+            nodes.extend(node.children.values())
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        node.subscriptions.add(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription.
+
+        Raises KeyError if the subscription was not added.
+        """
+        levels = subscription.topic.split("/")
+        path = [self._root]
+        for level in levels:
+            path.append(path[-1].children[level])
+        path[-1].subscriptions.remove(subscription)
+        # Prune the levels which are no longer used
+        while len(path) > 1 and not path[-1].subscriptions and not path[-1].children:
+            path.pop()
+            del path[-1].children[levels[len(path) - 1]]
+
+    def has_topic_filter(self, topic_filter: str) -> bool:
+        """Return if there is a subscription to a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions with a topic filter matching topic."""
+        levels = topic.split("/")
+        depth = len(levels)
+        # Wildcards at the first level do not match topics starting with $
+        first_level_wildcards = not topic.startswith("$")
+        subscriptions: list[Subscription] = []
+        nodes: list[tuple[_TopicNode, int]] = [(self._root, 0)]
+        while nodes:
+            node, index = nodes.pop()
+            children = node.children
+            wildcards = index or first_level_wildcards
+            # A # also matches the parent level
+            if wildcards and (multi_level := children.get("#")) is not None:
+                subscriptions.extend(multi_level.subscriptions)
+            if index == depth:
+                subscriptions.extend(node.subscriptions)
+                continue
+            if (child := children.get(levels[index])) is not None:
+                nodes.append((child, index + 1))
+            if wildcards and (single_level := children.get("+")) is not None:
+                nodes.append((single_level, index + 1))
+        return subscriptions
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -376,7 +464,7 @@ class MQTT:
         self._simple_subscriptions: defaultdict[str, set[Subscription]] = defaultdict(
             set
         )
-        self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_subscriptions = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -624,8 +712,9 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions
+            or self._wildcard_subscriptions.has_topic_filter(topic)
         )
 
     async def async_publish(
@@ -835,9 +924,7 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
-
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -1049,13 +1136,7 @@ class MQTT:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        subscriptions.extend(self._wildcard_subscriptions.match(topic))
         return subscriptions
 
     @callback
@@ -1086,6 +1167,9 @@ class MQTT:
         )
         subscriptions = self._matching_subscriptions(topic)
         msg_cache_by_subscription_topic: dict[str, ReceiveMessage] = {}
+        payload_by_encoding: dict[str, SubscribePayloadType] = {}
+        render_cache = self._mqtt_data.render_cache
+        render_cache.async_start()
 
         for subscription in subscriptions:
             if msg.retain:
@@ -1097,9 +1181,14 @@ class MQTT:
                 self._retained_topics[subscription].add(topic)
 
             payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
+            if (encoding := subscription.encoding) is not None:
                 try:
-                    payload = msg.payload.decode(subscription.encoding)
+                    # Decode once so subscribers share the same payload
+                    if (decoded := payload_by_encoding.get(encoding)) is None:
+                        decoded = payload_by_encoding[encoding] = msg.payload.decode(
+                            encoding
+                        )
+                    payload = decoded
                 except (AttributeError, UnicodeDecodeError):
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
@@ -1138,6 +1227,7 @@ class MQTT:
                     )
             else:
                 self.hass.async_run_hass_job(job, receive_msg)
+        render_cache.async_clear()
         self._mqtt_data.state_write_requests.process_write_state_requests(msg)
 
     @callback
@@ -1247,13 +1337,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections import deque
+from collections import defaultdict, deque
 import functools
 from itertools import chain
 import logging
@@ -20,7 +20,7 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
-from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
+from homeassistant.helpers.service_info.mqtt import MqttServiceInfo, ReceivePayloadType
 from homeassistant.helpers.typing import DiscoveryInfoType
 from homeassistant.loader import async_get_mqtt
 from homeassistant.util.json import json_loads_object
@@ -56,7 +56,8 @@ TOPIC_MATCHER = re.compile(
 MQTT_DISCOVERY_UPDATED: SignalTypeFormat[MQTTDiscoveryPayload] = SignalTypeFormat(
     "mqtt_discovery_updated_{}_{}"
 )
-MQTT_DISCOVERY_NEW: SignalTypeFormat[MQTTDiscoveryPayload] = SignalTypeFormat(
+# The payloads of the new items of a component which were discovered together
+MQTT_DISCOVERY_NEW: SignalTypeFormat[list[MQTTDiscoveryPayload]] = SignalTypeFormat(
     "mqtt_discovery_new_{}_{}"
 )
 MQTT_DISCOVERY_DONE: SignalTypeFormat[Any] = SignalTypeFormat(
@@ -65,6 +66,8 @@ MQTT_DISCOVERY_DONE: SignalTypeFormat[Any] = SignalTypeFormat(
 
 TOPIC_BASE = "~"
 
+_SENTINEL = object()
+
 
 class MQTTDiscoveryPayload(dict[str, Any]):
     """Class to hold and MQTT discovery payload and discovery data."""
@@ -192,21 +195,27 @@ async def async_start(  # noqa: C901
     """Start MQTT Discovery."""
     mqtt_data = hass.data[DATA_MQTT]
     platform_setup_lock: dict[str, asyncio.Lock] = {}
+    # The received messages which were not processed yet
+    pending_messages: list[tuple[tuple[str, str], str, ReceiveMessage]] = []
+    # The payload of the last pending message by discovery hash
+    pending_payloads: dict[tuple[str, str], ReceivePayloadType] = {}
 
     @callback
-    def _async_add_component(discovery_payload: MQTTDiscoveryPayload) -> None:
-        """Add a component from a discovery message."""
-        discovery_hash = discovery_payload.discovery_data[ATTR_DISCOVERY_HASH]
-        component, discovery_id = discovery_hash
-        message = f"Found new component: {component} {discovery_id}"
-        async_log_discovery_origin_info(message, discovery_payload)
-        mqtt_data.discovery_already_discovered.add(discovery_hash)
+    def _async_add_components(
+        component: str, discovery_payloads: list[MQTTDiscoveryPayload]
+    ) -> None:
+        """Add the items of a component from discovery messages."""
+        for discovery_payload in discovery_payloads:
+            discovery_hash = discovery_payload.discovery_data[ATTR_DISCOVERY_HASH]
+            message = f"Found new component: {component} {discovery_hash[1]}"
+            async_log_discovery_origin_info(message, discovery_payload)
+            mqtt_data.discovery_already_discovered.add(discovery_hash)
         async_dispatcher_send(
-            hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), discovery_payload
+            hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), discovery_payloads
         )
 
     async def _async_component_setup(
-        component: str, discovery_payload: MQTTDiscoveryPayload
+        component: str, discovery_payloads: list[MQTTDiscoveryPayload]
     ) -> None:
         """Perform component set up."""
         async with platform_setup_lock.setdefault(component, asyncio.Lock()):
@@ -214,13 +223,19 @@ async def async_start(  # noqa: C901
                 await async_forward_entry_setup_and_setup_discovery(
                     hass, config_entry, {component}
                 )
-        _async_add_component(discovery_payload)
+        _async_add_components(component, discovery_payloads)
 
     @callback
-    def async_discovery_message_received(msg: ReceiveMessage) -> None:  # noqa: C901
-        """Process the received message."""
+    def async_discovery_message_received(msg: ReceiveMessage) -> None:
+        """Queue the received message.
+
+        The broker sends all retained discovery messages at once when
+        we subscribe or it restarts. The messages received in one loop
+        iteration are processed together so the new items of a platform
+        are added at once. A message which repeats the pending payload
+        of the same item is dropped.
+        """
         mqtt_data.last_discovery = msg.timestamp
-        payload = msg.payload
         topic = msg.topic
         topic_trimmed = topic.replace(f"{discovery_topic}/", "", 1)
 
@@ -238,6 +253,52 @@ async def async_start(  # noqa: C901
             return
 
         component, node_id, object_id = match.groups()
+        # If present, the node_id will be included in the discovered object id
+        discovery_id = f"{node_id} {object_id}" if node_id else object_id
+        discovery_hash = (component, discovery_id)
+        if pending_payloads.get(discovery_hash, _SENTINEL) == msg.payload:
+            _LOGGER.debug(
+                "Component has already been discovered: %s %s, skipping duplicate",
+                component,
+                discovery_id,
+            )
+            return
+        if not pending_messages:
+            hass.loop.call_soon(_async_process_discovery_messages)
+        pending_messages.append((discovery_hash, object_id, msg))
+        pending_payloads[discovery_hash] = msg.payload
+
+    @callback
+    def _async_process_discovery_messages() -> None:
+        """Process the queued messages."""
+        messages = pending_messages.copy()
+        pending_messages.clear()
+        pending_payloads.clear()
+        new_payloads: defaultdict[str, list[MQTTDiscoveryPayload]] = defaultdict(list)
+        for discovery_hash, object_id, msg in messages:
+            _async_process_discovery_message(
+                discovery_hash, object_id, msg, new_payloads
+            )
+        for component, discovery_payloads in new_payloads.items():
+            if component in mqtt_data.platforms_loaded:
+                _async_add_components(component, discovery_payloads)
+            else:
+                # Load component first
+                config_entry.async_create_task(
+                    hass, _async_component_setup(component, discovery_payloads)
+                )
+
+    @callback
+    def _async_process_discovery_message(
+        discovery_hash: tuple[str, str],
+        object_id: str,
+        msg: ReceiveMessage,
+        new_payloads: defaultdict[str, list[MQTTDiscoveryPayload]],
+    ) -> None:
+        """Process a received message."""
+        payload = msg.payload
+        topic = msg.topic
+        component, discovery_id = discovery_hash
 
         if payload:
             try:
@@ -253,10 +314,6 @@ async def async_start(  # noqa: C901
         else:
             discovery_payload = MQTTDiscoveryPayload({})
 
-        # If present, the node_id will be included in the discovered object id
-        discovery_id = f"{node_id} {object_id}" if node_id else object_id
-        discovery_hash = (component, discovery_id)
-
         if discovery_payload:
             # Attach MQTT topic to the payload, used for debug prints
             setattr(
@@ -283,13 +340,22 @@ async def async_start(  # noqa: C901
             )
             return
 
-        async_process_discovery_payload(component, discovery_id, discovery_payload)
+        async_process_discovery_payload(
+            component, discovery_id, discovery_payload, new_payloads
+        )
 
     @callback
     def async_process_discovery_payload(
-        component: str, discovery_id: str, payload: MQTTDiscoveryPayload
+        component: str,
+        discovery_id: str,
+        payload: MQTTDiscoveryPayload,
+        new_payloads: defaultdict[str, list[MQTTDiscoveryPayload]] | None = None,
     ) -> None:
-        """Process the payload of a new discovery."""
+        """Process the payload of a new discovery.
+
+        New items are added to new_payloads if it is passed,
+        otherwise they are added right away.
+        """
 
         _LOGGER.debug("Process discovery payload %s", payload)
         discovery_hash = (component, discovery_id)
@@ -321,9 +387,12 @@ async def async_start(  # noqa: C901
             }
 
         if component not in mqtt_data.platforms_loaded and payload:
+            if new_payloads is not None:
+                new_payloads[component].append(payload)
+                return
             # Load component first
             config_entry.async_create_task(
-                hass, _async_component_setup(component, payload)
+                hass, _async_component_setup(component, [payload])
             )
         elif already_discovered:
             # Dispatch update
@@ -333,7 +402,10 @@ async def async_start(  # noqa: C901
                 hass, MQTT_DISCOVERY_UPDATED.format(*discovery_hash), payload
             )
         elif payload:
-            _async_add_component(payload)
+            if new_payloads is not None:
+                new_payloads[component].append(payload)
+                return
+            _async_add_components(component, [payload])
         else:
             # Unhandled discovery message
             async_dispatcher_send(
@@ -231,14 +231,26 @@ def async_setup_non_entity_entry_helper(
             _handle_discovery_failure(hass, discovery_payload)
             async_handle_schema_error(discovery_payload, err)
         except Exception:
+            # Do not let one broken payload fail the others
             _handle_discovery_failure(hass, discovery_payload)
-            raise
+            _LOGGER.exception(
+                "Unexpected error setting up discovered MQTT %s, payload %s",
+                domain,
+                discovery_payload,
+            )
+
+    async def _async_setup_non_entity_entries_from_discovery(
+        discovery_payloads: list[MQTTDiscoveryPayload],
+    ) -> None:
+        """Set up MQTT automations or tags from discovery."""
+        for discovery_payload in discovery_payloads:
+            await _async_setup_non_entity_entry_from_discovery(discovery_payload)
 
     mqtt_data.reload_dispatchers.append(
         async_dispatcher_connect(
             hass,
             MQTT_DISCOVERY_NEW.format(domain, "mqtt"),
-            _async_setup_non_entity_entry_from_discovery,
+            _async_setup_non_entity_entries_from_discovery,
         )
     )
 
@@ -258,36 +270,45 @@ def async_setup_entity_entry_helper(
     mqtt_data = hass.data[DATA_MQTT]
 
     @callback
-    def _async_setup_entity_entry_from_discovery(
-        discovery_payload: MQTTDiscoveryPayload,
+    def _async_setup_entity_entries_from_discovery(
+        discovery_payloads: list[MQTTDiscoveryPayload],
     ) -> None:
-        """Set up an MQTT entity from discovery."""
+        """Set up MQTT entities from discovery and add them at once."""
         nonlocal entity_class
-        if not _verify_mqtt_config_entry_enabled_for_discovery(
-            hass, domain, discovery_payload
-        ):
-            return
-        try:
-            config: DiscoveryInfoType = discovery_schema(discovery_payload)
-            if schema_class_mapping is not None:
-                entity_class = schema_class_mapping[config[CONF_SCHEMA]]
-            if TYPE_CHECKING:
-                assert entity_class is not None
-            async_add_entities(
-                [entity_class(hass, config, entry, discovery_payload.discovery_data)]
-            )
-        except vol.Invalid as err:
-            _handle_discovery_failure(hass, discovery_payload)
-            async_handle_schema_error(discovery_payload, err)
-        except Exception:
-            _handle_discovery_failure(hass, discovery_payload)
-            raise
+        entities: list[Entity] = []
+        for discovery_payload in discovery_payloads:
+            if not _verify_mqtt_config_entry_enabled_for_discovery(
+                hass, domain, discovery_payload
+            ):
+                continue
+            try:
+                config: DiscoveryInfoType = discovery_schema(discovery_payload)
+                if schema_class_mapping is not None:
+                    entity_class = schema_class_mapping[config[CONF_SCHEMA]]
+                if TYPE_CHECKING:
+                    assert entity_class is not None
+                entities.append(
+                    entity_class(hass, config, entry, discovery_payload.discovery_data)
+                )
+            except vol.Invalid as err:
+                _handle_discovery_failure(hass, discovery_payload)
+                async_handle_schema_error(discovery_payload, err)
+            except Exception:
+                # Do not let one broken payload fail the others
+                _handle_discovery_failure(hass, discovery_payload)
+                _LOGGER.exception(
+                    "Unexpected error setting up discovered MQTT %s, payload %s",
+                    domain,
+                    discovery_payload,
+                )
+        if entities:
+            async_add_entities(entities)
 
     mqtt_data.reload_dispatchers.append(
         async_dispatcher_connect(
             hass,
             MQTT_DISCOVERY_NEW.format(domain, "mqtt"),
-            _async_setup_entity_entry_from_discovery,
+            _async_setup_entity_entries_from_discovery,
         )
     )
 
@@ -9,6 +9,7 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import StrEnum
 import logging
+import re
 from typing import TYPE_CHECKING, Any, TypedDict
 
 from homeassistant.const import ATTR_ENTITY_ID, ATTR_NAME, Platform
@@ -24,6 +25,7 @@ from homeassistant.helpers.typing import (
     VolSchemaType,
 )
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 if TYPE_CHECKING:
     from paho.mqtt.client import MQTTMessage
@@ -48,6 +50,11 @@ _LOGGER = logging.getLogger(__name__)
 
 ATTR_THIS = "this"
 
+# Value templates referencing these variables render differently per entity
+_ENTITY_VARIABLES_RE = re.compile(rf"\b({ATTR_ENTITY_ID}|{ATTR_NAME}|{ATTR_THIS})\b")
+
+_NO_JSON = object()
+
 type PublishPayloadType = str | bytes | int | float | None
 
 
@@ -254,6 +261,49 @@ class MqttValueTemplateException(TemplateError):
         return self._message
 
 
+class MessageRenderCache:
+    """Share work between the callbacks of a received message.
+
+    The client activates the cache while it runs the callbacks of a
+    message. During that time the payload is JSON decoded only once and
+    entity independent value templates are only rendered once for the
+    same payload.
+    """
+
+    __slots__ = ("active", "json_payloads", "renders")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self.active = False
+        self.json_payloads: dict[ReceivePayloadType, Any] = {}
+        self.renders: dict[
+            tuple[str, ReceivePayloadType, bool, Any], ReceivePayloadType
+        ] = {}
+
+    @callback
+    def async_start(self) -> None:
+        """Start caching for a message dispatch."""
+        self.active = True
+
+    @callback
+    def async_clear(self) -> None:
+        """Stop caching and drop the cached results."""
+        self.active = False
+        self.json_payloads.clear()
+        self.renders.clear()
+
+    @callback
+    def async_json_loads(self, payload: ReceivePayloadType) -> Any:
+        """Return the decoded JSON payload or _NO_JSON if it is not valid JSON."""
+        if (value_json := self.json_payloads.get(payload, _NO_JSON)) is _NO_JSON:
+            try:  # noqa: SIM105 - suppress is much slower
+                value_json = json_loads(payload)
+            except JSON_DECODE_EXCEPTIONS:
+                pass
+            self.json_payloads[payload] = value_json
+        return value_json
+
+
 class MqttValueTemplate:
     """Class for rendering MQTT value template with possible json values."""
 
@@ -269,6 +319,24 @@ class MqttValueTemplate:
         self._value_template = value_template
         self._config_attributes = config_attributes
         self._entity = entity
+        self._render_cache: MessageRenderCache | None = None
+        self._entity_independent = False
+
+    @callback
+    def _async_get_render_cache(self) -> MessageRenderCache | None:
+        """Return the render cache if a message is being dispatched."""
+        assert self._value_template is not None
+        if self._render_cache is None:
+            if (hass := self._value_template.hass) is None or (
+                mqtt_data := hass.data.get(DATA_MQTT)
+            ) is None:
+                return None
+            self._render_cache = mqtt_data.render_cache
+            self._entity_independent = (
+                self._config_attributes is None
+                and _ENTITY_VARIABLES_RE.search(self._value_template.template) is None
+            )
+        return self._render_cache if self._render_cache.active else None
 
     @callback
     def async_render_with_possible_json_value(
@@ -283,6 +351,18 @@ class MqttValueTemplate:
         if self._value_template is None:
             return payload
 
+        render_key: tuple[str, ReceivePayloadType, bool, Any] | None = None
+        if (render_cache := self._async_get_render_cache()) is not None:
+            if variables is None and self._entity_independent:
+                render_key = (
+                    self._value_template.template,
+                    payload,
+                    default is PayloadSentinel.NONE,
+                    default,
+                )
+                if render_key in render_cache.renders:
+                    return render_cache.renders[render_key]
+
         values: dict[str, Any] = {}
 
         if variables is not None:
@@ -300,6 +380,11 @@ class MqttValueTemplate:
                 )
             values[ATTR_THIS] = self._template_state
 
+        if render_cache is not None and (
+            (value_json := render_cache.async_json_loads(payload)) is not _NO_JSON
+        ):
+            values["value_json"] = value_json
+
         if default is PayloadSentinel.NONE:
             _LOGGER.debug(
                 "Rendering incoming payload '%s' with variables %s and %s",
@@ -310,7 +395,7 @@ class MqttValueTemplate:
             try:
                 rendered_payload = (
                     self._value_template.async_render_with_possible_json_value(
-                        payload, variables=values
+                        payload, variables=values, parse_json=render_cache is None
                     )
                 )
             except TEMPLATE_ERRORS as exc:
@@ -321,32 +406,38 @@ class MqttValueTemplate:
                     payload=payload,
                     entity_id=self._entity.entity_id if self._entity else None,
                 ) from exc
-            return rendered_payload
-
-        _LOGGER.debug(
-            (
-                "Rendering incoming payload '%s' with variables %s with default value"
-                " '%s' and %s"
-            ),
-            payload,
-            values,
-            default,
-            self._value_template,
-        )
-        try:
-            rendered_payload = (
-                self._value_template.async_render_with_possible_json_value(
-                    payload, default, variables=values
-                )
+        else:
+            _LOGGER.debug(
+                (
+                    "Rendering incoming payload '%s' with variables %s with default"
+                    " value '%s' and %s"
+                ),
+                payload,
+                values,
+                default,
+                self._value_template,
             )
-        except TEMPLATE_ERRORS as exc:
-            raise MqttValueTemplateException(
-                base_exception=exc,
-                value_template=self._value_template.template,
-                default=default,
-                payload=payload,
-                entity_id=self._entity.entity_id if self._entity else None,
-            ) from exc
+            try:
+                rendered_payload = (
+                    self._value_template.async_render_with_possible_json_value(
+                        payload,
+                        default,
+                        variables=values,
+                        parse_json=render_cache is None,
+                    )
+                )
+            except TEMPLATE_ERRORS as exc:
+                raise MqttValueTemplateException(
+                    base_exception=exc,
+                    value_template=self._value_template.template,
+                    default=default,
+                    payload=payload,
+                    entity_id=self._entity.entity_id if self._entity else None,
+                ) from exc
+
+        if render_key is not None:
+            assert render_cache is not None
+            render_cache.renders[render_key] = rendered_payload
         return rendered_payload
 
 
@@ -405,6 +496,7 @@ class MqttData:
     reload_dispatchers: list[CALLBACK_TYPE] = field(default_factory=list)
     reload_handlers: dict[str, CALLBACK_TYPE] = field(default_factory=dict)
     reload_schema: dict[str, VolSchemaType] = field(default_factory=dict)
+    render_cache: MessageRenderCache = field(default_factory=MessageRenderCache)
     state_write_requests: EntityTopicState = field(default_factory=EntityTopicState)
     subscriptions_to_restore: set[Subscription] = field(default_factory=set)
     tags: dict[str, dict[str, MQTTTagScanner]] = field(default_factory=dict)
@@ -0,0 +1,455 @@
+"""Recorder queue that spills events to disk when the backlog is too large."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Generator
+import logging
+import mmap
+import os
+import queue
+import struct
+import threading
+from typing import TYPE_CHECKING, Any, cast
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, HomeAssistant, State
+from homeassistant.helpers.json import json_bytes
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS, json_loads
+from homeassistant.util.ulid import ulid_now
+
+from .tasks import ProcessSpilledEventsTask, RecorderTask
+
+if TYPE_CHECKING:
+    from homeassistant.helpers.entity import StateInfo
+
+_LOGGER = logging.getLogger(__name__)
+
+SEGMENT_SIZE = 32 * 1024**2
+SEGMENT_SUFFIX = ".seg"
+
+PROCESS_SPILLED_EVENTS_TASK = ProcessSpilledEventsTask()
+
+# Each record is prefixed with its length
+_RECORD_HEADER = struct.Struct("<I")
+
+# event_type, origin, time_fired_timestamp, context id, user_id, parent_id, data
+type _EventRecord = tuple[str, str, float, str, str | None, str | None, Any]
+
+
+class SpillSegment:
+    """An append-only memory-mapped file of serialized events.
+
+    The file is allocated at its full size when it is created so that
+    appending a record only copies bytes into the mapping and never
+    does blocking I/O.
+    """
+
+    __slots__ = ("path", "size", "write_pos", "read_pos", "_mmap")
+
+    def __init__(self, path: str, size: int) -> None:
+        """Create the segment file and map it into memory.
+
+        This call does blocking I/O.
+        """
+        self.path = path
+        self.size = size
+        self.write_pos = 0
+        self.read_pos = 0
+        with open(path, "w+b") as file:
+            file.truncate(size)
+            self._mmap = mmap.mmap(file.fileno(), size)
+
+    @property
+    def exhausted(self) -> bool:
+        """Return if all written records have been read."""
+        return self.read_pos == self.write_pos
+
+    def append(self, record: bytes) -> bool:
+        """Append a record and return False if it does not fit."""
+        start = self.write_pos + _RECORD_HEADER.size
+        end = start + len(record)
+        if end > self.size:
+            return False
+        _RECORD_HEADER.pack_into(self._mmap, self.write_pos, len(record))
+        self._mmap[start:end] = record
+        self.write_pos = end
+        return True
+
+    def read(self) -> bytes:
+        """Read the next record.
+
+        The caller must check that the segment is not exhausted.
+        """
+        (length,) = _RECORD_HEADER.unpack_from(self._mmap, self.read_pos)
+        start = self.read_pos + _RECORD_HEADER.size
+        self.read_pos = start + length
+        return self._mmap[start : self.read_pos]
+
+    def close(self) -> None:
+        """Unmap and remove the segment file.
+
+        This call does blocking I/O.
+        """
+        self._mmap.close()
+        try:
+            os.unlink(self.path)
+        except OSError as err:
+            _LOGGER.warning(
+                "Could not remove recorder spill file %s: %s", self.path, err
+            )
+
+
+class RecorderQueue:
+    """Queue of tasks and events for the recorder thread.
+
+    Works like a SimpleQueue until max_in_memory items are queued. After
+    that events are serialized into memory-mapped segment files under
+    spill_dir instead and a single ProcessSpilledEventsTask marks their
+    position in the queue. When the recorder thread reaches the marker
+    it replays the spilled events in order until the spill is empty.
+
+    Tasks are never spilled. If the spill cannot hold any more events
+    they are kept in memory behind the marker so the order is preserved.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        spill_dir: str,
+        max_in_memory: int,
+        max_spill_bytes: int,
+    ) -> None:
+        """Initialize the queue."""
+        self._hass = hass
+        self._spill_dir = spill_dir
+        self._max_in_memory = max_in_memory
+        self._max_spill_bytes = max_spill_bytes
+        self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        # Only set from the event loop, cleared from the recorder thread
+        self._spilling = False
+        self._spill_full = False
+        self._segments: deque[SpillSegment] = deque()
+        # Records waiting for a segment to be created in the executor
+        self._unwritten: deque[bytes] = deque()
+        self._opening_segment = False
+        self._spilled_count = 0
+        self._spill_run_id = ulid_now()
+        self._segment_count = 0
+        self._did_remove_stale = False
+        self._closed = False
+        self.get = self._queue.get
+        self.get_nowait = self._queue.get_nowait
+
+    @property
+    def spilling(self) -> bool:
+        """Return if events are currently being spilled to disk."""
+        return self._spilling and not self._spill_full
+
+    def qsize(self) -> int:
+        """Return the number of queued items including spilled events."""
+        return self._queue.qsize() + self._spilled_count
+
+    def empty(self) -> bool:
+        """Return if nothing is queued in memory.
+
+        Spilled events are only reachable through the marker task
+        so they do not count here.
+        """
+        return self._queue.empty()
+
+    def put(self, item: RecorderTask | Event) -> None:
+        """Add a task or event to the queue."""
+        # Event is never subclassed so we can use a fast type check
+        if type(item) is not Event or (
+            not self._spilling and self._queue.qsize() < self._max_in_memory
+        ):
+            self._queue.put(item)
+            return
+        self._spill(item)
+
+    put_nowait = put
+
+    def _spill(self, event: Event) -> None:
+        """Spill an event to disk or keep it in memory if the spill is full."""
+        with self._lock:
+            if not self._spilling:
+                self._spilling = True
+                self._spill_full = False
+                self._queue.put(PROCESS_SPILLED_EVENTS_TASK)
+                _LOGGER.warning(
+                    "The recorder backlog reached %s events; events will be "
+                    "stored in %s until the database catches up",
+                    self._max_in_memory,
+                    self._spill_dir,
+                )
+            if self._spill_full:
+                self._queue.put(event)
+                return
+            try:
+                record = _event_to_record(event)
+            except JSON_ENCODE_EXCEPTIONS as err:
+                _LOGGER.warning("Event is not JSON serializable: %s: %s", event, err)
+                return
+            self._spilled_count += 1
+            if (
+                not self._unwritten
+                and self._segments
+                and self._segments[-1].append(record)
+            ):
+                return
+            self._unwritten.append(record)
+            if not self._opening_segment and (
+                next_segment := self._next_segment_locked()
+            ):
+                self._opening_segment = True
+                self._hass.async_add_executor_job(self._open_segments, *next_segment)
+
+    def _next_segment_locked(self) -> tuple[str, int] | None:
+        """Return the path and size of the next segment if the spill has room.
+
+        Must be called with the lock held.
+        """
+        available = self._max_spill_bytes - sum(
+            segment.size for segment in self._segments
+        )
+        needed = len(self._unwritten[0]) + _RECORD_HEADER.size
+        size = max(min(SEGMENT_SIZE, available), needed)
+        if self._closed or size > available:
+            _LOGGER.error(
+                "The recorder backlog spill reached the maximum size of %s bytes; "
+                "events will be kept in memory until the database catches up",
+                self._max_spill_bytes,
+            )
+            self._spill_full = True
+            return None
+        self._segment_count += 1
+        path = os.path.join(
+            self._spill_dir,
+            f"{self._spill_run_id}.{self._segment_count}{SEGMENT_SUFFIX}",
+        )
+        return path, size
+
+    def _open_segments(self, path: str, size: int) -> None:
+        """Create segments until all unwritten records have been written.
+
+        This call does blocking I/O.
+        """
+        next_segment: tuple[str, int] | None = (path, size)
+        while next_segment:
+            path, size = next_segment
+            try:
+                if not self._did_remove_stale:
+                    self._remove_stale_segments()
+                segment = SpillSegment(path, size)
+            except OSError as err:
+                _LOGGER.error(
+                    "Could not create recorder spill file %s: %s; events will be "
+                    "kept in memory until the database catches up",
+                    path,
+                    err,
+                )
+                with self._lock:
+                    self._opening_segment = False
+                    self._spill_full = True
+                return
+            with self._lock:
+                if closed := self._closed:
+                    self._opening_segment = False
+                else:
+                    self._segments.append(segment)
+                    unwritten = self._unwritten
+                    while unwritten and segment.append(unwritten[0]):
+                        unwritten.popleft()
+                    next_segment = None
+                    if unwritten:
+                        next_segment = self._next_segment_locked()
+                    if not next_segment:
+                        self._opening_segment = False
+            if closed:
+                # The queue was closed while the file was being created
+                segment.close()
+                return
+
+    def _remove_stale_segments(self) -> None:
+        """Create the spill directory and remove segments left by a previous run.
+
+        This call does blocking I/O.
+        """
+        os.makedirs(self._spill_dir, exist_ok=True)
+        for entry in os.scandir(self._spill_dir):
+            if entry.name.endswith(SEGMENT_SUFFIX) and not entry.name.startswith(
+                self._spill_run_id
+            ):
+                _LOGGER.debug("Removing stale recorder spill file %s", entry.path)
+                os.unlink(entry.path)
+        self._did_remove_stale = True
+
+    def iter_spilled(self) -> Generator[Event]:
+        """Yield the spilled events in order until the spill is empty.
+
+        This call does blocking I/O and must be called from the
+        recorder thread.
+        """
+        while True:
+            finished: SpillSegment | None = None
+            record: bytes | None = None
+            with self._lock:
+                segments = self._segments
+                if segments and not segments[0].exhausted:
+                    record = segments[0].read()
+                elif len(segments) > 1:
+                    # Writing has moved on to the next segment
+                    finished = segments.popleft()
+                elif self._unwritten:
+                    record = self._unwritten.popleft()
+                else:
+                    # Everything has been replayed so new events
+                    # can go to the in-memory queue again
+                    self._spilling = False
+                    self._spill_full = False
+                    if segments:
+                        finished = segments.popleft()
+                if record is not None:
+                    self._spilled_count -= 1
+            if finished is not None:
+                finished.close()
+            if record is not None:
+                yield _event_from_record(record)
+            elif not self._spilling:
+                return
+
+    def clear(self) -> None:
+        """Discard everything in the queue.
+
+        The segment files are removed when the queue is closed.
+        """
+        with self._lock:
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            for segment in self._segments:
+                segment.read_pos = segment.write_pos
+            self._unwritten.clear()
+            self._spilled_count = 0
+            self._spilling = False
+            self._spill_full = False
+
+    def close(self) -> None:
+        """Remove all segment files.
+
+        This call does blocking I/O and must be called from the
+        recorder thread.
+        """
+        with self._lock:
+            segments = list(self._segments)
+            self._segments.clear()
+            self._closed = True
+        for segment in segments:
+            segment.close()
+
+
+def _state_to_list(state: State | None) -> list[Any] | None:
+    """Convert a state to a compact list."""
+    if state is None:
+        return None
+    context = state.context
+    return [
+        state.state,
+        state.attributes,
+        state.last_changed_timestamp,
+        state.last_reported_timestamp,
+        state.last_updated_timestamp,
+        context.id,
+        context.user_id,
+        context.parent_id,
+        list(state_info["unrecorded_attributes"])
+        if (state_info := state.state_info)
+        else None,
+    ]
+
+
+def _state_from_list(entity_id: str, data: list[Any] | None) -> State | None:
+    """Convert a compact list back to a state."""
+    if data is None:
+        return None
+    (
+        state,
+        attributes,
+        last_changed_ts,
+        last_reported_ts,
+        last_updated_ts,
+        context_id,
+        user_id,
+        parent_id,
+        unrecorded_attributes,
+    ) = data
+    state_info: StateInfo | None = None
+    if unrecorded_attributes is not None:
+        state_info = {"unrecorded_attributes": frozenset(unrecorded_attributes)}
+    return State(
+        entity_id,
+        state,
+        attributes,
+        last_changed=dt_util.utc_from_timestamp(last_changed_ts),
+        last_reported=dt_util.utc_from_timestamp(last_reported_ts),
+        last_updated=dt_util.utc_from_timestamp(last_updated_ts),
+        context=Context(user_id, parent_id, context_id),
+        validate_entity_id=False,
+        state_info=state_info,
+        last_updated_timestamp=last_updated_ts,
+    )
+
+
+def _event_to_record(event: Event) -> bytes:
+    """Serialize an event to bytes."""
+    data: Any = event.data
+    if event.event_type == EVENT_STATE_CHANGED:
+        data = [
+            data["entity_id"],
+            _state_to_list(data["old_state"]),
+            _state_to_list(data["new_state"]),
+        ]
+    context = event.context
+    return json_bytes(
+        [
+            event.event_type,
+            event.origin.value,
+            event.time_fired_timestamp,
+            context.id,
+            context.user_id,
+            context.parent_id,
+            data,
+        ]
+    )
+
+
+def _event_from_record(record: bytes) -> Event:
+    """Deserialize an event from bytes."""
+    (
+        event_type,
+        origin,
+        time_fired_timestamp,
+        context_id,
+        user_id,
+        parent_id,
+        data,
+    ) = cast(_EventRecord, json_loads(record))
+    if event_type == EVENT_STATE_CHANGED:
+        entity_id, old_state, new_state = data
+        data = {
+            "entity_id": entity_id,
+            "old_state": _state_from_list(entity_id, old_state),
+            "new_state": _state_from_list(entity_id, new_state),
+        }
+    return Event(
+        event_type,
+        data,
+        EventOrigin(origin),
+        time_fired_timestamp,
+        Context(user_id, parent_id, context_id),
+    )
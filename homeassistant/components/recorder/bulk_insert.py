@@ -0,0 +1,304 @@
+"""Batched multi-row writer for state_changed events."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import Event, EventStateChangedData
+
+from .db_schema import StateAttributes, States, StatesMeta
+from .models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
+
+if TYPE_CHECKING:
+    from .core import Recorder
+
+
+class StatesBulkWriter:
+    """Buffer states rows and write them with executemany inserts.
+
+    Instead of creating a States object for every state_changed event
+    and relying on the unit of work to flush them, rows are kept as
+    plain parameter dicts until the next commit. At commit time the new
+    states_meta and state_attributes rows are inserted first, followed
+    by the states rows. SQLAlchemy batches each executemany INSERT into
+    multi-row VALUES statements and returns the new ids in parameter order.
+
+    A states row can reference another states row from the same commit
+    interval through old_state_id. Such rows are grouped by their position
+    in the chain for each entity so every batch only references ids that
+    were returned by an earlier batch.
+    """
+
+    def __init__(self, recorder: Recorder) -> None:
+        """Initialize the bulk writer."""
+        self.recorder = recorder
+        # One entry per buffered states row
+        self._rows: list[dict[str, Any]] = []
+        self._old_state_idx: list[int | None] = []
+        self._pending_entity_ids: list[str | None] = []
+        self._pending_shared_attrs: list[str | None] = []
+        self._generations: list[int] = []
+        # Row indexes grouped by their position in the old_state chain
+        self._batches: list[list[int]] = []
+        # entity_id -> index of the most recent row that can be an old state
+        self._last_idx: dict[str, int] = {}
+        # entity_id -> metadata_id once the row has been inserted
+        self._new_states_meta: dict[str, int | None] = {}
+        # shared_attrs -> hash of rows that still need to be inserted
+        self._new_state_attributes: dict[str, int] = {}
+        # shared_attrs -> attributes_id once the row has been inserted
+        self._new_attributes_ids: dict[str, int] = {}
+        self._state_ids: list[int] = []
+
+    @property
+    def has_pending(self) -> bool:
+        """Return if there are rows waiting to be written."""
+        return bool(self._rows)
+
+    def add(self, event: Event[EventStateChangedData], session: Session) -> bool:
+        """Buffer a state_changed event and return if a row was added.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        recorder = self.recorder
+        states_manager = recorder.states_manager
+        states_meta_manager = recorder.states_meta_manager
+        state_attributes_manager = recorder.state_attributes_manager
+        entity_id = event.data["entity_id"]
+        new_state = event.data["new_state"]
+        old_state = event.data["old_state"]
+
+        old_state_id: int | None = None
+        generation = 0
+        if (old_state_idx := self._last_idx.pop(entity_id, None)) is not None:
+            generation = self._generations[old_state_idx] + 1
+            if old_state:
+                self._rows[old_state_idx]["last_reported_ts"] = (
+                    old_state.last_reported_timestamp
+                )
+        elif pending_state := states_manager.pop_pending(entity_id):
+            # The state was added to the session by the ORM path
+            # before the writer was activated, flush to get its id
+            session.flush()
+            old_state_id = pending_state.state_id
+            if old_state:
+                pending_state.last_reported_ts = old_state.last_reported_timestamp
+        elif old_state_id := states_manager.pop_committed(entity_id):
+            if old_state:
+                states_manager.update_pending_last_reported(
+                    old_state_id, old_state.last_reported_timestamp
+                )
+
+        if not (
+            shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
+        ):
+            return False
+
+        # Map the entity_id to the StatesMeta table
+        pending_entity_id: str | None = None
+        metadata_id: int | None = None
+        if entity_id in self._new_states_meta:
+            pending_entity_id = entity_id
+        elif pending_states_meta := states_meta_manager.get_pending(entity_id):
+            session.flush()
+            metadata_id = pending_states_meta.metadata_id
+        elif metadata_id := states_meta_manager.get(entity_id, session, True):
+            pass
+        elif new_state is None:
+            # If the entity was removed, we don't need to add it to the
+            # StatesMeta table if it does not have a metadata_id allocated
+            # to it as it either never existed or was just renamed.
+            return False
+        else:
+            self._new_states_meta[entity_id] = None
+            pending_entity_id = entity_id
+
+        # Map the attributes to the StateAttributes table
+        shared_attrs = shared_attrs_bytes.decode("utf-8")
+        pending_shared_attrs: str | None = None
+        attributes_id: int | None = None
+        if shared_attrs in self._new_state_attributes:
+            pending_shared_attrs = shared_attrs
+        elif pending_attributes := state_attributes_manager.get_pending(shared_attrs):
+            session.flush()
+            attributes_id = pending_attributes.attributes_id
+        elif (
+            attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
+        ) or (
+            (hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
+            and (
+                attributes_id := state_attributes_manager.get(
+                    shared_attrs, hash_, session
+                )
+            )
+        ):
+            pass
+        else:
+            self._new_state_attributes[shared_attrs] = hash_
+            pending_shared_attrs = shared_attrs
+
+        idx = len(self._rows)
+        self._rows.append(
+            _states_row_from_event(event, metadata_id, attributes_id, old_state_id)
+        )
+        self._old_state_idx.append(old_state_idx)
+        self._pending_entity_ids.append(pending_entity_id)
+        self._pending_shared_attrs.append(pending_shared_attrs)
+        self._generations.append(generation)
+        if generation == len(self._batches):
+            self._batches.append([])
+        self._batches[generation].append(idx)
+        if new_state is not None:
+            self._last_idx[entity_id] = idx
+        return True
+
+    def flush(self, session: Session) -> None:
+        """Write all buffered rows to the database.
+
+        The rows are kept until post_commit is called so they can
+        be written again if the commit fails and is retried.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self._rows:
+            return
+        rows = self._rows
+        new_states_meta = self._new_states_meta
+        new_attributes_ids = self._new_attributes_ids
+        with session.no_autoflush:
+            if new_states_meta:
+                entity_ids = list(new_states_meta)
+                metadata_ids = session.execute(
+                    insert(StatesMeta).returning(
+                        StatesMeta.metadata_id, sort_by_parameter_order=True
+                    ),
+                    [{"entity_id": entity_id} for entity_id in entity_ids],
+                ).scalars()
+                new_states_meta.update(zip(entity_ids, metadata_ids, strict=True))
+            if new_state_attributes := self._new_state_attributes:
+                attributes_ids = session.execute(
+                    insert(StateAttributes).returning(
+                        StateAttributes.attributes_id, sort_by_parameter_order=True
+                    ),
+                    [
+                        {"shared_attrs": shared_attrs, "hash": hash_}
+                        for shared_attrs, hash_ in new_state_attributes.items()
+                    ],
+                ).scalars()
+                new_attributes_ids.update(
+                    zip(new_state_attributes, attributes_ids, strict=True)
+                )
+            for idx, row in enumerate(rows):
+                if entity_id := self._pending_entity_ids[idx]:
+                    row["metadata_id"] = new_states_meta[entity_id]
+                if shared_attrs := self._pending_shared_attrs[idx]:
+                    row["attributes_id"] = new_attributes_ids[shared_attrs]
+
+            state_ids = [0] * len(rows)
+            old_state_idx = self._old_state_idx
+            for batch in self._batches:
+                params: list[dict[str, Any]] = []
+                for idx in batch:
+                    row = rows[idx]
+                    if (old_idx := old_state_idx[idx]) is not None:
+                        row["old_state_id"] = state_ids[old_idx]
+                    params.append(row)
+                batch_state_ids = session.execute(
+                    insert(States).returning(
+                        States.state_id, sort_by_parameter_order=True
+                    ),
+                    params,
+                ).scalars()
+                for idx, state_id in zip(batch, batch_state_ids, strict=True):
+                    state_ids[idx] = state_id
+            self._state_ids = state_ids
+
+    def post_commit(self) -> None:
+        """Load the ids of the committed rows into the table managers.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self._rows:
+            return
+        recorder = self.recorder
+        states_manager = recorder.states_manager
+        state_ids = self._state_ids
+        for entity_id, idx in self._last_idx.items():
+            states_manager.add_committed(entity_id, state_ids[idx])
+        states_meta_manager = recorder.states_meta_manager
+        for entity_id, metadata_id in self._new_states_meta.items():
+            assert metadata_id is not None
+            states_meta_manager.add_committed(entity_id, metadata_id)
+        state_attributes_manager = recorder.state_attributes_manager
+        for shared_attrs, attributes_id in self._new_attributes_ids.items():
+            state_attributes_manager.add_committed(shared_attrs, attributes_id)
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all buffered rows.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._rows.clear()
+        self._old_state_idx.clear()
+        self._pending_entity_ids.clear()
+        self._pending_shared_attrs.clear()
+        self._generations.clear()
+        self._batches.clear()
+        self._last_idx.clear()
+        self._new_states_meta.clear()
+        self._new_state_attributes.clear()
+        self._new_attributes_ids.clear()
+        self._state_ids = []
+
+
+def _states_row_from_event(
+    event: Event[EventStateChangedData],
+    metadata_id: int | None,
+    attributes_id: int | None,
+    old_state_id: int | None,
+) -> dict[str, Any]:
+    """Create the insert parameters for a state_changed event.
+
+    This mirrors States.from_event without creating an ORM object. Every
+    row must have the same keys since they are inserted with executemany.
+    """
+    state = event.data["new_state"]
+    # None state means the state was removed from the state machine
+    if state is None:
+        state_value = None
+        last_updated_ts = event.time_fired_timestamp
+        last_changed_ts = None
+        last_reported_ts = None
+    else:
+        state_value = state.state
+        last_updated_ts = state.last_updated_timestamp
+        if state.last_updated == state.last_changed:
+            last_changed_ts = None
+        else:
+            last_changed_ts = state.last_changed_timestamp
+        if state.last_updated == state.last_reported:
+            last_reported_ts = None
+        else:
+            last_reported_ts = state.last_reported_timestamp
+    context = event.context
+    return {
+        "state": state_value,
+        "metadata_id": metadata_id,
+        "attributes_id": attributes_id,
+        "old_state_id": old_state_id,
+        "context_id_bin": ulid_to_bytes_or_none(context.id),
+        "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+        "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+        "origin_idx": event.origin.idx,
+        "last_updated_ts": last_updated_ts,
+        "last_changed_ts": last_changed_ts,
+        "last_reported_ts": last_reported_ts,
+    }
@@ -29,6 +29,17 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
+# Events beyond MAX_QUEUE_BACKLOG_MIN_VALUE are spilled to disk
+MAX_QUEUE_SPILL_BYTES = 1024**3
+QUEUE_SPILL_DIR = ".recorder_backlog"
+
+# The most recently used ids of each table manager are saved on shutdown
+ID_CACHE_FILE = ".recorder_id_cache"
+ID_CACHE_MAX_IDS = 8192
+
+# Results of identical history and statistics queries are shared
+QUERY_CACHE_MAX_SIZE = 32
+QUERY_CACHE_MAX_AGE = 10
 
 # The maximum number of rows (events) we purge in one delete statement
 
@@ -9,7 +9,6 @@ import contextlib
 from datetime import datetime, timedelta
 from functools import cached_property
 import logging
-import queue
 import sqlite3
 import threading
 import time
@@ -50,17 +49,25 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .backlog import RecorderQueue
+from .bulk_insert import StatesBulkWriter
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
+    ID_CACHE_FILE,
+    ID_CACHE_MAX_IDS,
     KEEPALIVE_TIME,
     LAST_REPORTED_SCHEMA_VERSION,
     MARIADB_PYMYSQL_URL_PREFIX,
     MARIADB_URL_PREFIX,
     MAX_QUEUE_BACKLOG_MIN_VALUE,
+    MAX_QUEUE_SPILL_BYTES,
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    QUERY_CACHE_MAX_AGE,
+    QUERY_CACHE_MAX_SIZE,
+    QUEUE_SPILL_DIR,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     STATISTICS_ROWS_SCHEMA_VERSION,
@@ -79,6 +86,7 @@ from .db_schema import (
     StatisticsShortTerm,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
+from .id_cache import load_id_cache, save_id_cache
 from .migration import (
     EntityIDMigration,
     EventIDPostMigration,
@@ -89,6 +97,7 @@ from .migration import (
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
 from .queries import get_migration_changes
+from .query_cache import QueryCache
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -174,6 +183,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        bulk_insert: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -187,8 +197,17 @@ class Recorder(threading.Thread):
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
-        self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
+        self._queue = RecorderQueue(
+            hass,
+            hass.config.path(QUEUE_SPILL_DIR),
+            MAX_QUEUE_BACKLOG_MIN_VALUE,
+            MAX_QUEUE_SPILL_BYTES,
+        )
         self.db_url = uri
+        # There is nothing to restore for an in-memory database
+        self._id_cache_path = (
+            hass.config.path(ID_CACHE_FILE) if uri != SQLITE_URL_PREFIX else None
+        )
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
         self.database_engine: DatabaseEngine | None = None
@@ -213,6 +232,11 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # Bumped whenever rows are written so cached
+        # query results of older generations are not used
+        self.states_generation = 0
+        self.statistics_generation = 0
+        self.query_cache = QueryCache(self, QUERY_CACHE_MAX_SIZE, QUERY_CACHE_MAX_AGE)
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -221,6 +245,10 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.bulk_insert = bulk_insert
+        # Only set once the database connection is established and
+        # the dialect supports returning ids from executemany inserts
+        self.states_bulk_writer: StatesBulkWriter | None = None
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -394,6 +422,9 @@ class Recorder(threading.Thread):
 
     def _reached_max_backlog(self) -> bool:
         """Check if the system has reached the max queue backlog and return True if it has."""
+        # Events are going to disk so memory is not growing
+        if self._queue.spilling:
+            return False
         # First check the minimum value since its cheap
         if self.backlog < MAX_QUEUE_BACKLOG_MIN_VALUE:
             return False
@@ -439,11 +470,7 @@ class Recorder(threading.Thread):
         # We drain all the events in the queue and then insert
         # an empty one to ensure the next thing the recorder sees
         # is a request to shutdown.
-        while True:
-            try:
-                self._queue.get_nowait()
-            except queue.Empty:
-                break
+        self._queue.clear()
         self.queue_task(StopTask())
         await self.hass.async_add_executor_job(self.join)
 
@@ -546,6 +573,50 @@ class Recorder(threading.Thread):
             self.states_meta_manager.adjust_lru_size(new_size)
             self.statistics_meta_manager.adjust_lru_size(new_size)
 
+    def _id_cache_managers(
+        self,
+    ) -> tuple[StateAttributesManager | StatesMetaManager, ...]:
+        """Return the table managers whose recently used ids are saved."""
+        if self.states_meta_manager.active:
+            return (self.state_attributes_manager, self.states_meta_manager)
+        return (self.state_attributes_manager,)
+
+    def _load_id_cache(self) -> None:
+        """Load the ids which were recently used before the last shutdown.
+
+        The ids are looked up by primary key so the table managers
+        do not have to look up each one by hash when the backlog
+        from startup is written.
+        """
+        if self._id_cache_path is None:
+            return
+        managers = self._id_cache_managers()
+        if not (
+            sections := load_id_cache(
+                self._id_cache_path, SCHEMA_VERSION, len(managers)
+            )
+        ):
+            return
+        with session_scope(session=self.get_session(), read_only=True) as session:
+            for manager, ids in zip(managers, sections, strict=True):
+                manager.load_recent(ids, session)
+        _LOGGER.debug(
+            "Restored %s recently used ids", sum(len(ids) for ids in sections)
+        )
+
+    def _save_id_cache(self) -> None:
+        """Save the recently used ids of the table managers."""
+        if self._id_cache_path is None or self.schema_version != SCHEMA_VERSION:
+            return
+        save_id_cache(
+            self._id_cache_path,
+            SCHEMA_VERSION,
+            [
+                manager.get_recent_ids(ID_CACHE_MAX_IDS)
+                for manager in self._id_cache_managers()
+            ],
+        )
+
     @callback
     def async_periodic_statistics(self) -> None:
         """Trigger the statistics run.
@@ -785,6 +856,7 @@ class Recorder(threading.Thread):
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
         self._adjust_lru_size()
+        self._load_id_cache()
         self.hass.add_job(self._async_set_recorder_ready_migration_done)
         self._run_event_loop()
 
@@ -880,6 +952,20 @@ class Recorder(threading.Thread):
         except Exception:
             _LOGGER.exception("Error while processing event %s", task)
 
+    def _process_spilled_events(self) -> None:
+        """Process the events that were spilled to disk in order."""
+        _LOGGER.debug("Processing spilled events")
+        commit_interval = self.commit_interval
+        next_commit = time.monotonic() + commit_interval
+        for event in self._queue.iter_spilled():
+            self._guarded_process_one_task_or_event_or_recover(event)
+            # The commit tasks are queued behind the spilled
+            # events so we need to commit periodically here
+            if commit_interval and time.monotonic() >= next_commit:
+                self._guarded_process_one_task_or_event_or_recover(COMMIT_TASK)
+                next_commit = time.monotonic() + commit_interval
+        _LOGGER.debug("Finished processing spilled events")
+
     def _process_one_task_or_event_or_recover(self, task: RecorderTask | Event) -> None:
         """Process a task or event, reconnect, or recover a malformed database."""
         try:
@@ -897,6 +983,10 @@ class Recorder(threading.Thread):
             if task.commit_before:
                 self._commit_event_session_or_retry()
             task.run(self)
+            if task.writes_states:
+                self.states_generation += 1
+            if task.writes_statistics:
+                self.statistics_generation += 1
         except exc.DatabaseError as err:
             if self._handle_database_error(err, setup_run=True):
                 return
@@ -1026,7 +1116,10 @@ class Recorder(threading.Thread):
         if not self.enabled:
             return
         if event.event_type == EVENT_STATE_CHANGED:
-            self._process_state_changed_event_into_session(event)
+            if self.states_bulk_writer is not None and self.states_meta_manager.active:
+                self._process_state_changed_event_into_bulk_writer(event)
+            else:
+                self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
         # Commit if the commit interval is zero
@@ -1162,6 +1255,15 @@ class Recorder(threading.Thread):
 
         self._add_to_session(session, dbstate)
 
+    def _process_state_changed_event_into_bulk_writer(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Process a state_changed event into the bulk writer."""
+        assert self.event_session is not None
+        assert self.states_bulk_writer is not None
+        if self.states_bulk_writer.add(event, self.event_session):
+            self._event_session_has_pending_writes = True
+
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
         if (
@@ -1208,6 +1310,9 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self.states_bulk_writer:
+            self.states_bulk_writer.flush(session)
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1224,12 +1329,15 @@ class Recorder(threading.Thread):
                     ],
                 )
         session.commit()
+        self.states_generation += 1
 
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
         # into the LRU or committed now.
+        if self.states_bulk_writer:
+            self.states_bulk_writer.post_commit()
         self.states_manager.post_commit_pending()
         self.state_attributes_manager.post_commit_pending()
         self.event_data_manager.post_commit_pending()
@@ -1263,6 +1371,8 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        if self.states_bulk_writer:
+            self.states_bulk_writer.reset()
 
         if not self.event_session:
             return
@@ -1441,8 +1551,29 @@ class Recorder(threading.Thread):
             end_incomplete_runs(session, self.recorder_runs_manager.recording_start)
             self.recorder_runs_manager.start(session)
 
+        self._setup_states_bulk_writer()
         self._open_event_session()
 
+    def _setup_states_bulk_writer(self) -> None:
+        """Set up the states bulk writer if enabled and supported.
+
+        The dialect only knows if it can return ids from executemany
+        inserts after the first connection has been made.
+        """
+        self.states_bulk_writer = None
+        if not self.bulk_insert:
+            return
+        assert self.engine is not None
+        dialect = self.engine.dialect
+        if not dialect.insert_executemany_returning_sort_by_parameter_order:
+            _LOGGER.warning(
+                "The %s database does not support returning ids from bulk "
+                "inserts; states will be written one row at a time",
+                dialect.name,
+            )
+            return
+        self.states_bulk_writer = StatesBulkWriter(self)
+
     def _schedule_compile_missing_statistics(self) -> None:
         """Add tasks for missing statistics runs."""
         self.queue_task(CompileMissingStatisticsTask())
@@ -1478,6 +1609,7 @@ class Recorder(threading.Thread):
 
         try:
             self._end_session()
+            self._save_id_cache()
         finally:
             if self._db_executor:
                 # We shutdown the executor without forcefully
@@ -1489,3 +1621,4 @@ class Recorder(threading.Thread):
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
                 self._db_executor.join_threads_or_timeout()
+            self._queue.close()
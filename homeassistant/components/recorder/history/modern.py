@@ -21,6 +21,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -229,6 +230,99 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, start_time_ts, entity_id_to_metadata_id = query
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def stream_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+) -> Iterator[dict[str, list[dict[str, Any]]]]:
+    """Yield significant states in the compressed state format in chunks.
+
+    The rows are fetched from the database cursor chunk_size rows
+    at a time so only one chunk is held in memory. Each chunk maps
+    entity_ids to the next slice of their states.
+    """
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return
+    stmt, start_time_ts, entity_id_to_metadata_id = query
+    # The last state of each entity in the previous chunks
+    prev_states: dict[int, str | None] = {}
+    for rows in (
+        session.connection()
+        .execute(stmt, execution_options={"yield_per": chunk_size})
+        .partitions()
+    ):
+        if chunk := _sorted_states_to_dict(
+            rows,
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            True,
+            no_attributes=no_attributes,
+            prev_states=prev_states,
+        ):
+            yield cast(dict[str, list[dict[str, Any]]], chunk)
+
+
+def _significant_states_query(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, float | None, dict[str, int | None]] | None:
+    """Return the query for significant states.
+
+    Returns None if none of the entity_ids were ever recorded.
+    Otherwise returns the statement, the start time to use for
+    the start time states and the entity_id to metadata_id map.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -237,7 +331,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -275,14 +369,10 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+    return (
+        stmt,
         start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
     )
 
 
@@ -680,6 +770,7 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
+    prev_states: dict[int, str | None] | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -691,6 +782,10 @@ def _sorted_states_to_dict(
     We also need to go back and create a synthetic zero data point for
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
+
+    When the states are converted in chunks, prev_states keeps the
+    last state of each entity of the previous chunks so minimal
+    responses continue where the previous chunk stopped.
     """
     field_map = _FIELD_MAP
     state_class: Callable[
@@ -758,7 +853,9 @@ def _sorted_states_to_dict(
         # State for the first and last response. All the states
         # in-between only provide the "state" and the
         # "last_changed".
-        if not ent_results:
+        if prev_states is not None and metadata_id in prev_states:
+            prev_state = prev_states[metadata_id]
+        elif not ent_results:
             if (first_state := next(group, None)) is None:
                 continue
             prev_state = first_state[state_idx]
@@ -793,6 +890,8 @@ def _sorted_states_to_dict(
                     if (state := row[state_idx]) != prev_state
                 ]
             )
+            if prev_states is not None:
+                prev_states[metadata_id] = prev_state
             continue
 
         # Non-compressed state format returns an ISO formatted string
@@ -809,6 +908,8 @@ def _sorted_states_to_dict(
                 if (state := row[state_idx]) != prev_state
             ]
         )
+        if prev_states is not None:
+            prev_states[metadata_id] = prev_state
 
     if descending:
         for ent_results in result.values():
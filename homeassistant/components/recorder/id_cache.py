@@ -0,0 +1,87 @@
+"""Persist the recently used ids of the recorder table managers."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+import logging
+import os
+import struct
+import zlib
+
+from homeassistant.util.file import WriteError, write_utf8_file
+
+_LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"HAID"
+SNAPSHOT_VERSION = 1
+
+# magic, snapshot version, schema version, number of sections
+_HEADER = struct.Struct("<4sHHI")
+_COUNT = struct.Struct("<I")
+_CRC = struct.Struct("<I")
+
+
+def _pack_ids(ids: Sequence[int]) -> bytes:
+    """Pack ids as unsigned 64-bit integers."""
+    return _COUNT.pack(len(ids)) + struct.pack(f"<{len(ids)}Q", *ids)
+
+
+def save_id_cache(path: str, schema_version: int, sections: list[list[int]]) -> None:
+    """Save a snapshot of ids, one section per table manager.
+
+    Only ids are stored, the data they map to is loaded from
+    the database when the snapshot is restored.
+    """
+    payload = _HEADER.pack(
+        SNAPSHOT_MAGIC, SNAPSHOT_VERSION, schema_version, len(sections)
+    ) + b"".join(_pack_ids(ids) for ids in sections)
+    try:
+        write_utf8_file(
+            path, payload + _CRC.pack(zlib.crc32(payload)), private=True, mode="wb"
+        )
+    except WriteError:
+        return
+    _LOGGER.debug("Saved %s ids to %s", sum(len(ids) for ids in sections), path)
+
+
+def load_id_cache(
+    path: str, schema_version: int, section_count: int
+) -> list[list[int]] | None:
+    """Load and remove a snapshot of ids.
+
+    Returns None if there is no snapshot or if it is corrupt or
+    was saved by a different schema version.
+    """
+    try:
+        with open(path, "rb") as snapshot_file:
+            data = snapshot_file.read()
+        os.unlink(path)
+    except FileNotFoundError:
+        return None
+    except OSError as err:
+        _LOGGER.warning("Could not read the recorder id cache %s: %s", path, err)
+        return None
+    if len(data) < _HEADER.size + _CRC.size or _CRC.unpack_from(
+        data, len(data) - _CRC.size
+    )[0] != zlib.crc32(memoryview(data)[: -_CRC.size]):
+        _LOGGER.warning("Discarding corrupt recorder id cache %s", path)
+        return None
+    magic, version, saved_schema_version, saved_section_count = _HEADER.unpack_from(
+        data
+    )
+    if (
+        magic != SNAPSHOT_MAGIC
+        or version != SNAPSHOT_VERSION
+        or saved_schema_version != schema_version
+        or saved_section_count != section_count
+    ):
+        _LOGGER.debug("Discarding outdated recorder id cache %s", path)
+        return None
+    sections: list[list[int]] = []
+    offset = _HEADER.size
+    for _ in range(section_count):
+        (count,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        sections.append(list(struct.unpack_from(f"<{count}Q", data, offset)))
+        offset += count * 8
+    return sections
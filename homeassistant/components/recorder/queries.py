@@ -44,6 +44,17 @@ def get_shared_attributes(hashes: list[int]) -> StatementLambdaElement:
     )
 
 
+def get_shared_attributes_by_ids(
+    attributes_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Load shared attributes by attributes_ids from the database."""
+    return lambda_stmt(
+        lambda: select(
+            StateAttributes.attributes_id, StateAttributes.shared_attrs
+        ).where(StateAttributes.attributes_id.in_(attributes_ids))
+    )
+
+
 def get_shared_event_datas(hashes: list[int]) -> StatementLambdaElement:
     """Load shared event data from the database."""
     return lambda_stmt(
@@ -76,6 +87,17 @@ def find_states_metadata_ids(entity_ids: Iterable[str]) -> StatementLambdaElemen
     )
 
 
+def find_states_metadata_by_ids(
+    metadata_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Find entity_ids by metadata_ids."""
+    return lambda_stmt(
+        lambda: select(StatesMeta.metadata_id, StatesMeta.entity_id).filter(
+            StatesMeta.metadata_id.in_(metadata_ids)
+        )
+    )
+
+
 def _state_attrs_exist(attr: int | None) -> Select:
     """Check if a state attributes id exists in the states table."""
     return select(func.min(States.attributes_id)).where(States.attributes_id == attr)
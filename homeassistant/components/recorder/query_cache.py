@@ -0,0 +1,79 @@
+"""Share the results of identical read-only queries."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Hashable
+from functools import partial
+import time
+from typing import TYPE_CHECKING, Any
+
+from lru import LRU
+
+from homeassistant.core import callback
+
+if TYPE_CHECKING:
+    from .core import Recorder
+
+
+class QueryCache:
+    """Coalesce identical queries and keep their results for a short time.
+
+    A query which is already running is shared by every caller asking
+    for the same key. Finished results are kept until they are older
+    than max_age or the generation of the rows they were read from
+    changes, which happens when new rows are committed.
+    """
+
+    def __init__(self, instance: Recorder, max_size: int, max_age: float) -> None:
+        """Initialize the cache."""
+        self._instance = instance
+        self._max_age = max_age
+        self._pending: dict[tuple[Hashable, int], asyncio.Future[Any]] = {}
+        self._results: LRU[Hashable, tuple[int, float, Any]] = LRU(max_size)
+
+    async def async_get[_T](
+        self,
+        key: Hashable,
+        generation: int,
+        target: Callable[..., _T],
+        *args: Any,
+    ) -> _T:
+        """Return the result of target for key, running it only if needed.
+
+        The result is shared with other callers so it must not be
+        modified by the caller.
+        """
+        if (cached := self._results.get(key)) is not None:
+            cached_generation, expire_time, result = cached
+            if cached_generation == generation and expire_time > time.monotonic():
+                return result  # type: ignore[no-any-return]
+            del self._results[key]
+        pending_key = (key, generation)
+        if (future := self._pending.get(pending_key)) is None:
+            future = self._instance.async_add_executor_job(target, *args)
+            self._pending[pending_key] = future
+            future.add_done_callback(partial(self._async_query_done, pending_key))
+        # Shield the query so a caller going away does
+        # not cancel it for the other callers
+        return await asyncio.shield(future)
+
+    @callback
+    def _async_query_done(
+        self, pending_key: tuple[Hashable, int], future: asyncio.Future[Any]
+    ) -> None:
+        """Cache the result of a finished query."""
+        del self._pending[pending_key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        key, generation = pending_key
+        self._results[key] = (
+            generation,
+            time.monotonic() + self._max_age,
+            future.result(),
+        )
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop all cached results."""
+        self._results.clear()
@@ -2,21 +2,34 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
-from itertools import chain, groupby
+from itertools import groupby, pairwise
 import logging
 from operator import itemgetter
 import re
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import (
+    Integer,
+    Select,
+    and_,
+    bindparam,
+    case,
+    func,
+    lambda_stmt,
+    literal,
+    select,
+    text,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 import voluptuous as vol
 
@@ -888,16 +901,58 @@ def list_statistic_ids(
     return _flatten_list_statistic_ids_metadata_result(result)
 
 
+def _period_boundaries(
+    stats: dict[str, list[StatisticsRow]],
+    period_start_end: Callable[[float], tuple[float, float]],
+) -> tuple[list[float], list[float]]:
+    """Return the starts and ends of the periods the statistics fall into."""
+    last_start = max(stat_list[-1]["start"] for stat_list in stats.values())
+    period_starts: list[float] = []
+    period_ends: list[float] = []
+    start, end = period_start_end(
+        min(stat_list[0]["start"] for stat_list in stats.values())
+    )
+    while start <= last_start:
+        period_starts.append(start)
+        period_ends.append(end)
+        start, end = period_start_end(end)
+    return period_starts, period_ends
+
+
+def _reduce_column(
+    values: list[float | None],
+    slices: list[tuple[int, int]],
+    reduce: Callable[[list[float]], float | None],
+) -> list[float | None]:
+    """Reduce each slice of a column, missing values are skipped."""
+    if None not in values:
+        present = cast(list[float], values)
+        return [reduce(present[lo:hi]) for lo, hi in slices]
+    return [
+        reduce(present)
+        if (present := [value for value in values[lo:hi] if value is not None])
+        else None
+        for lo, hi in slices
+    ]
+
+
 def _reduce_statistics(
     stats: dict[str, list[StatisticsRow]],
-    same_period: Callable[[float, float], bool],
     period_start_end: Callable[[float], tuple[float, float]],
-    period: timedelta,
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily or monthly statistics."""
-    result: dict[str, list[StatisticsRow]] = defaultdict(list)
-    period_seconds = period.total_seconds()
+    """Reduce hourly statistics to daily, weekly or monthly statistics.
+
+    The statistics of each statistic_id are split into columns and the
+    rows of each period are found by bisecting the column of start
+    times with the period boundaries. The reduced values are kept in
+    columns as well and the rows are only built once all periods of a
+    statistic_id are reduced.
+    """
+    result: dict[str, list[StatisticsRow]] = {}
+    if not stats:
+        return result
+    period_starts, period_ends = _period_boundaries(stats, period_start_end)
     _want_mean = "mean" in types
     _want_min = "min" in types
     _want_max = "max" in types
@@ -905,44 +960,43 @@ def _reduce_statistics(
     _want_state = "state" in types
     _want_sum = "sum" in types
     for statistic_id, stat_list in stats.items():
-        max_values: list[float] = []
-        mean_values: list[float] = []
-        min_values: list[float] = []
-        prev_stat: StatisticsRow = stat_list[0]
-        fake_entry: StatisticsRow = {"start": stat_list[-1]["start"] + period_seconds}
-
-        # Loop over the hourly statistics + a fake entry to end the period
-        for statistic in chain(stat_list, (fake_entry,)):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, end = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                row: StatisticsRow = {
-                    "start": start,
-                    "end": end,
-                }
-                if _want_mean:
-                    row["mean"] = mean(mean_values) if mean_values else None
-                    mean_values.clear()
-                if _want_min:
-                    row["min"] = min(min_values) if min_values else None
-                    min_values.clear()
-                if _want_max:
-                    row["max"] = max(max_values) if max_values else None
-                    max_values.clear()
-                if _want_last_reset:
-                    row["last_reset"] = prev_stat.get("last_reset")
-                if _want_state:
-                    row["state"] = prev_stat.get("state")
-                if _want_sum:
-                    row["sum"] = prev_stat["sum"]
-                result[statistic_id].append(row)
-            if _want_max and (_max := statistic.get("max")) is not None:
-                max_values.append(_max)
-            if _want_mean and (_mean := statistic.get("mean")) is not None:
-                mean_values.append(_mean)
-            if _want_min and (_min := statistic.get("min")) is not None:
-                min_values.append(_min)
-            prev_stat = statistic
+        starts: list[float] = list(map(itemgetter("start"), stat_list))
+        rows_count = len(starts)
+        # The rows of each period as a slice of the columns
+        slices: list[tuple[int, int]] = []
+        columns: dict[str, list[Any]] = {"start": [], "end": []}
+        lo = 0
+        period_idx = bisect_right(period_starts, starts[0]) - 1
+        while lo < rows_count:
+            hi = bisect_left(starts, period_ends[period_idx], lo)
+            slices.append((lo, hi))
+            columns["start"].append(period_starts[period_idx])
+            columns["end"].append(period_ends[period_idx])
+            if hi < rows_count:
+                period_idx = bisect_right(period_starts, starts[hi], period_idx) - 1
+            lo = hi
+        for key, want, reduce in (
+            ("mean", _want_mean, mean),
+            ("min", _want_min, min),
+            ("max", _want_max, max),
+        ):
+            if want:
+                columns[key] = _reduce_column(
+                    list(map(itemgetter(key), stat_list)), slices, reduce
+                )
+        # The last row of the period holds its last_reset, state and sum
+        last_rows = [stat_list[hi - 1] for _, hi in slices]
+        if _want_last_reset:
+            columns["last_reset"] = [row.get("last_reset") for row in last_rows]
+        if _want_state:
+            columns["state"] = [row.get("state") for row in last_rows]
+        if _want_sum:
+            columns["sum"] = [row["sum"] for row in last_rows]
+        keys = tuple(columns)
+        result[statistic_id] = [
+            dict(zip(keys, values, strict=True))  # type: ignore[misc]
+            for values in zip(*columns.values(), strict=True)
+        ]
 
     return result
 
@@ -990,10 +1044,8 @@ def _reduce_statistics_per_day(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to daily statistics."""
-    _same_day_ts, _day_start_end_ts = reduce_day_ts_factory()
-    return _reduce_statistics(
-        stats, _same_day_ts, _day_start_end_ts, timedelta(days=1), types
-    )
+    _, _day_start_end_ts = reduce_day_ts_factory()
+    return _reduce_statistics(stats, _day_start_end_ts, types)
 
 
 def reduce_week_ts_factory() -> (
@@ -1040,10 +1092,8 @@ def _reduce_statistics_per_week(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to weekly statistics."""
-    _same_week_ts, _week_start_end_ts = reduce_week_ts_factory()
-    return _reduce_statistics(
-        stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
-    )
+    _, _week_start_end_ts = reduce_week_ts_factory()
+    return _reduce_statistics(stats, _week_start_end_ts, types)
 
 
 def _find_month_end_time(timestamp: datetime) -> datetime:
@@ -1095,10 +1145,8 @@ def _reduce_statistics_per_month(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to monthly statistics."""
-    _same_month_ts, _month_start_end_ts = reduce_month_ts_factory()
-    return _reduce_statistics(
-        stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
-    )
+    _, _month_start_end_ts = reduce_month_ts_factory()
+    return _reduce_statistics(stats, _month_start_end_ts, types)
 
 
 def _generate_statistics_during_period_stmt(
@@ -1124,6 +1172,158 @@ def _generate_statistics_during_period_stmt(
     return stmt
 
 
+_PERIOD_SECONDS: dict[str, float] = {
+    "day": timedelta(days=1).total_seconds(),
+    "week": timedelta(days=7).total_seconds(),
+}
+# 1970-01-01 was a Thursday, shift by 3 days to make weeks start on Monday
+_PERIOD_EPOCH_SHIFT: dict[str, float] = {
+    "day": 0,
+    "week": timedelta(days=3).total_seconds(),
+}
+_OFFSET_SCAN_STEP = int(timedelta(days=7).total_seconds())
+
+
+def _utc_offset_changes(start_ts: int, end_ts: int) -> list[tuple[int, float]]:
+    """Return the UTC offset of the default time zone and when it changes.
+
+    The first item is the offset at start_ts, the following items are
+    the first second with a new offset and the new offset.
+    """
+    time_zone = dt_util.get_default_time_zone()
+
+    def _offset(timestamp: int) -> float:
+        utc_offset = datetime.fromtimestamp(timestamp, tz=time_zone).utcoffset()
+        return utc_offset.total_seconds() if utc_offset else 0
+
+    changes = [(start_ts, _offset(start_ts))]
+    current = changes[0][1]
+    scan_ts = start_ts
+    while scan_ts < end_ts:
+        next_ts = min(scan_ts + _OFFSET_SCAN_STEP, end_ts)
+        if _offset(next_ts) == current:
+            scan_ts = next_ts
+            continue
+        # Bisect to the first second with the new offset
+        low, high = scan_ts, next_ts
+        while high - low > 1:
+            middle = (low + high) // 2
+            if _offset(middle) == current:
+                low = middle
+            else:
+                high = middle
+        current = _offset(high)
+        changes.append((high, current))
+        scan_ts = high
+    return changes
+
+
+def _generate_period_bucket(
+    table: type[StatisticsBase],
+    dialect_name: SupportedDialect,
+    period: Literal["day", "week", "month"],
+    start_time: datetime,
+    end_time: datetime,
+) -> ColumnElement:
+    """Return an expression which numbers the periods start_ts falls into.
+
+    Periods follow the local calendar. Days and weeks are numbered from
+    the local time, with the UTC offset picked by a CASE over the
+    offset changes in the time range. Months have different lengths so
+    they are numbered by a CASE over the month boundaries.
+    """
+    start_ts = int(start_time.timestamp())
+    end_ts = int(end_time.timestamp())
+    if period == "month":
+        _, month_start_end_ts = reduce_month_ts_factory()
+        whens: list[tuple[ColumnElement[bool], int]] = []
+        month_end_ts = month_start_end_ts(start_ts)[1]
+        while month_end_ts < end_ts:
+            whens.append((table.start_ts < month_end_ts, len(whens)))
+            month_end_ts = month_start_end_ts(month_end_ts)[1]
+        if not whens:
+            return literal(0)
+        return case(*whens, else_=len(whens))
+    changes = _utc_offset_changes(start_ts, end_ts)
+    utc_offset: ColumnElement = (
+        literal(changes[0][1])
+        if len(changes) == 1
+        else case(
+            *(
+                (table.start_ts < change_ts, offset)
+                for (_, offset), (change_ts, _) in pairwise(changes)
+            ),
+            else_=changes[-1][1],
+        )
+    )
+    local_periods = (
+        table.start_ts + utc_offset + _PERIOD_EPOCH_SHIFT[period]
+    ) / _PERIOD_SECONDS[period]
+    if dialect_name == SupportedDialect.SQLITE:
+        # SQLite may be built without math functions, timestamps are
+        # positive so truncating is the same as flooring
+        return local_periods.cast(Integer)
+    return func.floor(local_periods)
+
+
+def _generate_statistics_during_period_grouped_stmt(
+    table: type[StatisticsBase],
+    dialect_name: SupportedDialect,
+    period: Literal["day", "week", "month"],
+    start_time: datetime,
+    end_time: datetime,
+    metadata_ids: list[int] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> Select:
+    """Prepare a database query for statistics grouped by period.
+
+    The rows are grouped in the database and each group is joined with
+    its last row which holds the state and sum of the period. The
+    start_ts of each returned row is the start of the first row of the
+    period, the caller is responsible for aligning it with the period.
+    """
+    start_time_ts = start_time.timestamp()
+    end_time_ts = end_time.timestamp()
+    bucket = _generate_period_bucket(table, dialect_name, period, start_time, end_time)
+    grouped = select(
+        table.metadata_id,
+        func.min(table.start_ts).label("start_ts"),
+        func.max(table.start_ts).label("last_start_ts"),
+    )
+    if "mean" in types:
+        grouped = grouped.add_columns(func.avg(table.mean).label("mean"))
+    if "min" in types:
+        grouped = grouped.add_columns(func.min(table.min).label("min"))
+    if "max" in types:
+        grouped = grouped.add_columns(func.max(table.max).label("max"))
+    grouped = grouped.filter(
+        table.start_ts >= start_time_ts, table.start_ts < end_time_ts
+    )
+    if metadata_ids:
+        grouped = grouped.filter(table.metadata_id.in_(metadata_ids))
+    grouped_subquery = grouped.group_by(table.metadata_id, bucket).subquery()
+    last_columns = [
+        getattr(table, _type_column_mapping[key])
+        for key in ("last_reset", "state", "sum")
+        if key in types
+    ]
+    stmt = select(
+        grouped_subquery.c.metadata_id,
+        grouped_subquery.c.start_ts,
+        *(grouped_subquery.c[key] for key in ("mean", "min", "max") if key in types),
+        *last_columns,
+    )
+    if last_columns:
+        stmt = stmt.join(
+            table,
+            and_(
+                table.metadata_id == grouped_subquery.c.metadata_id,
+                table.start_ts == grouped_subquery.c.last_start_ts,
+            ),
+        )
+    return stmt.order_by(grouped_subquery.c.metadata_id, grouped_subquery.c.start_ts)
+
+
 def _generate_max_mean_min_statistic_in_sub_period_stmt(
     columns: Select,
     start_time: datetime | None,
@@ -1686,6 +1886,57 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+_PERIOD_TS_FACTORIES = {
+    "day": reduce_day_ts_factory,
+    "week": reduce_week_ts_factory,
+    "month": reduce_month_ts_factory,
+}
+
+
+def _statistics_during_period_grouped(
+    hass: HomeAssistant,
+    session: Session,
+    dialect_name: SupportedDialect,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata_ids: list[int] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    period: Literal["day", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return statistics during a period reduced to days, weeks or months.
+
+    Only one row per statistic_id and period is fetched from the database.
+    """
+    if end_time is None:
+        # The period boundaries are only needed up to the last row
+        last_start_stmt = select(func.max(Statistics.start_ts)).filter(
+            Statistics.start_ts >= start_time.timestamp()
+        )
+        if metadata_ids:
+            last_start_stmt = last_start_stmt.filter(
+                Statistics.metadata_id.in_(metadata_ids)
+            )
+        if (last_start_ts := session.execute(last_start_stmt).scalar()) is None:
+            return {}
+        end_time = dt_util.utc_from_timestamp(last_start_ts + 1)
+    stmt = _generate_statistics_during_period_grouped_stmt(
+        Statistics, dialect_name, period, start_time, end_time, metadata_ids, types
+    )
+    if not (stats := session.connection().execute(stmt).all()):
+        return {}
+    result = _sorted_statistics_to_dict(
+        hass, stats, statistic_ids, metadata, True, Statistics, units, types
+    )
+    _, period_start_end = _PERIOD_TS_FACTORIES[period]()
+    for rows in result.values():
+        for row in rows:
+            row["start"], row["end"] = period_start_end(row["start"])
+    return result
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1756,35 +2007,55 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
-
-    if not stats:
-        return {}
+    dialect_name = get_instance(hass).dialect_name
+    if period in ("day", "week", "month") and dialect_name is not None:
+        # Group the hourly statistics by period in the database
+        result = _statistics_during_period_grouped(
+            hass,
+            session,
+            dialect_name,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata_ids,
+            metadata,
+            cast(Literal["day", "week", "month"], period),
+            units,
+            types,
+        )
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
+        result = (
+            _sorted_statistics_to_dict(
+                hass,
+                stats,
+                statistic_ids,
+                metadata,
+                True,
+                table,
+                units,
+                types,
+            )
+            if stats
+            else {}
+        )
 
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types)
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types)
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types)
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+    if not result:
+        return {}
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 from lru import LRU
@@ -43,6 +44,14 @@ class BaseTableManager[_DataT]:
         """
         return self._pending.get(shared_data)
 
+    def add_committed(self, shared_data: EventType[Any] | str, row_id: int) -> None:
+        """Add an id for data that was committed without the ORM.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._id_map[shared_data] = row_id
+
     def reset(self) -> None:
         """Reset after the database has been reset or changed.
 
@@ -74,3 +83,22 @@ class BaseLRUTableManager[_DataT](BaseTableManager[_DataT]):
         lru = self._id_map
         if new_size > lru.get_size():
             lru.set_size(new_size)
+
+    def get_recent_ids(self, limit: int) -> list[int]:
+        """Return up to limit ids, most recently used first.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return list(islice(self._id_map.values(), limit))
+
+    def _restore_recent(self, ids: list[int], id_to_data: dict[int, str]) -> None:
+        """Add data to the LRU keeping the order of the recently used ids.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        id_map = self._id_map
+        for row_id in reversed(ids):
+            if (data := id_to_data.get(row_id)) is not None and data not in id_map:
+                id_map[data] = row_id
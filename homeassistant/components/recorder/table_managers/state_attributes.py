@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Collection, Iterable
+from collections.abc import Collection, Iterable, Mapping, Sequence
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy.orm.session import Session
 
@@ -13,11 +13,13 @@ from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..db_schema import StateAttributes
-from ..queries import get_shared_attributes
+from ..queries import get_shared_attributes, get_shared_attributes_by_ids
 from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
 if TYPE_CHECKING:
+    from homeassistant.helpers.entity import StateInfo
+
     from ..core import Recorder
 
 # The number of attribute ids to cache in memory
@@ -37,11 +39,24 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        # The last serialized attributes of each entity, states keep the
+        # attributes of the old state if they did not change
+        self._serialized: dict[
+            str, tuple[Mapping[str, Any], StateInfo | None, bytes]
+        ] = {}
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
+        entity_id = event.data["entity_id"]
+        if (
+            (state := event.data["new_state"]) is not None
+            and (serialized := self._serialized.get(entity_id)) is not None
+            and serialized[0] is state.attributes
+            and serialized[1] is state.state_info
+        ):
+            return serialized[2]
         try:
-            return StateAttributes.shared_attrs_bytes_from_event(
+            shared_attrs_bytes = StateAttributes.shared_attrs_bytes_from_event(
                 event, self.recorder.dialect_name
             )
         except JSON_ENCODE_EXCEPTIONS as ex:
@@ -51,6 +66,15 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
                 ex,
             )
             return None
+        if state is None:
+            self._serialized.pop(entity_id, None)
+        else:
+            self._serialized[entity_id] = (
+                state.attributes,
+                state.state_info,
+                shared_attrs_bytes,
+            )
+        return shared_attrs_bytes
 
     def load(
         self, events: list[Event[EventStateChangedData]], session: Session
@@ -116,6 +140,31 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
 
         return results
 
+    def load_recent(self, attributes_ids: list[int], session: Session) -> None:
+        """Load the shared_attrs of recently used attributes_ids into memory.
+
+        The attributes_ids are ordered most recently used first.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        id_to_shared_attrs: dict[int, str] = {}
+        with session.no_autoflush:
+            for ids_chunk in chunked_or_all(
+                attributes_ids, self.recorder.max_bind_vars
+            ):
+                id_to_shared_attrs.update(
+                    cast(
+                        Sequence[tuple[int, str]],
+                        execute_stmt_lambda_element(
+                            session,
+                            get_shared_attributes_by_ids(ids_chunk),
+                            orm_rows=False,
+                        ),
+                    )
+                )
+        self._restore_recent(attributes_ids, id_to_shared_attrs)
+
     def add_pending(self, db_state_attributes: StateAttributes) -> None:
         """Add a pending StateAttributes that will be committed at the next interval.
 
@@ -152,3 +201,12 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             state_attributes_ids_reversed
         ):
             id_map.pop(state_attributes_ids_reversed[purged_attributes_id], None)
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._serialized.clear()
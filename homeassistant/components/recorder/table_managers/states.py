@@ -45,6 +45,14 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_committed(self, entity_id: str, state_id: int) -> None:
+        """Add a state that was committed without the ORM.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._last_committed_id[entity_id] = state_id
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -11,7 +11,11 @@ from homeassistant.core import Event, EventStateChangedData
 from homeassistant.util.collection import chunked_or_all
 
 from ..db_schema import StatesMeta
-from ..queries import find_all_states_metadata_ids, find_states_metadata_ids
+from ..queries import (
+    find_all_states_metadata_ids,
+    find_states_metadata_by_ids,
+    find_states_metadata_ids,
+)
 from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -121,6 +125,29 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
 
         return results
 
+    def load_recent(self, metadata_ids: list[int], session: Session) -> None:
+        """Load the entity_ids of recently used metadata_ids into memory.
+
+        The metadata_ids are ordered most recently used first.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        id_to_entity_id: dict[int, str] = {}
+        with session.no_autoflush:
+            for ids_chunk in chunked_or_all(metadata_ids, self.recorder.max_bind_vars):
+                id_to_entity_id.update(
+                    cast(
+                        Sequence[tuple[int, str]],
+                        execute_stmt_lambda_element(
+                            session,
+                            find_states_metadata_by_ids(ids_chunk),
+                            orm_rows=False,
+                        ),
+                    )
+                )
+        self._restore_recent(metadata_ids, id_to_entity_id)
+
     def add_pending(self, db_states_meta: StatesMeta) -> None:
         """Add a pending StatesMeta that will be committed at the next interval.
 
@@ -32,6 +32,9 @@ class RecorderTask:
     """ABC for recorder tasks."""
 
     commit_before = True
+    # Set if the task writes rows which may be returned by cached queries
+    writes_states = False
+    writes_statistics = False
 
     @abc.abstractmethod
     def run(self, instance: Recorder) -> None:
@@ -42,6 +45,8 @@ class RecorderTask:
 class ChangeStatisticsUnitTask(RecorderTask):
     """Object to store statistics_id and unit to convert unit of statistics."""
 
+    writes_statistics = True
+
     statistic_id: str
     new_unit_of_measurement: str
     old_unit_of_measurement: str
@@ -60,6 +65,8 @@ class ChangeStatisticsUnitTask(RecorderTask):
 class ClearStatisticsTask(RecorderTask):
     """Object to store statistics_ids which for which to remove statistics."""
 
+    writes_statistics = True
+
     statistic_ids: list[str]
 
     def run(self, instance: Recorder) -> None:
@@ -71,6 +78,8 @@ class ClearStatisticsTask(RecorderTask):
 class UpdateStatisticsMetadataTask(RecorderTask):
     """Object to store statistics_id and unit for update of statistics metadata."""
 
+    writes_statistics = True
+
     statistic_id: str
     new_statistic_id: str | None | UndefinedType
     new_unit_of_measurement: str | None | UndefinedType
@@ -89,6 +98,8 @@ class UpdateStatisticsMetadataTask(RecorderTask):
 class UpdateStatesMetadataTask(RecorderTask):
     """Task to update states metadata."""
 
+    writes_states = True
+
     entity_id: str
     new_entity_id: str
 
@@ -105,6 +116,9 @@ class UpdateStatesMetadataTask(RecorderTask):
 class PurgeTask(RecorderTask):
     """Object to store information about purge task."""
 
+    writes_states = True
+    writes_statistics = True
+
     purge_before: datetime
     repack: bool
     apply_filter: bool
@@ -131,6 +145,8 @@ class PurgeTask(RecorderTask):
 class PurgeEntitiesTask(RecorderTask):
     """Object to store entity information about purge task."""
 
+    writes_states = True
+
     entity_filter: Callable[[str], bool]
     purge_before: datetime
 
@@ -158,6 +174,8 @@ class PerodicCleanupTask(RecorderTask):
 class StatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run a statistics task."""
 
+    writes_statistics = True
+
     start: datetime
     fire_events: bool
 
@@ -173,6 +191,8 @@ class StatisticsTask(RecorderTask):
 class CompileMissingStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run a compile missing statistics."""
 
+    writes_statistics = True
+
     def run(self, instance: Recorder) -> None:
         """Run statistics task to compile missing statistics."""
         if statistics.compile_missing_statistics(instance):
@@ -185,6 +205,8 @@ class CompileMissingStatisticsTask(RecorderTask):
 class ImportStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run an import statistics task."""
 
+    writes_statistics = True
+
     metadata: StatisticMetaData
     statistics: Iterable[StatisticData]
     table: type[Statistics | StatisticsShortTerm]
@@ -205,6 +227,8 @@ class ImportStatisticsTask(RecorderTask):
 class AdjustStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run an adjust statistics task."""
 
+    writes_statistics = True
+
     statistic_id: str
     start_time: datetime
     sum_adjustment: float
@@ -291,6 +315,17 @@ class CommitTask(RecorderTask):
         instance._commit_event_session_or_retry()  # noqa: SLF001
 
 
+@dataclass(slots=True)
+class ProcessSpilledEventsTask(RecorderTask):
+    """Process the events that were spilled to disk."""
+
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._process_spilled_events()  # noqa: SLF001
+
+
 @dataclass(slots=True)
 class AddRecorderPlatformTask(RecorderTask):
     """Add a recorder platform."""
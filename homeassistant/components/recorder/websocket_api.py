@@ -33,6 +33,7 @@ from homeassistant.util.unit_conversion import (
     VolumeFlowRateConverter,
 )
 
+from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticPeriod
 from .statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
@@ -143,7 +144,6 @@ async def ws_get_statistic_during_period(
 
 def _ws_get_statistics_during_period(
     hass: HomeAssistant,
-    msg_id: int,
     start_time: dt,
     end_time: dt | None,
     statistic_ids: set[str] | None,
@@ -168,7 +168,27 @@ def _ws_get_statistics_during_period(
             row["end"] = int(row["end"] * 1000)
             if include_last_reset and (last_reset := row["last_reset"]) is not None:
                 row["last_reset"] = int(last_reset * 1000)
-    return json_bytes(messages.result_message(msg_id, result))
+    return json_bytes(result)
+
+
+def _statistics_query_time(
+    time: dt | None, period: Literal["5minute", "day", "hour", "week", "month"]
+) -> dt | None:
+    """Round a time up to the start of the next statistics row.
+
+    Statistics rows start at whole 5 minutes or hours so the rounded
+    time returns the same rows. Days, weeks and months are aligned
+    with the local period when the statistics are fetched.
+    """
+    if time is None or period not in ("5minute", "hour"):
+        return time
+    table: type[Statistics | StatisticsShortTerm] = (
+        StatisticsShortTerm if period == "5minute" else Statistics
+    )
+    duration = table.duration.total_seconds()
+    if remainder := (timestamp := time.timestamp()) % duration:
+        return dt_util.utc_from_timestamp(timestamp - remainder + duration)
+    return time
 
 
 async def ws_handle_get_statistics_during_period(
@@ -195,19 +215,35 @@ async def ws_handle_get_statistics_during_period(
 
     if (types := msg.get("types")) is None:
         types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
-    connection.send_message(
-        await get_instance(hass).async_add_executor_job(
-            _ws_get_statistics_during_period,
-            hass,
-            msg["id"],
+    period = msg["period"]
+    start_time = _statistics_query_time(start_time, period)
+    end_time = _statistics_query_time(end_time, period)
+    statistic_ids = frozenset(msg["statistic_ids"])
+    units = msg.get("units")
+    instance = get_instance(hass)
+    # Identical requests, e.g. from several dashboards opened at
+    # the same time, share one query
+    payload = await instance.query_cache.async_get(
+        (
+            "statistics_during_period",
             start_time,
             end_time,
-            set(msg["statistic_ids"]),
-            msg.get("period"),
-            msg.get("units"),
-            types,
-        )
+            statistic_ids,
+            period,
+            frozenset(units.items()) if units else None,
+            frozenset(types),
+        ),
+        instance.statistics_generation,
+        _ws_get_statistics_during_period,
+        hass,
+        start_time,
+        end_time,
+        set(statistic_ids),
+        period,
+        units,
+        types,
     )
+    connection.send_message(messages.construct_result_message(msg["id"], payload))
 
 
 @websocket_api.websocket_command(
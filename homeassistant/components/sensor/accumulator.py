@@ -0,0 +1,308 @@
+"""Running aggregate of sensor states for short-term statistics."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import datetime
+import logging
+import math
+import threading
+
+from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.typing import UNDEFINED, UndefinedType
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import ATTR_STATE_CLASS, DOMAIN, SensorStateClass
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STATISTICS_ACCUMULATOR: HassKey[SensorStatisticsAccumulator] = HassKey(
+    f"{DOMAIN}_statistics_accumulator"
+)
+
+PERIOD_SECONDS = StatisticsShortTerm.duration.total_seconds()
+
+_ENTITY_ID_PREFIX = f"{DOMAIN}."
+_SUM_STATE_CLASSES = {SensorStateClass.TOTAL, SensorStateClass.TOTAL_INCREASING}
+
+
+@dataclass(slots=True)
+class PeriodSummary:
+    """Summary of the float states of a sensor during a period.
+
+    Sensors with a sum keep every float state since detecting resets
+    needs the full sequence. For all other sensors only the running
+    time-weighted aggregate is kept, state is the first float state
+    of the period and is only used to look up the unit.
+    """
+
+    has_sum: bool
+    state: State
+    min: float = 0.0
+    max: float = 0.0
+    mean: float = 0.0
+    float_states: list[tuple[float, State]] | None = None
+
+
+def _float_or_none(state: State) -> float | None:
+    """Return the state as a finite float or None."""
+    try:
+        value = float(state.state)
+    except (ValueError, TypeError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _has_sum(state: State) -> bool:
+    """Return if statistics for the state are compiled as a sum."""
+    return state.attributes.get(ATTR_STATE_CLASS) in _SUM_STATE_CLASSES
+
+
+class _PeriodAggregate:
+    """Running aggregate of the float states of one sensor in one period."""
+
+    __slots__ = (
+        "start_ts",
+        "has_sum",
+        "valid",
+        "prior_state",
+        "unit",
+        "state",
+        "min",
+        "max",
+        "accumulated",
+        "first_ts",
+        "last_ts",
+        "last_value",
+        "float_states",
+    )
+
+    def __init__(self, start_ts: float, has_sum: bool) -> None:
+        """Initialize the aggregate."""
+        self.start_ts = start_ts
+        self.has_sum = has_sum
+        self.valid = True
+        self.prior_state: State | None = None
+        self.unit: str | None | UndefinedType = UNDEFINED
+        self.state: State | None = None
+        self.min = 0.0
+        self.max = 0.0
+        self.accumulated = 0.0
+        self.first_ts = 0.0
+        self.last_ts = 0.0
+        self.last_value = 0.0
+        self.float_states: list[tuple[float, State]] = []
+
+    def add(self, state: State) -> None:
+        """Add a state that was current during the period."""
+        if (value := _float_or_none(state)) is None:
+            return
+        if self.has_sum:
+            self.float_states.append((value, state))
+            return
+        unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        # The state before the period started counts from the start
+        timestamp = max(state.last_updated_timestamp, self.start_ts)
+        if self.state is None:
+            self.state = state
+            self.unit = unit
+            self.min = self.max = value
+            self.first_ts = timestamp
+        else:
+            if unit != self.unit:
+                # Mixed units need per state conversion
+                self.valid = False
+            self.accumulated += self.last_value * (timestamp - self.last_ts)
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+        self.last_value = value
+        self.last_ts = timestamp
+
+    def summary(self, end_ts: float) -> PeriodSummary | None:
+        """Return the summary of the period or None if there are no float states."""
+        if self.has_sum:
+            if not self.float_states:
+                return None
+            return PeriodSummary(
+                True, self.float_states[0][1], float_states=self.float_states
+            )
+        if (state := self.state) is None:
+            return None
+        accumulated = self.accumulated + self.last_value * (end_ts - self.last_ts)
+        # If the only state change happened at the exact end
+        # of the period we can't calculate a meaningful average
+        period_seconds = end_ts - self.first_ts
+        mean = accumulated / period_seconds if period_seconds else 0.0
+        return PeriodSummary(False, state, self.min, self.max, mean)
+
+
+class _EntityTrack:
+    """Periods and last known state of a sensor."""
+
+    __slots__ = ("last_state", "periods")
+
+    def __init__(self, last_state: State | None) -> None:
+        """Initialize the track."""
+        self.last_state = last_state
+        self.periods: dict[float, _PeriodAggregate] = {}
+
+    def add(self, state: State) -> None:
+        """Add a new state of the sensor."""
+        significant = state.last_changed_timestamp == state.last_updated_timestamp
+        start_ts = state.last_updated_timestamp // PERIOD_SECONDS * PERIOD_SECONDS
+        periods = self.periods
+        if (period := periods.get(start_ts)) is None:
+            if periods and start_ts < next(reversed(periods)):
+                # States arrived out of order, the periods can't be trusted
+                for period in periods.values():
+                    period.valid = False
+            period = periods[start_ts] = self._new_period(start_ts, _has_sum(state))
+        elif period.has_sum != _has_sum(state):
+            period.valid = False
+        # Statistics of sensors without a sum are compiled from
+        # significant states only, attribute changes are ignored
+        if period.has_sum or significant:
+            period.add(state)
+        self.last_state = state
+
+    def _new_period(self, start_ts: float, has_sum: bool) -> _PeriodAggregate:
+        """Create a period which starts with the last known state."""
+        period = _PeriodAggregate(start_ts, has_sum)
+        if (prior_state := self.last_state) is not None:
+            period.prior_state = prior_state
+            period.add(prior_state)
+        return period
+
+    def state_at(self, start_ts: float) -> State | None:
+        """Return the last state before start_ts if there were no changes since."""
+        for period_start_ts, period in self.periods.items():
+            if period_start_ts > start_ts:
+                # The first change after start_ts, its period
+                # started with the state we are looking for
+                return period.prior_state
+        return self.last_state
+
+
+class SensorStatisticsAccumulator:
+    """Keep a running aggregate of sensor states for each short-term period.
+
+    The accumulator is fed from state_changed events in the event loop
+    and read from the recorder thread when short-term statistics are
+    compiled. Periods which started before the accumulator was started
+    or which were already pruned are not covered and the caller must
+    fall back to querying the database.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the accumulator."""
+        self._hass = hass
+        self._lock = threading.Lock()
+        self._entities: dict[str, _EntityTrack] = {}
+        # Periods starting before this timestamp are not covered
+        self._covered_from_ts = math.inf
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start listening for state changes."""
+        if self._unsub is not None:
+            return
+        self._unsub = self._hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=_async_is_sensor_event,
+        )
+        with self._lock:
+            self._covered_from_ts = dt_util.utcnow().timestamp()
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Add a new state to the running aggregate."""
+        entity_id = event.data["entity_id"]
+        new_state = event.data["new_state"]
+        with self._lock:
+            if new_state is None:
+                self._entities.pop(entity_id, None)
+                return
+            if (track := self._entities.get(entity_id)) is None:
+                track = self._entities[entity_id] = _EntityTrack(
+                    event.data["old_state"]
+                )
+            track.add(new_state)
+
+    def summarize(
+        self,
+        sensor_states: list[State],
+        start: datetime.datetime,
+        end: datetime.datetime,
+    ) -> dict[str, PeriodSummary | None] | None:
+        """Return the summaries of the sensors for the period and prune older periods.
+
+        Returns None if the period is not covered. Sensors which are
+        missing from the result must be compiled from the database.
+        A value of None means the sensor did not have any float states.
+        """
+        start_ts = start.timestamp()
+        end_ts = end.timestamp()
+        summaries: dict[str, PeriodSummary | None] = {}
+        period: _PeriodAggregate | None
+        with self._lock:
+            if start_ts < self._covered_from_ts:
+                return None
+            entities = self._entities
+            for state in sensor_states:
+                entity_id = state.entity_id
+                has_sum = _has_sum(state)
+                if (track := entities.get(entity_id)) is None:
+                    # No changes since the accumulator was started
+                    # so the state machine has the state we need
+                    if state.last_updated_timestamp >= start_ts:
+                        continue
+                    period = _PeriodAggregate(start_ts, has_sum)
+                    period.add(state)
+                elif (period := track.periods.get(start_ts)) is None:
+                    period = _PeriodAggregate(start_ts, has_sum)
+                    if prior_state := track.state_at(start_ts):
+                        period.add(prior_state)
+                if not period.valid or period.has_sum != has_sum:
+                    continue
+                summaries[entity_id] = period.summary(end_ts)
+            for track in entities.values():
+                for period_start_ts in list(track.periods):
+                    if period_start_ts >= start_ts:
+                        break
+                    del track.periods[period_start_ts]
+            self._covered_from_ts = max(self._covered_from_ts, start_ts)
+        return summaries
+
+
+@callback
+def _async_is_sensor_event(event_data: EventStateChangedData) -> bool:
+    """Return if the state_changed event is for a sensor."""
+    return event_data["entity_id"].startswith(_ENTITY_ID_PREFIX)
+
+
+def get_accumulator(hass: HomeAssistant) -> SensorStatisticsAccumulator:
+    """Return the accumulator, starting it on first use.
+
+    This is called from the recorder thread, the listener is added
+    in the event loop so the first periods are compiled from the
+    database.
+    """
+    if (accumulator := hass.data.get(DATA_STATISTICS_ACCUMULATOR)) is None:
+        accumulator = hass.data[DATA_STATISTICS_ACCUMULATOR] = (
+            SensorStatisticsAccumulator(hass)
+        )
+        _LOGGER.debug("Starting the sensor statistics accumulator")
+        hass.loop.call_soon_threadsafe(accumulator.async_start)
+    return accumulator
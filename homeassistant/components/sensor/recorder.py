@@ -38,6 +38,7 @@ from homeassistant.loader import async_suggest_report_issue
 from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
+from .accumulator import PeriodSummary, get_accumulator
 from .const import (
     ATTR_LAST_RESET,
     ATTR_STATE_CLASS,
@@ -141,6 +142,18 @@ def _time_weighted_average(
     return accumulated / period_seconds
 
 
+def _summary_to_float_states(summary: PeriodSummary) -> list[tuple[float, State]]:
+    """Return the float states of a period summary.
+
+    Summaries of sensors without a sum are returned as min, max and mean
+    so they can be normalized like any other list of float states.
+    """
+    if summary.float_states is not None:
+        return summary.float_states
+    state = summary.state
+    return [(summary.min, state), (summary.max, state), (summary.mean, state)]
+
+
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
     """Return a set of all units."""
     return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
@@ -400,9 +413,16 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
+    # Use the running aggregate if it covers the period,
+    # the database is only queried for the remaining sensors
+    summaries: dict[str, PeriodSummary | None] = (
+        get_accumulator(hass).summarize(sensor_states, start, end) or {}
+    )
     # Get history between start and end
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        i.entity_id
+        for i in sensor_states
+        if "sum" in wanted_statistics[i.entity_id] and i.entity_id not in summaries
     ]
     history_list: dict[str, list[State]] = {}
     if entities_full_history:
@@ -417,7 +437,7 @@ def compile_statistics(  # noqa: C901
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
-        if "sum" not in wanted_statistics[i.entity_id]
+        if "sum" not in wanted_statistics[i.entity_id] and i.entity_id not in summaries
     ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
@@ -432,6 +452,12 @@ def compile_statistics(  # noqa: C901
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if entity_id in summaries:
+            if summary := summaries[entity_id]:
+                entities_with_float_states[entity_id] = _summary_to_float_states(
+                    summary
+                )
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
         if not (entity_history := history_list.get(entity_id, [_state])):
@@ -512,17 +538,30 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
+        if (summary := summaries.get(entity_id)) and not summary.has_sum:
+            # The running aggregate was normalized as min, max and mean
+            assert len(valid_float_states) == 3
+            _min = valid_float_states[0][0]
+            _max = valid_float_states[1][0]
+            _mean = valid_float_states[2][0]
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = _max
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = _min
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = _mean
+        else:
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = max(
+                    *itertools.islice(zip(*valid_float_states, strict=False), 1)
+                )
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = min(
+                    *itertools.islice(zip(*valid_float_states, strict=False), 1)
+                )
 
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = _time_weighted_average(valid_float_states, start, end)
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
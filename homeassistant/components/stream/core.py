@@ -102,6 +102,8 @@ class Segment:
     hls_num_parts_rendered: int = 0
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = False
+    # Data of all parts once the segment is complete
+    _data: bytes | None = None
 
     def __post_init__(self) -> None:
         """Run after init."""
@@ -139,8 +141,16 @@ class Segment:
             output.part_put()
 
     def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
-        return b"".join([part.data for part in self.parts])
+        """Return reconstructed data for all parts as bytes, without init.
+
+        The data of a complete segment is joined only once.
+        """
+        if (data := self._data) is not None:
+            return data
+        data = b"".join([part.data for part in self.parts])
+        if self.complete:
+            self._data = data
+        return data
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
         """Render the HLS playlist section for the Segment.
@@ -285,7 +295,8 @@ class StreamOutput:
         self.stream_settings = stream_settings
         self.dynamic_stream_settings = dynamic_stream_settings
         self._event = asyncio.Event()
-        self._part_event = asyncio.Event()
+        # Shared by all requests waiting for the next part
+        self._part_future: asyncio.Future[None] | None = None
         self._segments: deque[Segment] = deque(maxlen=deque_maxlen)
 
     @property
@@ -330,19 +341,23 @@ class StreamOutput:
         return self._segments
 
     async def part_recv(self, timeout: float | None = None) -> bool:
-        """Wait for an event signalling the latest part segment."""
+        """Wait for the next part segment."""
+        if (part_future := self._part_future) is None:
+            part_future = self._part_future = self._hass.loop.create_future()
         try:
             async with asyncio.timeout(timeout):
-                await self._part_event.wait()
+                # Shield the future so a request timing out or going
+                # away does not cancel it for the other requests
+                await asyncio.shield(part_future)
         except TimeoutError:
             return False
         return True
 
     def part_put(self) -> None:
-        """Set event signalling the latest part segment."""
-        # Start idle timeout when we start receiving data
-        self._part_event.set()
-        self._part_event.clear()
+        """Wake up the requests waiting for the next part segment."""
+        if (part_future := self._part_future) is not None:
+            self._part_future = None
+            part_future.set_result(None)
 
     async def recv(self) -> bool:
         """Wait for the latest segment."""
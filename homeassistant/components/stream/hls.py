@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from http import HTTPStatus
 from typing import TYPE_CHECKING, cast
 
@@ -64,6 +65,10 @@ class HlsStreamOutput(StreamOutput):
             deque_maxlen=MAX_SEGMENTS,
         )
         self._target_duration = stream_settings.min_segment_duration
+        # The rendered playlist and the state of the last segment it
+        # was rendered for, shared by all viewers
+        self._playlist: bytes | None = None
+        self._playlist_key: tuple[Segment, int, float] | None = None
 
     @property
     def name(self) -> str:
@@ -74,12 +79,35 @@ class HlsStreamOutput(StreamOutput):
         """Handle cleanup."""
         super().cleanup()
         self._segments.clear()
+        self._playlist = self._playlist_key = None
 
     @property
     def target_duration(self) -> float:
         """Return the target duration."""
         return self._target_duration
 
+    def get_playlist(self, render: Callable[[HlsStreamOutput], str]) -> bytes:
+        """Return the encoded playlist, rendering it only if it changed.
+
+        The playlist only changes when a segment or part is added to the
+        end of the stream or the last segment is completed, so it is
+        cached by the last segment, its number of parts and duration.
+        """
+        last_segment = self._segments[-1]
+        num_parts = len(last_segment.parts)
+        duration = last_segment.duration
+        if (
+            (playlist := self._playlist) is None
+            or (playlist_key := self._playlist_key) is None
+            # Segments compare by value, only the same segment is a hit
+            or playlist_key[0] is not last_segment
+            or playlist_key[1] != num_parts
+            or playlist_key[2] != duration
+        ):
+            playlist = self._playlist = render(self).encode("utf-8")
+            self._playlist_key = (last_segment, num_parts, duration)
+        return playlist
+
     @callback
     def _async_put(self, segment: Segment) -> None:
         """Async put and also update the target duration.
@@ -325,7 +353,7 @@ class HlsPlaylistView(StreamView):
                 return self.not_found(blocking_request, track.target_duration)
 
         response = web.Response(
-            body=self.render(track).encode("utf-8"),
+            body=track.get_playlist(self.render),
             headers={
                 "Content-Type": FORMAT_CONTENT_TYPE[HLS_PROVIDER],
             },
@@ -6,6 +6,7 @@ from collections.abc import Callable
 from functools import lru_cache, partial
 import json
 import logging
+from operator import attrgetter
 from typing import Any, cast
 
 import voluptuous as vol
@@ -65,6 +66,8 @@ from homeassistant.util.json import format_unserializable_data
 from . import const, decorators, messages
 from .connection import ActiveConnection
 from .messages import construct_result_message
+from .states_snapshot import async_get_states_snapshot
+from .string_table import StringTableCursor, async_get_string_table
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 
@@ -330,6 +333,16 @@ def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
+    user = connection.user
+    if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
+        try:
+            payload = async_get_states_snapshot(hass).async_get_payload()
+        except (ValueError, TypeError):
+            pass
+        else:
+            connection.send_message(construct_result_message(msg["id"], payload))
+            return
+
     states = _async_get_allowed_states(hass, connection)
 
     try:
@@ -374,6 +387,7 @@ def _forward_entity_changes(
     entity_filter: Callable[[str], bool] | None,
     user: User,
     message_id_as_bytes: bytes,
+    string_table_cursor: StringTableCursor | None,
     event: Event[EventStateChangedData],
 ) -> None:
     """Forward entity state changed events to websocket."""
@@ -391,6 +405,22 @@ def _forward_entity_changes(
         and not permissions.check_entity(entity_id, POLICY_READ)
     ):
         return
+    if (
+        string_table_cursor is not None
+        and event.data["old_state"] is None
+        and (new_state := event.data["new_state"]) is not None
+    ):
+        try:
+            serialized_state = string_table_cursor.compressed_state_json(new_state)
+        except (ValueError, TypeError):
+            pass
+        else:
+            send_message(
+                _entities_add_message(
+                    message_id_as_bytes, string_table_cursor, [serialized_state]
+                )
+            )
+            return
     send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
 
 
@@ -415,6 +445,13 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
+    string_table_cursor: StringTableCursor | None = None
+    compressed_state_json: Callable[[State], bytes] = attrgetter(
+        "as_compressed_state_json"
+    )
+    if const.FEATURE_INTERNED_STRINGS in connection.supported_features:
+        string_table_cursor = StringTableCursor(async_get_string_table(hass))
+        compressed_state_json = string_table_cursor.compressed_state_json
     connection.subscriptions[msg_id] = hass.bus.async_listen(
         EVENT_STATE_CHANGED,
         partial(
@@ -424,6 +461,7 @@ def handle_subscribe_entities(
             entity_filter,
             connection.user,
             message_id_as_bytes,
+            string_table_cursor,
         ),
     )
     connection.send_result(msg_id)
@@ -434,26 +472,28 @@ def handle_subscribe_entities(
     try:
         if entity_ids or entity_filter:
             serialized_states = [
-                state.as_compressed_state_json
+                compressed_state_json(state)
                 for state in states
                 if (not entity_ids or state.entity_id in entity_ids)
                 and (not entity_filter or entity_filter(state.entity_id))
             ]
         else:
             # Fast path when not filtering
-            serialized_states = [state.as_compressed_state_json for state in states]
+            serialized_states = [compressed_state_json(state) for state in states]
     except (ValueError, TypeError):
         pass
     else:
-        _send_handle_entities_init_response(
-            connection, message_id_as_bytes, serialized_states
+        connection.send_message(
+            _entities_add_message(
+                message_id_as_bytes, string_table_cursor, serialized_states
+            )
         )
         return
 
     serialized_states = []
     for state in states:
         try:
-            serialized_states.append(state.as_compressed_state_json)
+            serialized_states.append(compressed_state_json(state))
         except (ValueError, TypeError):
             connection.logger.error(
                 "Unable to serialize to JSON. Bad data found at %s",
@@ -462,26 +502,32 @@ def handle_subscribe_entities(
                 ),
             )
 
-    _send_handle_entities_init_response(
-        connection, message_id_as_bytes, serialized_states
+    connection.send_message(
+        _entities_add_message(
+            message_id_as_bytes, string_table_cursor, serialized_states
+        )
     )
 
 
-def _send_handle_entities_init_response(
-    connection: ActiveConnection,
+def _entities_add_message(
     message_id_as_bytes: bytes,
+    string_table_cursor: StringTableCursor | None,
     serialized_states: list[bytes],
-) -> None:
-    """Send handle entities init response."""
-    connection.send_message(
-        b"".join(
-            (
-                b'{"id":',
-                message_id_as_bytes,
-                b',"type":"event","event":{"a":{',
-                b",".join(serialized_states),
-                b"}}}",
-            )
+) -> bytes:
+    """Return a subscribe entities event message adding the states.
+
+    Strings the connection has not received yet are added to the message
+    when the states reference the string table.
+    """
+    return b"".join(
+        (
+            b'{"id":',
+            message_id_as_bytes,
+            b',"type":"event","event":{',
+            string_table_cursor.additions_json() if string_table_cursor else b"",
+            b'"a":{',
+            b",".join(serialized_states),
+            b"}}}",
         )
     )
 
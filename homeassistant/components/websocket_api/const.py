@@ -34,6 +34,21 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Once messages to a connection which coalesces messages are queued
+# faster than BATCH_MIN_RATE per second, they are held back until about
+# BATCH_TARGET_SIZE messages are expected to be queued, but at most for
+# BATCH_MAX_DELAY seconds or until BATCH_MAX_BYTES are queued.
+BATCH_MIN_RATE: Final = 100
+BATCH_TARGET_SIZE: Final = 64
+BATCH_MAX_DELAY: Final = 0.05
+BATCH_MAX_BYTES: Final = 65536
+# Weight of the latest sample in the moving average of the message rate
+BATCH_RATE_SMOOTHING: Final = 0.25
+
+# Messages of at least this size are sent as zlib compressed binary
+# frames to connections supporting FEATURE_COMPRESSED_MESSAGES
+COMPRESSED_MESSAGE_MIN_SIZE: Final = 16384
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -58,3 +73,9 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+# Large messages are sent as zlib compressed JSON in binary frames
+# unless the permessage-deflate extension is already in use
+FEATURE_COMPRESSED_MESSAGES = "compressed_messages"
+# Static attributes in the states of subscribe_entities reference
+# a table of strings which is sent once per connection
+FEATURE_INTERNED_STRINGS = "interned_strings"
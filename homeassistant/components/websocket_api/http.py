@@ -9,6 +9,7 @@ import datetime as dt
 from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
 from aiohttp.http_websocket import WebSocketWriter
@@ -19,11 +20,19 @@ from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
+    BATCH_MAX_BYTES,
+    BATCH_MAX_DELAY,
+    BATCH_MIN_RATE,
+    BATCH_RATE_SMOOTHING,
+    BATCH_TARGET_SIZE,
+    COMPRESSED_MESSAGE_MIN_SIZE,
     DATA_CONNECTIONS,
+    DOMAIN,
     MAX_PENDING_MSG,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
@@ -42,6 +51,53 @@ if TYPE_CHECKING:
 
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
 
+DATA_BATCH_METRICS: HassKey[BatchMetrics] = HassKey(f"{DOMAIN}.batch_metrics")
+
+
+class BatchMetrics:
+    """Size and latency of the batches of messages released to the writers.
+
+    The latency is the time between queueing the first message of a
+    batch and releasing the batch to the writer.
+    """
+
+    __slots__ = ("batches", "messages", "max_size", "total_latency", "max_latency")
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.batches = 0
+        self.messages = 0
+        self.max_size = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    @callback
+    def async_record(self, size: int, latency: float) -> None:
+        """Record a released batch."""
+        self.batches += 1
+        self.messages += size
+        self.total_latency += latency
+        self.max_size = max(size, self.max_size)
+        self.max_latency = max(latency, self.max_latency)
+
+    @property
+    def mean_size(self) -> float:
+        """Return the mean number of messages per batch."""
+        return self.messages / self.batches if self.batches else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Return the mean latency of the batches in seconds."""
+        return self.total_latency / self.batches if self.batches else 0.0
+
+
+@callback
+def async_get_batch_metrics(hass: HomeAssistant) -> BatchMetrics:
+    """Return the batch metrics of all connections."""
+    if (metrics := hass.data.get(DATA_BATCH_METRICS)) is None:
+        metrics = hass.data[DATA_BATCH_METRICS] = BatchMetrics()
+    return metrics
+
 
 class WebsocketAPIView(HomeAssistantView):
     """View to serve a websockets endpoint."""
@@ -82,6 +138,13 @@ class WebSocketHandler:
         "_message_queue",
         "_ready_future",
         "_release_ready_queue_size",
+        "_drained",
+        "_batch_metrics",
+        "_batch_start",
+        "_batch_size",
+        "_batch_bytes",
+        "_batch_timer",
+        "_message_rate",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -105,6 +168,19 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        # Set while the writer has written every queued message
+        self._drained = asyncio.Event()
+        self._drained.set()
+
+        # Adaptive batching of messages for connections which coalesce
+        self._batch_metrics = async_get_batch_metrics(hass)
+        self._batch_start: float = 0.0
+        # Number of messages queued since the batch started
+        self._batch_size: int = 0
+        self._batch_bytes: int = 0
+        self._batch_timer: asyncio.TimerHandle | None = None
+        # Moving average of the messages queued per second
+        self._message_rate: float = 0.0
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -128,21 +204,28 @@ class WebSocketHandler:
         self,
         connection: ActiveConnection,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> None:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
         message_queue = self._message_queue
+        drained = self._drained
         logger = self._logger
         wsock = self._wsock
         loop = self._loop
         is_debug_log_enabled = partial(logger.isEnabledFor, logging.DEBUG)
         debug = logger.debug
         can_coalesce = connection.can_coalesce
+        # Compressing again is wasted effort if
+        # permessage-deflate was negotiated
+        transport_compressed = bool(wsock.compress)
+        can_compress = False
         ready_message_count = len(message_queue)
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
             while not wsock.closed:
                 if not message_queue:
+                    drained.set()
                     self._ready_future = loop.create_future()
                     ready_message_count = await self._ready_future
 
@@ -153,18 +236,24 @@ class WebSocketHandler:
                     # coalesce may be enabled later in the connection
                     can_coalesce = connection.can_coalesce
 
+                if not can_compress:
+                    # compression may be enabled later in the connection
+                    can_compress = connection.can_compress and not transport_compressed
+
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
-                    if is_debug_log_enabled():
-                        debug("%s: Sending %s", self.description, message)
-                    await send_bytes_text(message)
-                    continue
+                else:
+                    message = b"".join((b"[", b",".join(message_queue), b"]"))
+                    message_queue.clear()
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
-                message_queue.clear()
                 if is_debug_log_enabled():
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                    debug("%s: Sending %s", self.description, message)
+                if can_compress and len(message) >= COMPRESSED_MESSAGE_MIN_SIZE:
+                    await send_bytes_binary(
+                        await self._hass.async_add_executor_job(zlib.compress, message)
+                    )
+                else:
+                    await send_bytes_text(message)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -203,6 +292,8 @@ class WebSocketHandler:
 
         message_queue = self._message_queue
         message_queue.append(message)
+        self._drained.clear()
+        self._batch_size += 1
         if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
             self._logger.error(
                 (
@@ -220,7 +311,15 @@ class WebSocketHandler:
         if self._release_ready_queue_size == 0:
             # Try to coalesce more messages to reduce the number of writes
             self._release_ready_queue_size = queue_size_after_add
-            self._loop.call_soon(self._release_ready_future_or_reschedule)
+            self._async_start_batch(len(message))
+        elif self._batch_timer is not None:
+            self._batch_bytes += len(message)
+            if (
+                self._batch_bytes >= BATCH_MAX_BYTES
+                or queue_size_after_add >= PENDING_MSG_MAX_FORCE_READY
+            ):
+                self._batch_timer.cancel()
+                self._release_batch()
 
         peak_checker_active = self._peak_checker_unsub is not None
 
@@ -234,6 +333,65 @@ class WebSocketHandler:
                 self._hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    @callback
+    def _async_start_batch(self, message_size: int) -> None:
+        """Start collecting a batch of messages.
+
+        Connections which coalesce messages hold the batch back for a
+        delay adapted to the rate messages were queued at recently,
+        all others release it once the queue stops growing.
+        """
+        loop = self._loop
+        now = loop.time()
+        if interval := now - self._batch_start:
+            # The batch size includes the message starting this batch
+            self._message_rate += (
+                (self._batch_size - 1) / interval - self._message_rate
+            ) * BATCH_RATE_SMOOTHING
+        self._batch_start = now
+        self._batch_size = 1
+        if (
+            self._message_rate < BATCH_MIN_RATE
+            or (connection := self._connection) is None
+            or not connection.can_coalesce
+        ):
+            loop.call_soon(self._release_ready_future_or_reschedule)
+            return
+        self._batch_bytes = message_size
+        self._batch_timer = loop.call_at(
+            now + min(BATCH_MAX_DELAY, BATCH_TARGET_SIZE / self._message_rate),
+            self._release_batch,
+        )
+
+    @callback
+    def _release_batch(self) -> None:
+        """Release a batch which was held back."""
+        self._batch_timer = None
+        self._release_ready_future()
+
+    @callback
+    def _cancel_batch_timer(self) -> None:
+        """Cancel the release of a batch which is held back."""
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+
+    @callback
+    def _release_ready_future(self) -> None:
+        """Release the ready future and record the batch."""
+        self._release_ready_queue_size = 0
+        if (
+            not (ready_future := self._ready_future)
+            or ready_future.done()
+            or not (queue_size := len(self._message_queue))
+        ):
+            # The writer is busy and picks up the messages when it is done
+            return
+        self._batch_metrics.async_record(
+            queue_size, self._loop.time() - self._batch_start
+        )
+        ready_future.set_result(queue_size)
+
     @callback
     def _release_ready_future_or_reschedule(self) -> None:
         """Release the ready future or reschedule.
@@ -244,9 +402,7 @@ class WebSocketHandler:
         If we reach PENDING_MSG_MAX_FORCE_READY, we will release the ready future
         immediately so avoid the coalesced messages from growing too large.
         """
-        if not (ready_future := self._ready_future) or not (
-            queue_size := len(self._message_queue)
-        ):
+        if not self._ready_future or not (queue_size := len(self._message_queue)):
             self._release_ready_queue_size = 0
             return
         # If we are below the max pending to force ready, and there are new messages
@@ -256,9 +412,7 @@ class WebSocketHandler:
             self._release_ready_queue_size = queue_size
             self._loop.call_soon(self._release_ready_future_or_reschedule)
             return
-        self._release_ready_queue_size = 0
-        if not ready_future.done():
-            ready_future.set_result(queue_size)
+        self._release_ready_future()
 
     @callback
     def _check_write_peak(self, _utc_time: dt.datetime) -> None:
@@ -285,7 +439,10 @@ class WebSocketHandler:
     def _cancel(self) -> None:
         """Cancel the connection."""
         self._closing = True
+        # Nothing more will be written, release anyone waiting for it
+        self._drained.set()
         self._cancel_peak_checker()
+        self._cancel_batch_timer()
         if self._handle_task is not None:
             self._handle_task.cancel()
         if self._writer_task is not None:
@@ -329,6 +486,7 @@ class WebSocketHandler:
             assert writer is not None
 
         send_bytes_text = partial(writer.send, binary=False)
+        send_bytes_binary = partial(writer.send, binary=True)
         auth = AuthPhase(
             logger, hass, self._send_message, self._cancel, request, send_bytes_text
         )
@@ -336,7 +494,9 @@ class WebSocketHandler:
         disconnect_warn: str | None = None
 
         try:
-            connection = await self._async_handle_auth_phase(auth, send_bytes_text)
+            connection = await self._async_handle_auth_phase(
+                auth, send_bytes_text, send_bytes_binary
+            )
             self._async_increase_writer_limit(writer)
             await self._async_websocket_command_phase(connection, send_bytes_text)
         except asyncio.CancelledError:
@@ -355,11 +515,13 @@ class WebSocketHandler:
             unsub_stop()
 
             self._cancel_peak_checker()
+            self._cancel_batch_timer()
 
             if connection is not None:
                 connection.async_handle_close()
 
             self._closing = True
+            self._drained.set()
             if self._ready_future and not self._ready_future.done():
                 self._ready_future.set_result(len(self._message_queue))
 
@@ -371,6 +533,7 @@ class WebSocketHandler:
         self,
         auth: AuthPhase,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> ActiveConnection:
         """Handle the auth phase of the websocket connection."""
         await send_bytes_text(AUTH_REQUIRED_MESSAGE)
@@ -401,7 +564,10 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
-        self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
+        connection.drained = self._drained
+        self._writer_task = create_eager_task(
+            self._writer(connection, send_bytes_text, send_bytes_binary)
+        )
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
 
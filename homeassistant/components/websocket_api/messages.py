@@ -78,6 +78,19 @@ def construct_result_message(iden: int, payload: bytes) -> bytes:
     )
 
 
+def construct_event_message(iden: int, payload: bytes) -> bytes:
+    """Construct an event message JSON."""
+    return b"".join(
+        (
+            b'{"id":',
+            str(iden).encode(),
+            b',"type":"event","event":',
+            payload,
+            b"}",
+        )
+    )
+
+
 def error_message(
     iden: int | None,
     code: str,
@@ -0,0 +1,60 @@
+"""Shared serialized snapshot of all states for get_states."""
+
+from __future__ import annotations
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+DATA_STATES_SNAPSHOT: HassKey[StatesSnapshot] = HassKey(f"{DOMAIN}.states_snapshot")
+
+
+class StatesSnapshot:
+    """JSON array of all states, shared by every connection.
+
+    The array is built on first use and dropped on the next state
+    change, so clients requesting all states at the same time, as they
+    do when reconnecting after a restart, join the states only once.
+    """
+
+    __slots__ = ("_hass", "_payload")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the snapshot."""
+        self._hass = hass
+        self._payload: bytes | None = None
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Invalidate the snapshot."""
+        self._payload = None
+
+    @callback
+    def async_get_payload(self) -> bytes:
+        """Return the JSON array of all states.
+
+        Raises ValueError or TypeError if a state can't be serialized,
+        the snapshot is not cached in that case.
+        """
+        if (payload := self._payload) is None:
+            payload = self._payload = b"".join(
+                (
+                    b"[",
+                    b",".join(
+                        [state.as_dict_json for state in self._hass.states.async_all()]
+                    ),
+                    b"]",
+                )
+            )
+        return payload
+
+
+@callback
+def async_get_states_snapshot(hass: HomeAssistant) -> StatesSnapshot:
+    """Return the states snapshot, creating it on first use."""
+    if (snapshot := hass.data.get(DATA_STATES_SNAPSHOT)) is None:
+        snapshot = hass.data[DATA_STATES_SNAPSHOT] = StatesSnapshot(hass)
+    return snapshot
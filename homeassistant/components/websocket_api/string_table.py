@@ -0,0 +1,149 @@
+"""Interned strings for the compressed states of subscribe_entities."""
+
+from __future__ import annotations
+
+from typing import Any, Final
+
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_FRIENDLY_NAME,
+    ATTR_ICON,
+    ATTR_UNIT_OF_MEASUREMENT,
+    COMPRESSED_STATE_ATTRIBUTES,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+DATA_STRING_TABLE: HassKey[StringTable] = HassKey(f"{DOMAIN}.string_table")
+
+# Attributes which rarely change and are often shared between entities
+INTERNED_ATTRIBUTES: Final = (
+    ATTR_DEVICE_CLASS,
+    ATTR_FRIENDLY_NAME,
+    ATTR_ICON,
+    ATTR_UNIT_OF_MEASUREMENT,
+)
+
+COMPRESSED_STATE_INTERNED_ATTRIBUTES: Final = "ai"
+STRING_TABLE_ADDITIONS: Final = "st"
+
+
+class StringTable:
+    """Append only table of strings shared by all connections.
+
+    String values of INTERNED_ATTRIBUTES are moved from the attributes of
+    a compressed state to its interned attributes and replaced by their
+    index in the table. Since indices never change, compressed states
+    are serialized once for all connections.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the table."""
+        self.strings: list[str] = []
+        self._indices: dict[str, int] = {}
+        self._states: dict[str, tuple[State, bytes]] = {}
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_removed,
+            event_filter=_async_is_state_removed,
+        )
+
+    @callback
+    def _async_state_removed(self, event: Event[EventStateChangedData]) -> None:
+        """Forget the serialized state of a removed entity."""
+        self._states.pop(event.data["entity_id"], None)
+
+    def _intern(self, value: str) -> int:
+        """Return the index of the string, adding it if needed."""
+        if (index := self._indices.get(value)) is None:
+            index = self._indices[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def compressed_state_json(self, state: State) -> bytes:
+        """Build a compressed JSON key value pair of a state with interned strings.
+
+        The result matches State.as_compressed_state_json
+        except for the interned attributes.
+        """
+        entity_id = state.entity_id
+        if (cached := self._states.get(entity_id)) is not None and cached[0] is state:
+            return cached[1]
+        compressed_state: dict[str, Any] = state.as_compressed_state  # type: ignore[assignment]
+        attributes = state.attributes
+        if interned := {
+            key: self._intern(value)
+            for key in INTERNED_ATTRIBUTES
+            if type(value := attributes.get(key)) is str
+        }:
+            compressed_state = {
+                **compressed_state,
+                COMPRESSED_STATE_ATTRIBUTES: {
+                    key: value
+                    for key, value in attributes.items()
+                    if key not in interned
+                },
+                COMPRESSED_STATE_INTERNED_ATTRIBUTES: interned,
+            }
+        serialized = json_bytes({entity_id: compressed_state})[1:-1]
+        self._states[entity_id] = (state, serialized)
+        return serialized
+
+
+class StringTableCursor:
+    """Track the strings of the table a connection has received."""
+
+    __slots__ = ("_table", "_sent")
+
+    def __init__(self, table: StringTable) -> None:
+        """Initialize the cursor."""
+        self._table = table
+        self._sent = 0
+
+    def compressed_state_json(self, state: State) -> bytes:
+        """Build a compressed JSON key value pair of a state with interned strings."""
+        return self._table.compressed_state_json(state)
+
+    def additions_json(self) -> bytes:
+        """Return the strings the connection has not received as a JSON member.
+
+        The member is followed by a comma, an empty bytes
+        string is returned if there are no new strings.
+        """
+        strings = self._table.strings
+        if (sent := self._sent) == len(strings):
+            return b""
+        self._sent = len(strings)
+        return b"".join(
+            (
+                b'"',
+                STRING_TABLE_ADDITIONS.encode(),
+                b'":',
+                json_bytes(strings[sent:]),
+                b",",
+            )
+        )
+
+
+@callback
+def _async_is_state_removed(event_data: EventStateChangedData) -> bool:
+    """Return if the state was removed."""
+    return event_data["new_state"] is None
+
+
+@callback
+def async_get_string_table(hass: HomeAssistant) -> StringTable:
+    """Return the string table, creating it on first use."""
+    if (string_table := hass.data.get(DATA_STRING_TABLE)) is None:
+        string_table = hass.data[DATA_STRING_TABLE] = StringTable(hass)
+    return string_table
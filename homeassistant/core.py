@@ -12,20 +12,23 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Generator,
     Iterable,
     KeysView,
     Mapping,
     ValuesView,
 )
 import concurrent.futures
-from contextlib import suppress
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 import datetime
 import enum
 import functools
 from functools import cached_property
 import inspect
+from itertools import groupby
 import logging
+from operator import itemgetter
 import os
 import pathlib
 import re
@@ -1444,7 +1447,13 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_listeners",
+        "_listeners_version",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1453,6 +1462,8 @@ class EventBus:
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # Incremented whenever a listener is added or removed
+        self._listeners_version = 0
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1563,6 +1574,67 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+    def async_fire_many_internal(
+        self,
+        event_type: EventType[_DataT] | str,
+        events: Iterable[tuple[_DataT, Context | None, float | None]],
+        origin: EventOrigin = EventOrigin.local,
+    ) -> None:
+        """Fire many events of the same type, for internal use only.
+
+        Each event is a tuple of event data, context and time fired.
+        The listeners are looked up once for all events and only looked
+        up again if listeners are added or removed while dispatching.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API. We will make
+        breaking changes to this function in the future and it
+        should not be used in integrations.
+
+        This method must be run in the event loop.
+        """
+        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
+            match_all_listeners = self._match_all_listeners
+        else:
+            match_all_listeners = EMPTY_LIST
+
+        listeners_version: int | None = None
+        listeners: list[_FilterableJobType[Any]] = EMPTY_LIST
+        for event_data, context, time_fired in events:
+            if listeners_version != self._listeners_version:
+                listeners_version = self._listeners_version
+                listeners = (
+                    self._listeners.get(event_type, EMPTY_LIST) + match_all_listeners
+                )
+            if self._debug:
+                _LOGGER.debug(
+                    "Bus:Handling %s", _event_repr(event_type, origin, event_data)
+                )
+
+            event: Event[_DataT] | None = None
+            for job, event_filter in listeners:
+                if event_filter is not None:
+                    try:
+                        if event_data is None or not event_filter(event_data):
+                            continue
+                    except Exception:
+                        _LOGGER.exception("Error in event filter")
+                        continue
+
+                if not event:
+                    event = Event(
+                        event_type,
+                        event_data,
+                        origin,
+                        time_fired,
+                        context,
+                    )
+
+                try:
+                    self._hass.async_run_hass_job(job, event)
+                except Exception:
+                    _LOGGER.exception("Error running job: %s", job)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1634,6 +1706,7 @@ class EventBus:
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type."""
         self._listeners[event_type].append(filterable_job)
+        self._listeners_version += 1
         return functools.partial(
             self._async_remove_listener, event_type, filterable_job
         )
@@ -1715,6 +1788,7 @@ class EventBus:
         """
         try:
             self._listeners[event_type].remove(filterable_job)
+            self._listeners_version += 1
 
             # delete event_type list if empty
             if not self._listeners[event_type] and event_type != MATCH_ALL:
@@ -2035,7 +2109,15 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_batch_depth",
+        "_batched_events",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2046,6 +2128,16 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # Number of open batches and the events they deferred
+        self._batch_depth = 0
+        self._batched_events: list[
+            tuple[
+                EventType[Any],
+                EventStateChangedData | EventStateReportedData,
+                Context | None,
+                float | None,
+            ]
+        ] = []
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2163,6 +2255,11 @@ class StateMachine:
             "old_state": old_state,
             "new_state": None,
         }
+        if self._batch_depth:
+            self._batched_events.append(
+                (EVENT_STATE_CHANGED, state_changed_data, context, None)
+            )
+            return True
         self._bus.async_fire_internal(
             EVENT_STATE_CHANGED,
             state_changed_data,
@@ -2170,6 +2267,38 @@ class StateMachine:
         )
         return True
 
+    @contextmanager
+    def async_batch(self) -> Generator[None]:
+        """Defer the events of the states written in the batch.
+
+        States are written right away, their events are fired together
+        when the outermost batch ends, which looks up the listeners once
+        per event type instead of once per event.
+
+        This method must be run in the event loop.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batched_events:
+                self._async_fire_batched_events()
+
+    @callback
+    def _async_fire_batched_events(self) -> None:
+        """Fire the events deferred by a batch."""
+        batched_events = self._batched_events
+        self._batched_events = []
+        for event_type, events in groupby(batched_events, itemgetter(0)):
+            self._bus.async_fire_many_internal(
+                event_type,
+                [
+                    (event_data, context, time_fired)
+                    for _, event_data, context, time_fired in events
+                ],
+            )
+
     def set(
         self,
         entity_id: str,
@@ -2251,6 +2380,36 @@ class StateMachine:
             timestamp or time.time(),
         )
 
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+    ) -> None:
+        """Set the states of many entities at once.
+
+        States is an iterable of entity_id, state and attributes tuples.
+        All states share the same timestamp and context, their events
+        are fired together once all states are set.
+
+        This method must be run in the event loop.
+        """
+        timestamp = time.time()
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+        with self.async_batch():
+            for entity_id, new_state, attributes in states:
+                self.async_set_internal(
+                    entity_id.lower(),
+                    str(new_state),
+                    attributes or {},
+                    force_update,
+                    context,
+                    None,
+                    timestamp,
+                )
+
     @callback
     def async_set_internal(
         self,
@@ -2285,7 +2444,11 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            # Entities with versioned attributes pass the attributes
+            # of the old state if they did not change
+            same_attr = (
+                attributes is old_state.attributes or old_state.attributes == attributes
+            )
             last_changed = old_state.last_changed if same_state else None
 
         # It is much faster to convert a timestamp to a utc datetime object
@@ -2306,17 +2469,25 @@ class StateMachine:
 
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
-            old_last_reported = old_state.last_reported  # type: ignore[union-attr]
-            old_state.last_reported = now  # type: ignore[union-attr]
-            old_state.last_reported_timestamp = timestamp  # type: ignore[union-attr]
+            if TYPE_CHECKING:
+                assert old_state is not None
+            old_last_reported = old_state.last_reported
+            old_state.last_reported = now
+            old_state.last_reported_timestamp = timestamp
             # Avoid creating an EventStateReportedData
-            self._bus.async_fire_internal(  # type: ignore[misc]
+            state_reported_data: EventStateReportedData = {
+                "entity_id": entity_id,
+                "old_last_reported": old_last_reported,
+                "new_state": old_state,
+            }
+            if self._batch_depth:
+                self._batched_events.append(
+                    (EVENT_STATE_REPORTED, state_reported_data, context, timestamp)
+                )
+                return
+            self._bus.async_fire_internal(
                 EVENT_STATE_REPORTED,
-                {
-                    "entity_id": entity_id,
-                    "old_last_reported": old_last_reported,
-                    "new_state": old_state,
-                },
+                state_reported_data,
                 context=context,
                 time_fired=timestamp,
             )
@@ -2349,6 +2520,11 @@ class StateMachine:
             "old_state": old_state,
             "new_state": state,
         }
+        if self._batch_depth:
+            self._batched_events.append(
+                (EVENT_STATE_CHANGED, state_changed_data, context, timestamp)
+            )
+            return
         self._bus.async_fire_internal(
             EVENT_STATE_CHANGED,
             state_changed_data,
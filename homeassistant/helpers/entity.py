@@ -402,6 +402,7 @@ class ABCCachedProperties(CachedProperties, ABCMeta):
 
 CACHED_PROPERTIES_WITH_ATTR_ = {
     "assumed_state",
+    "attributes_version",
     "attribution",
     "available",
     "capability_attributes",
@@ -520,10 +521,14 @@ class Entity(
     __capabilities_updated_at: deque[float]
     __capabilities_updated_at_reported: bool = False
     __remove_future: asyncio.Future[None] | None = None
+    # The key the attributes of the last write were calculated for
+    # and the attributes of the resulting state
+    __attributes_cache: tuple[tuple[Any, ...], Mapping[str, Any]] | None = None
 
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_attribution: str | None = None
+    _attr_attributes_version: int | None = None
     _attr_available: bool = True
     _attr_capability_attributes: dict[str, Any] | None = None
     _attr_device_class: str | None
@@ -776,6 +781,24 @@ class Entity(
             return self._attr_extra_state_attributes
         return None
 
+    @cached_property
+    def attributes_version(self) -> int | None:
+        """Return the version of the state attributes.
+
+        Entities which know when their attributes change can return a number
+        here which changes whenever any of their attributes, including
+        capability attributes, name, icon, unit of measurement, device class,
+        supported features and availability dependent ones, change. Entities
+        with static attributes return a constant.
+
+        The attributes of the previous write are reused without calculating
+        them again as long as the version, availability, registry entry,
+        device entry and customization stay the same.
+
+        None means the attributes are calculated on every write.
+        """
+        return self._attr_attributes_version
+
     @cached_property
     def device_info(self) -> DeviceInfo | None:
         """Return device specific attributes.
@@ -1040,11 +1063,11 @@ class Entity(
     @callback
     def _async_calculate_state(self) -> CalculatedState:
         """Calculate state string and attribute mapping."""
-        state, attr, capabilities, _, _ = self.__async_calculate_state()
+        state, attr, capabilities, _, _ = self.__async_calculate_state(self.available)
         return CalculatedState(state, attr, capabilities)
 
     def __async_calculate_state(
-        self,
+        self, available: bool
     ) -> tuple[str, dict[str, Any], Mapping[str, Any] | None, str | None, int | None]:
         """Calculate state string and attribute mapping.
 
@@ -1063,7 +1086,6 @@ class Entity(
         capability_attr = self.capability_attributes
         attr = capability_attr.copy() if capability_attr else {}
 
-        available = self.available  # only call self.available once per update cycle
         state = self._stringify_state(available)
         if available:
             if state_attributes := self.state_attributes:
@@ -1125,9 +1147,33 @@ class Entity(
                 )
             return
 
+        available = self.available  # only call self.available once per update cycle
+        attributes_key: tuple[Any, ...] | None = None
+        if (attributes_version := self.attributes_version) is not None:
+            attributes_key = (
+                attributes_version,
+                available,
+                entry,
+                self.device_entry,
+                hass.data.get(DATA_CUSTOMIZE),
+            )
+            if (
+                attributes_cache := self.__attributes_cache
+            ) is not None and attributes_cache[0] == attributes_key:
+                # The attributes are the same as the ones of the previous write
+                # so there is no need to calculate them or check capabilities
+                self.__async_set_state(
+                    entity_id,
+                    self._stringify_state(available),
+                    attributes_cache[1],
+                    timer(),
+                    None,
+                )
+                return
+
         state_calculate_start = timer()
         state, attr, capabilities, original_device_class, supported_features = (
-            self.__async_calculate_state()
+            self.__async_calculate_state(available)
         )
         time_now = timer()
 
@@ -1198,6 +1244,22 @@ class Entity(
             if custom := customize.get(entity_id):
                 attr.update(custom)
 
+        self.__async_set_state(entity_id, state, attr, time_now, attributes_key)
+
+    def __async_set_state(
+        self,
+        entity_id: str,
+        state: str,
+        attr: Mapping[str, Any],
+        time_now: float,
+        attributes_key: tuple[Any, ...] | None,
+    ) -> None:
+        """Set the state in the state machine.
+
+        If attributes_key is passed, the attributes of the new
+        state are kept for later writes with the same key.
+        """
+        hass = self.hass
         if (
             self._context_set is not None
             and time_now - self._context_set > CONTEXT_RECENT_TIME_SECONDS
@@ -1222,6 +1284,11 @@ class Entity(
             hass.states.async_set(
                 entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
             )
+        else:
+            if attributes_key is not None and (new_state := hass.states.get(entity_id)):
+                # Keep the attributes of the new state since the state machine
+                # reuses them as long as the attributes written are equal
+                self.__attributes_cache = (attributes_key, new_state.attributes)
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
@@ -70,6 +70,18 @@ PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
 _LOGGER = getLogger(__name__)
 
+# Optional hook of entity platform modules handling an entity service
+# for many entities of the platform at once, for example with a single
+# group command. It is called with the name of the entity method, the
+# targeted entities and the service data, and returns the entities it
+# did not handle, which get the service called on them one by one.
+# Services registered with a handler function are never batched, as
+# their handler computes the arguments for each entity.
+type EntityServiceBatchHandler = Callable[
+    [HomeAssistant, str, list[Entity], dict[str, Any]],
+    Coroutine[Any, Any, list[Entity]],
+]
+
 
 class AddEntitiesCallback(Protocol):
     """Protocol type for EntityPlatform.add_entities callback."""
@@ -152,6 +164,9 @@ class EntityPlatform:
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
+        self.entity_service_batch_handler: EntityServiceBatchHandler | None = getattr(
+            platform, "async_handle_entity_service_batch", None
+        )
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
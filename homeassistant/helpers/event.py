@@ -9,6 +9,7 @@ import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial, wraps
+from graphlib import CycleError, TopologicalSorter
 import logging
 from random import randint
 import time
@@ -75,6 +76,9 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+_TEMPLATE_RENDER_SCHEDULER: HassKey[_TemplateRenderScheduler] = HassKey(
+    "template_render_scheduler"
+)
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -335,7 +339,34 @@ def _async_dispatch_entity_id_event_soon(
     event: Event[_StateEventDataT],
 ) -> None:
     """Dispatch to listeners soon to ensure one event loop runs before dispatch."""
-    hass.loop.call_soon(_async_dispatch_entity_id_event, hass, callbacks, event)
+    if (scheduler := hass.data.get(_TEMPLATE_RENDER_SCHEDULER)) is None:
+        hass.loop.call_soon(_async_dispatch_entity_id_event, hass, callbacks, event)
+        return
+    # Templates are re-rendered once the state changes
+    # of this loop iteration have been dispatched
+    hass.loop.call_soon(
+        _async_dispatch_entity_id_event_and_render,
+        hass,
+        scheduler,
+        callbacks,
+        event,
+        scheduler.async_dispatch_scheduled(event),
+    )
+
+
+@callback
+def _async_dispatch_entity_id_event_and_render(
+    hass: HomeAssistant,
+    scheduler: _TemplateRenderScheduler,
+    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
+    event: Event[_StateEventDataT],
+    generation: int,
+) -> None:
+    """Dispatch to listeners and re-render templates after the last dispatch."""
+    try:
+        _async_dispatch_entity_id_event(hass, callbacks, event)
+    finally:
+        scheduler.async_dispatch_done(event, generation)
 
 
 @callback
@@ -962,6 +993,181 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+type _ScheduledEvent = tuple[Event[EventStateChangedData], int | None]
+
+
+class _TemplateRenderScheduler:
+    """Re-render templates once per loop iteration in dependency order.
+
+    State changes are not rendered right away, the trackers they
+    trigger are collected until all state changes of the loop
+    iteration have been dispatched. Each tracker is then refreshed
+    with all the events it received and a template is not rendered
+    again for a state change written by another tracker before its
+    last render.
+
+    The scheduler learns which entities a tracker writes when a state
+    changes while the tracker's action runs. Trackers which write an
+    entity that another pending tracker depends on are refreshed
+    first so templates that depend on other templates are not
+    rendered again with the states they are about to replace.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._pending: dict[TrackTemplateResultInfo, list[_ScheduledEvent]] = {}
+        # The trackers which are being refreshed
+        self._flushing: dict[TrackTemplateResultInfo, list[_ScheduledEvent]] = {}
+        self._producers: dict[str, TrackTemplateResultInfo] = {}
+        self._running: TrackTemplateResultInfo | None = None
+        self._flush_scheduled = False
+        # State changes waiting to be dispatched by the loop
+        # iteration in which they were made, the generation
+        # is closed when the next loop iteration starts
+        self._generation = 0
+        self._generation_open = False
+        self._dispatching: dict[int, int] = {}
+        self._dispatch_sequences: dict[
+            Event[Any], tuple[int, TrackTemplateResultInfo]
+        ] = {}
+        # Orders the state changes written by trackers and renders
+        self._sequence = 0
+
+    @callback
+    def async_next_sequence(self) -> int:
+        """Return the sequence number of a written state change or render."""
+        self._sequence += 1
+        return self._sequence
+
+    @callback
+    def async_dispatch_scheduled(self, event: Event[_StateEventDataT]) -> int:
+        """Delay rendering until a state change has been dispatched.
+
+        Returns the generation of the state change.
+        """
+        if not self._generation_open:
+            # Scheduled before the dispatches of this generation
+            self._generation_open = True
+            self.hass.loop.call_soon(self._async_close_generation)
+        generation = self._generation
+        self._dispatching[generation] = self._dispatching.get(generation, 0) + 1
+        if (running := self._running) is not None:
+            # The state was written by the action of the running tracker
+            self._dispatch_sequences[event] = (self.async_next_sequence(), running)
+            self._producers[event.data["entity_id"]] = running
+        return generation
+
+    @callback
+    def _async_close_generation(self) -> None:
+        """Put state changes made from now on in a new generation."""
+        self._generation_open = False
+        self._generation += 1
+
+    @callback
+    def async_dispatch_done(
+        self, event: Event[_StateEventDataT], generation: int
+    ) -> None:
+        """Render the pending templates once a generation is dispatched.
+
+        State changes made while dispatching belong to the next
+        generation so they do not delay the render.
+        """
+        self._dispatch_sequences.pop(event, None)
+        if remaining := self._dispatching[generation] - 1:
+            self._dispatching[generation] = remaining
+            return
+        del self._dispatching[generation]
+        if self._pending:
+            self._async_flush()
+
+    @callback
+    def async_schedule(
+        self, tracker: TrackTemplateResultInfo, event: Event[EventStateChangedData]
+    ) -> None:
+        """Schedule a refresh of tracker for event."""
+        sequence: int | None = None
+        producer: TrackTemplateResultInfo | None = None
+        if written := self._dispatch_sequences.get(event):
+            sequence, producer = written
+        elif (producer := self._running) is not None:
+            # Listeners for all states or domains are called
+            # when the state changes instead of being dispatched
+            sequence = self.async_next_sequence()
+            self._producers[event.data["entity_id"]] = producer
+        if producer is tracker:
+            # A tracker which depends on the states it writes
+            # must see them like before, they are never skipped
+            sequence = None
+        if (events := self._pending.get(tracker)) is not None:
+            events.append((event, sequence))
+            return
+        self._pending[tracker] = [(event, sequence)]
+        if not self._dispatching and not self._flush_scheduled:
+            # Render in the next loop iteration like
+            # state changes which are dispatched
+            self._flush_scheduled = True
+            self.hass.loop.call_soon(self._async_flush)
+
+    @callback
+    def async_remove(self, tracker: TrackTemplateResultInfo) -> None:
+        """Forget a removed tracker."""
+        self._pending.pop(tracker, None)
+        self._flushing.pop(tracker, None)
+        for entity_id in [
+            entity_id
+            for entity_id, producer in self._producers.items()
+            if producer is tracker
+        ]:
+            del self._producers[entity_id]
+
+    @callback
+    def _async_flush(self) -> None:
+        """Refresh the pending trackers."""
+        self._flush_scheduled = False
+        flushing = self._flushing = self._pending
+        self._pending = {}
+        for tracker in self._ordered(flushing):
+            # The tracker may have been removed by an earlier action
+            if (events := flushing.get(tracker)) is None:
+                continue
+            self._running = tracker
+            try:
+                tracker.async_refresh_events(events)
+            except Exception:
+                _LOGGER.exception("Error while refreshing template %s", tracker)
+            finally:
+                self._running = None
+        self._flushing = {}
+
+    def _ordered(
+        self, pending: dict[TrackTemplateResultInfo, list[_ScheduledEvent]]
+    ) -> list[TrackTemplateResultInfo]:
+        """Return the pending trackers, producers before their consumers."""
+        if len(pending) == 1 or not (
+            producers := [
+                (entity_id, producer)
+                for entity_id, producer in self._producers.items()
+                if producer in pending
+            ]
+        ):
+            return list(pending)
+        sorter: TopologicalSorter[TrackTemplateResultInfo] = TopologicalSorter()
+        for tracker in pending:
+            sorter.add(
+                tracker,
+                *(
+                    producer
+                    for entity_id, producer in producers
+                    if producer is not tracker and tracker.depends_on(entity_id)
+                ),
+            )
+        try:
+            return list(sorter.static_order())
+        except CycleError:
+            return list(pending)
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -1001,6 +1207,10 @@ class TrackTemplateResultInfo:
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
+        self._scheduler = _async_get_template_render_scheduler(hass)
+        # Equal templates may be tracked more than once
+        # so the sequences are kept by TrackTemplate
+        self._render_sequences: dict[int, int] = {}
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -1055,7 +1265,9 @@ class TrackTemplateResultInfo:
                     log_fn(logging.ERROR, str(info.exception))
 
         self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
+            self.hass,
+            _render_infos_to_track_states(self._info.values()),
+            self._async_schedule_refresh,
         )
         self._update_time_listeners()
         _LOGGER.debug(
@@ -1113,6 +1325,7 @@ class TrackTemplateResultInfo:
         assert self._track_state_changes
         self._track_state_changes.async_remove()
         self._rate_limit.async_remove()
+        self._scheduler.async_remove(self)
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
 
@@ -1121,11 +1334,75 @@ class TrackTemplateResultInfo:
         """Force recalculate the template."""
         self._refresh(None)
 
+    def depends_on(self, entity_id: str) -> bool:
+        """Return if a state change of entity_id may change a template result."""
+        return any(info.filter(entity_id) for info in self._info.values())
+
+    @callback
+    def _async_schedule_refresh(self, event: Event[EventStateChangedData]) -> None:
+        """Refresh the templates for the event at the end of the loop iteration."""
+        self._scheduler.async_schedule(self, event)
+
+    @callback
+    def async_refresh_events(self, events: list[_ScheduledEvent]) -> None:
+        """Refresh the templates for events which arrived in one loop iteration.
+
+        The states of all events are set when the templates are
+        refreshed, so each template is rendered at most once, for the
+        last event which triggers a render of it.
+        """
+        if len(events) == 1:
+            event, sequence = events[0]
+            self._refresh(event, sequence=sequence)
+            return
+
+        template_events: dict[int, _ScheduledEvent] = {}
+        for track_template_ in self._track_templates:
+            if (info := self._info.get(track_template_.template)) is None:
+                continue
+            render_sequence = self._render_sequences.get(id(track_template_), 0)
+            last: _ScheduledEvent | None = None
+            for event, sequence in events:
+                if (
+                    sequence is not None and render_sequence > sequence
+                ) or not _event_triggers_rerender(event, info):
+                    continue
+                # Prefer an event which is not rate limited
+                if (
+                    last is None
+                    or _rate_limit_for_event(event, info, track_template_) is None
+                    or _rate_limit_for_event(last[0], info, track_template_) is not None
+                ):
+                    last = (event, sequence)
+            if last is not None:
+                template_events[id(track_template_)] = last
+
+        if not template_events:
+            return
+        # Render the templates in the order of their events, like
+        # they would be when refreshed for each event in turn
+        positions = {id(event): idx for idx, (event, _) in enumerate(events)}
+        track_templates = sorted(
+            (
+                track_template_
+                for track_template_ in self._track_templates
+                if id(track_template_) in template_events
+            ),
+            key=lambda track_template_: positions[
+                id(template_events[id(track_template_)][0])
+            ],
+        )
+        event = events[
+            max(positions[id(event)] for event, _ in template_events.values())
+        ][0]
+        self._refresh(event, track_templates, template_events=template_events)
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
         now: float,
         event: Event[EventStateChangedData] | None,
+        sequence: int | None = None,
     ) -> bool | TrackTemplateResult:
         """Re-render the template if conditions match.
 
@@ -1139,6 +1416,13 @@ class TrackTemplateResultInfo:
         """
         template = track_template_.template
 
+        if (
+            sequence is not None
+            and self._render_sequences.get(id(track_template_), 0) > sequence
+        ):
+            # The template was rendered after the state changed
+            return False
+
         if event:
             info = self._info[template]
 
@@ -1165,6 +1449,9 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
+        self._render_sequences[id(track_template_)] = (
+            self._scheduler.async_next_sequence()
+        )
         self._info[template] = info = template.async_render_to_info(
             track_template_.variables
         )
@@ -1185,6 +1472,24 @@ class TrackTemplateResultInfo:
 
         return TrackTemplateResult(template, last_result, result)
 
+    def _render_template_for_events(
+        self,
+        track_template_: TrackTemplate,
+        now: float,
+        event: Event[EventStateChangedData] | None,
+        sequence: int | None,
+        template_events: dict[int, _ScheduledEvent] | None,
+    ) -> bool | TrackTemplateResult:
+        """Re-render the template for its event if conditions match."""
+        if template_events is None:
+            return self._render_template_if_ready(track_template_, now, event, sequence)
+        if (scheduled := template_events.get(id(track_template_))) is None:
+            return False
+        event, sequence = scheduled
+        return self._render_template_if_ready(
+            track_template_, event.time_fired_timestamp, event, sequence
+        )
+
     @staticmethod
     def _super_template_as_boolean(result: bool | str | TemplateError) -> bool:
         """Return True if the result is truthy or a TemplateError."""
@@ -1217,6 +1522,8 @@ class TrackTemplateResultInfo:
         event: Event[EventStateChangedData] | None,
         track_templates: Iterable[TrackTemplate] | None = None,
         replayed: bool | None = False,
+        sequence: int | None = None,
+        template_events: dict[int, _ScheduledEvent] | None = None,
     ) -> None:
         """Refresh the template.
 
@@ -1229,6 +1536,15 @@ class TrackTemplateResultInfo:
 
         replayed is True if the event is being replayed because the
         rate limit was hit.
+
+        sequence orders the event with the renders if it was written by
+        another template, templates which were rendered after the event
+        are skipped.
+
+        template_events is an optional mapping of the id of the
+        TrackTemplate objects to refresh to the event and sequence
+        to refresh them for. The event is then the one passed to
+        the action.
         """
         updates: list[TrackTemplateResult] = []
         info_changed = False
@@ -1241,7 +1557,9 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_for_events(
+                super_template, now, event, sequence, template_events
+            )
             info_changed |= self._apply_update(updates, update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1265,6 +1583,7 @@ class TrackTemplateResultInfo:
                 # of all templates in the group
                 event = None
                 track_templates = self._track_templates
+                template_events = None
 
         # Then update the remaining templates unless blocked by the super template
         if not block_updates:
@@ -1272,7 +1591,9 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_for_events(
+                    track_template_, now, event, sequence, template_events
+                )
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
@@ -1308,6 +1629,18 @@ class TrackTemplateResultInfo:
         self.hass.async_run_hass_job(self._job, event, updates)
 
 
+@callback
+def _async_get_template_render_scheduler(
+    hass: HomeAssistant,
+) -> _TemplateRenderScheduler:
+    """Return the template render scheduler."""
+    if (scheduler := hass.data.get(_TEMPLATE_RENDER_SCHEDULER)) is None:
+        scheduler = hass.data[_TEMPLATE_RENDER_SCHEDULER] = _TemplateRenderScheduler(
+            hass
+        )
+    return scheduler
+
+
 type TrackTemplateResultListener = Callable[
     [
         Event[EventStateChangedData] | None,
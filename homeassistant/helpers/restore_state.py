@@ -7,8 +7,19 @@ from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
 
-from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
+from homeassistant.const import (
+    ATTR_RESTORED,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+    valid_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 from homeassistant.util.hass_dict import HassKey
@@ -27,11 +38,17 @@ DATA_RESTORE_STATE: HassKey[RestoreStateData] = HassKey("restore_state")
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
+# States changed since the last full dump, applied on top of STORAGE_KEY
+STORAGE_KEY_CHANGES = "core.restore_state_changes"
 STORAGE_VERSION = 1
 
-# How long between periodically saving the current states to disk
+# How long between periodically saving the changed states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between periodically saving all states to disk, which
+# compacts the changed states into a full dump
+STATE_DUMP_FULL_INTERVAL = timedelta(hours=4)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -137,8 +154,16 @@ class RestoreStateData:
         self.store = Store[list[dict[str, Any]]](
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        self.changes_store = Store[list[dict[str, Any]]](
+            hass, STORAGE_VERSION, STORAGE_KEY_CHANGES, encoder=JSONEncoder
+        )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # Entities changed since the last dump
+        self._changed_entity_ids: set[str] = set()
+        # States saved to the changes store since the last full dump
+        self._changed_states: dict[str, StoredState] = {}
+        self._last_full_dump: datetime | None = None
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -159,13 +184,21 @@ class RestoreStateData:
             _LOGGER.error("Error loading last states", exc_info=exc)
             stored_states = None
 
-        if stored_states is None:
+        try:
+            changed_states = await self.changes_store.async_load()
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error loading last changed states", exc_info=exc)
+            changed_states = None
+
+        if stored_states is None and changed_states is None:
             _LOGGER.debug("Not creating cache - no saved states found")
             self.last_states = {}
         else:
             self.last_states = {
                 item["state"]["entity_id"]: StoredState.from_dict(item)
-                for item in stored_states
+                for items in (stored_states, changed_states)
+                if items
+                for item in items
                 if valid_entity_id(item["state"]["entity_id"])
             }
             _LOGGER.debug("Created cache with %s", list(self.last_states))
@@ -214,10 +247,29 @@ class RestoreStateData:
 
         return stored_states
 
+    @callback
+    def _async_get_stored_state(
+        self, entity_id: str, now: datetime
+    ) -> StoredState | None:
+        """Get the state of an entity which should be stored."""
+        if (
+            (entity := self.entities.get(entity_id))
+            and (state := self.hass.states.get(entity_id))
+            and not state.attributes.get(ATTR_RESTORED)
+        ):
+            return StoredState(state, entity.extra_restore_state_data, now)
+        return self.last_states.get(entity_id)
+
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        now = dt_util.utcnow()
+        changed_entity_ids = self._changed_entity_ids
+        self._changed_entity_ids = set()
         try:
+            # Remove the changed states first, so they are never
+            # applied on top of a newer full dump when loading
+            await self.changes_store.async_remove()
             await self.store.async_save(
                 [
                     stored_state.as_dict()
@@ -226,6 +278,48 @@ class RestoreStateData:
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            self._changed_entity_ids |= changed_entity_ids
+            return
+        self._changed_states.clear()
+        self._last_full_dump = now
+
+    async def async_dump_changed_states(self) -> None:
+        """Save the states changed since the last dump to storage.
+
+        The changed states are added to the ones saved since the last full
+        dump. All states are dumped instead once the last full dump is older
+        than STATE_DUMP_FULL_INTERVAL or most entities have changed.
+
+        Only state changes mark an entity as changed, changes of the extra
+        data of an entity alone are saved by the next full dump.
+        """
+        now = dt_util.utcnow()
+        if (
+            self._last_full_dump is None
+            or now - self._last_full_dump >= STATE_DUMP_FULL_INTERVAL
+            or len(self._changed_states.keys() | self._changed_entity_ids)
+            > len(self.entities) // 2
+        ):
+            await self.async_dump_states()
+            return
+        if not self._changed_entity_ids:
+            return
+        _LOGGER.debug("Dumping changed states")
+        for entity_id in self._changed_entity_ids:
+            if (
+                stored_state := self._async_get_stored_state(entity_id, now)
+            ) is not None:
+                self._changed_states[entity_id] = stored_state
+        self._changed_entity_ids = set()
+        try:
+            await self.changes_store.async_save(
+                [
+                    stored_state.as_dict()
+                    for stored_state in self._changed_states.values()
+                ]
+            )
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving changed states", exc_info=exc)
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -234,6 +328,19 @@ class RestoreStateData:
         async def _async_dump_states(*_: Any) -> None:
             await self.async_dump_states()
 
+        async def _async_dump_changed_states(*_: Any) -> None:
+            await self.async_dump_changed_states()
+
+        @callback
+        def _async_is_restore_entity(event_data: EventStateChangedData) -> bool:
+            """Return if the state of a restore entity changed."""
+            return event_data["entity_id"] in self.entities
+
+        @callback
+        def _async_restore_entity_changed(event: Event[EventStateChangedData]) -> None:
+            """Mark a restore entity as changed."""
+            self._changed_entity_ids.add(event.data["entity_id"])
+
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
@@ -241,16 +348,23 @@ class RestoreStateData:
             _async_dump_states(), "RestoreStateData dump"
         )
 
-        # Dump states periodically
+        cancel_state_listener = self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            _async_restore_entity_changed,
+            event_filter=_async_is_restore_entity,
+        )
+
+        # Dump changed states periodically
         cancel_interval = async_track_time_interval(
             self.hass,
-            _async_dump_states,
+            _async_dump_changed_states,
             STATE_DUMP_INTERVAL,
             name="RestoreStateData dump states",
         )
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
             cancel_interval()
+            cancel_state_listener()
             await self.async_dump_states()
 
         # Dump states when stopping hass
@@ -262,6 +376,7 @@ class RestoreStateData:
     def async_restore_entity_added(self, entity: RestoreEntity) -> None:
         """Store this entity's state when hass is shutdown."""
         self.entities[entity.entity_id] = entity
+        self._changed_entity_ids.add(entity.entity_id)
 
     @callback
     def async_restore_entity_removed(
@@ -280,6 +395,7 @@ class RestoreStateData:
             self.last_states[entity_id] = StoredState(
                 state, extra_data, dt_util.utcnow()
             )
+            self._changed_entity_ids.add(entity_id)
 
         del self.entities[entity_id]
 
@@ -11,6 +11,7 @@ import logging
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypedDict, TypeGuard, cast
 
+from lru import LRU
 import voluptuous as vol
 
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_CONTROL
@@ -32,6 +33,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HassJobType,
     HomeAssistant,
@@ -68,6 +70,7 @@ from .typing import ConfigType, TemplateVarsType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
     from .entity import Entity
+    from .entity_platform import EntityPlatform
 
 CONF_SERVICE_ENTITY_ID = "entity_id"
 
@@ -79,6 +82,18 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+TARGET_INDEX: HassKey[_TargetIndex] = HassKey("service_target_index")
+
+# Maximum number of device, area, floor and label targets to keep resolved
+TARGET_INDEX_SIZE = 256
+
+# Changes of entity and device registry entries which affect targeting
+_ENTITY_TARGET_CHANGES = frozenset(
+    {"area_id", "device_id", "disabled_by", "entity_category", "hidden_by", "labels"}
+)
+_DEVICE_TARGET_CHANGES = frozenset({"area_id", "labels"})
+
+type _TargetKey = tuple[frozenset[str], frozenset[str], frozenset[str], frozenset[str]]
 
 
 @cache
@@ -502,7 +517,7 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
 
 
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
     """Extract referenced entity IDs from a service call."""
@@ -526,6 +541,122 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
+    resolved = _async_get_target_index(hass).async_resolve(selector)
+    return SelectedEntities(
+        referenced=selected.referenced,
+        indirectly_referenced=resolved.indirectly_referenced.copy(),
+        missing_devices=resolved.missing_devices.copy(),
+        missing_areas=resolved.missing_areas.copy(),
+        missing_floors=resolved.missing_floors.copy(),
+        missing_labels=resolved.missing_labels.copy(),
+        referenced_devices=resolved.referenced_devices.copy(),
+        referenced_areas=resolved.referenced_areas.copy(),
+    )
+
+
+class _TargetIndex:
+    """Cache of the registry entries targeted by device, area, floor and label.
+
+    Walking the registries for every service call is slow when the same
+    floor, area or label is targeted over and over, so the result is kept
+    per target until a registry changes in a way which affects targeting.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._resolved: LRU[_TargetKey, SelectedEntities] = LRU(TARGET_INDEX_SIZE)
+        bus = hass.bus
+        bus.async_listen(
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_clear,
+            event_filter=_async_entity_targeting_changed,
+        )
+        bus.async_listen(
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            self._async_clear,
+            event_filter=_async_device_targeting_changed,
+        )
+        bus.async_listen(area_registry.EVENT_AREA_REGISTRY_UPDATED, self._async_clear)
+        bus.async_listen(
+            floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+            self._async_clear,
+            event_filter=_async_created_or_removed,
+        )
+        bus.async_listen(
+            label_registry.EVENT_LABEL_REGISTRY_UPDATED,
+            self._async_clear,
+            event_filter=_async_created_or_removed,
+        )
+
+    @callback
+    def _async_clear(self, event: Event[Any]) -> None:
+        """Forget all resolved targets."""
+        self._resolved.clear()
+
+    @callback
+    def async_resolve(self, selector: ServiceTargetSelector) -> SelectedEntities:
+        """Return the registry entries targeted by a selector.
+
+        The returned object is shared and must not be modified.
+        """
+        key = (
+            frozenset(selector.device_ids),
+            frozenset(selector.area_ids),
+            frozenset(selector.floor_ids),
+            frozenset(selector.label_ids),
+        )
+        if (resolved := self._resolved.get(key)) is None:
+            resolved = self._resolved[key] = _async_resolve_registry_targets(
+                self._hass, selector
+            )
+        return resolved
+
+
+@callback
+def _async_entity_targeting_changed(
+    event_data: entity_registry.EventEntityRegistryUpdatedData,
+) -> bool:
+    """Return if an entity registry change affects targeting."""
+    return event_data["action"] != "update" or (
+        "old_entity_id" in event_data
+        or not _ENTITY_TARGET_CHANGES.isdisjoint(event_data["changes"])
+    )
+
+
+@callback
+def _async_device_targeting_changed(
+    event_data: device_registry.EventDeviceRegistryUpdatedData,
+) -> bool:
+    """Return if a device registry change affects targeting."""
+    return event_data["action"] != "update" or not _DEVICE_TARGET_CHANGES.isdisjoint(
+        event_data["changes"]
+    )
+
+
+@callback
+def _async_created_or_removed(
+    event_data: floor_registry.EventFloorRegistryUpdatedData
+    | label_registry.EventLabelRegistryUpdatedData,
+) -> bool:
+    """Return if a floor or label was created or removed."""
+    return event_data["action"] != "update"
+
+
+@callback
+def _async_get_target_index(hass: HomeAssistant) -> _TargetIndex:
+    """Return the target index, creating it on first use."""
+    if (target_index := hass.data.get(TARGET_INDEX)) is None:
+        target_index = hass.data[TARGET_INDEX] = _TargetIndex(hass)
+    return target_index
+
+
+@callback
+def _async_resolve_registry_targets(
+    hass: HomeAssistant, selector: ServiceTargetSelector
+) -> SelectedEntities:
+    """Walk the registries for the device, area, floor and label targets."""
+    selected = SelectedEntities()
     entities = entity_registry.async_get(hass).entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
@@ -1003,23 +1134,42 @@ async def entity_service_call(
             await entity.async_update_ha_state(True)
         return {entity.entity_id: single_response} if return_response else None
 
+    # Platforms able to handle the service for many entities at once get
+    # a single call with all their entities. Only services calling an
+    # entity method by name are batched, as their data are the keyword
+    # arguments of the method.
+    batches: dict[EntityPlatform, list[Entity]] = {}
+    batch_calls: list[Coroutine[Any, Any, None]] = []
+    if isinstance(func, str) and isinstance(data, dict) and not return_response:
+        batches = _get_entity_batches(entities)
+        batch_calls = [
+            _handle_entity_batch(hass, platform, batch, func, data, call.context)
+            for platform, batch in batches.items()
+        ]
+
     # Use asyncio.gather here to ensure the returned results
     # are in the same order as the entities list
     results: list[ServiceResponse | BaseException] = await asyncio.gather(
+        *batch_calls,
         *[
             entity.async_request_call(
                 _handle_entity_call(hass, entity, func, data, call.context)
             )
             for entity in entities
+            if entity.platform not in batches
         ],
         return_exceptions=True,
     )
 
-    response_data: EntityServiceResponse = {}
-    for entity, result in zip(entities, results, strict=False):
+    for result in results:
         if isinstance(result, BaseException):
             raise result from None
-        response_data[entity.entity_id] = result
+
+    # There are no batches when response data is returned
+    response_data: EntityServiceResponse = {}
+    if return_response:
+        for entity, result in zip(entities, results, strict=False):
+            response_data[entity.entity_id] = cast(ServiceResponse, result)
 
     tasks: list[asyncio.Task[None]] = []
 
@@ -1041,6 +1191,54 @@ async def entity_service_call(
     return response_data if return_response and response_data else None
 
 
+def _get_entity_batches(entities: list[Entity]) -> dict[EntityPlatform, list[Entity]]:
+    """Group entities of platforms handling services for many entities at once."""
+    batches: dict[EntityPlatform, list[Entity]] = {}
+    for entity in entities:
+        if (
+            platform := entity.platform
+        ) is not None and platform.entity_service_batch_handler is not None:
+            batches.setdefault(platform, []).append(entity)
+    # A single entity is called directly
+    return {platform: batch for platform, batch in batches.items() if len(batch) > 1}
+
+
+async def _handle_entity_batch(
+    hass: HomeAssistant,
+    platform: EntityPlatform,
+    entities: list[Entity],
+    func: str,
+    data: dict,
+    context: Context,
+) -> None:
+    """Handle calling a service method for many entities of a platform."""
+    for entity in entities:
+        entity.async_set_context(context)
+
+    handler = platform.entity_service_batch_handler
+    assert handler is not None
+    # Parallel updates are shared by the entities of a platform,
+    # so the batch uses the slot of a single entity
+    remaining = await entities[0].async_request_call(
+        handler(hass, func, entities, data)
+    )
+    if not remaining:
+        return
+
+    results = await asyncio.gather(
+        *[
+            entity.async_request_call(
+                _handle_entity_call(hass, entity, func, data, context)
+            )
+            for entity in remaining
+        ],
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result from None
+
+
 async def _handle_entity_call(
     hass: HomeAssistant,
     entity: Entity,
@@ -29,6 +29,7 @@ import weakref
 from awesomeversion import AwesomeVersion
 import jinja2
 from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2.bccache import Bucket
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -47,6 +48,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     Context,
@@ -83,6 +85,7 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -100,6 +103,11 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE: HassKey[TemplateBytecodeCache] = HassKey("template.bytecode_cache")
+
+BYTECODE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_STORAGE_VERSION = 1
+BYTECODE_SAVE_DELAY = 30
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -778,10 +786,14 @@ class Template:
         error_value: Any = _SENTINEL,
         variables: dict[str, Any] | None = None,
         parse_result: bool = False,
+        *,
+        parse_json: bool = True,
     ) -> Any:
         """Render template with value exposed.
 
-        If valid JSON will expose value_json too.
+        If valid JSON will expose value_json too. Callers which already
+        decoded the value can pass parse_json=False and value_json in
+        variables.
 
         This method must be run in the event loop.
         """
@@ -795,10 +807,11 @@ class Template:
         variables = dict(variables or {})
         variables["value"] = value
 
-        try:  # noqa: SIM105 - suppress is much slower
-            variables["value_json"] = json_loads(value)
-        except JSON_DECODE_EXCEPTIONS:
-            pass
+        if parse_json:
+            try:  # noqa: SIM105 - suppress is much slower
+                variables["value_json"] = json_loads(value)
+            except JSON_DECODE_EXCEPTIONS:
+                pass
 
         try:
             render_result = _render_with_context(
@@ -2785,6 +2798,100 @@ async def async_load_custom_templates(hass: HomeAssistant) -> None:
     _get_hass_loader(hass).sources = custom_templates
 
 
+class TemplateBytecodeCache(jinja2.BytecodeCache):
+    """Keep the code of compiled templates across restarts.
+
+    Code is keyed by the checksum of the template source and the
+    flavor of the environment which compiled it. Buckets refuse code
+    compiled by another Python or Jinja bytecode version and the saved
+    code is discarded when Home Assistant or Jinja is updated. Only
+    the code of templates which were compiled since the start is
+    saved, templates which are no longer used are dropped.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, BYTECODE_STORAGE_VERSION, BYTECODE_STORAGE_KEY
+        )
+        # Base64 encoded code by bucket key
+        self._codes: dict[str, str] = {}
+        self._used: dict[str, str] = {}
+        self._save_scheduled = False
+
+    async def async_load(self) -> None:
+        """Load the code saved before the last restart."""
+        if (data := await self._store.async_load()) is None:
+            return
+        if data["versions"] != _bytecode_versions():
+            _LOGGER.debug("Discarding template code compiled by another version")
+            return
+        self._codes = data["codes"]
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Load the saved code for a bucket.
+
+        This may be called from a thread.
+        """
+        key = bucket.key
+        if (code := self._codes.get(key)) is None:
+            return
+        try:
+            bucket.bytecode_from_string(base64.b64decode(code))
+        except (EOFError, TypeError, ValueError):
+            # Corrupt code is compiled again
+            bucket.reset()
+            return
+        if bucket.code is not None and key not in self._used:
+            self._used[key] = code
+            self._schedule_save()
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        """Keep the code of a compiled template.
+
+        This may be called from a thread.
+        """
+        code = base64.b64encode(bucket.bytecode_to_string()).decode()
+        self._codes[bucket.key] = self._used[bucket.key] = code
+        self._schedule_save()
+
+    def clear(self) -> None:
+        """Forget all code."""
+        self._codes = {}
+        self._used = {}
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Schedule saving the code of the templates in use."""
+        if not self._save_scheduled:
+            self._save_scheduled = True
+            self.hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Save the code of the templates in use after a delay."""
+        self._save_scheduled = False
+        self._store.async_delay_save(self._data_to_save, BYTECODE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to save."""
+        return {"versions": _bytecode_versions(), "codes": dict(self._used)}
+
+
+def _bytecode_versions() -> list[str]:
+    """Return the versions compiled code is valid for."""
+    return [HA_VERSION, jinja2.__version__]
+
+
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the code of the templates compiled before the last restart."""
+    bytecode_cache = TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load()
+    hass.data[_BYTECODE_CACHE] = bytecode_cache
+
+
 def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
     result = {}
     jinja_path = hass.config.path("custom_templates")
@@ -2846,6 +2953,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self.flavor = "limited" if limited else "strict" if strict else "normal"
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3201,7 +3309,19 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            self.hass is not None
+            and isinstance(source, str)
+            and (bytecode_cache := self.hass.data.get(_BYTECODE_CACHE)) is not None
+        ):
+            checksum = bytecode_cache.get_source_checksum(source)
+            bucket = Bucket(self, f"{self.flavor}-{checksum}", checksum)
+            bytecode_cache.load_bytecode(bucket)
+            if (compiled := bucket.code) is None:
+                compiled = bucket.code = super().compile(source)
+                bytecode_cache.dump_bytecode(bucket)
+        else:
+            compiled = super().compile(source)
         self.template_cache[source] = compiled
         return compiled
 
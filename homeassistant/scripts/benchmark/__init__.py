@@ -7,16 +7,19 @@ import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 import logging
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 
-from homeassistant import core
+from homeassistant import config_entries, core, loader
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import recorder as recorder_helper
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -308,3 +311,249 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+def _recorded_state_stream() -> list[tuple[str, str, dict]]:
+    """Return a state_changed stream similar to a busy power monitoring install.
+
+    500 entities update 40 times each. Most of them share a small set of
+    static attributes and a few have attributes that change with the state.
+    """
+    stream: list[tuple[str, str, dict]] = []
+    for update in range(40):
+        for idx in range(500):
+            attributes: dict = {
+                "unit_of_measurement": "W",
+                "device_class": "power",
+                "state_class": "measurement",
+                "friendly_name": f"Power {idx}",
+            }
+            if idx % 10 == 0:
+                attributes["last_reading"] = update
+            stream.append((f"sensor.power_{idx}", str(update * idx % 997), attributes))
+    return stream
+
+
+async def _replay_state_stream_into_recorder(
+    hass: core.HomeAssistant, bulk_insert: bool
+) -> float:
+    """Replay the recorded state stream into a SQLite recorder and time it."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import recorder
+
+    stream = _recorded_state_stream()
+    with TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        loader.async_setup(hass)
+        recorder_helper.async_initialize_recorder(hass)
+        assert await recorder.async_setup(
+            hass,
+            recorder.CONFIG_SCHEMA(
+                {
+                    recorder.DOMAIN: {
+                        recorder.CONF_DB_URL: f"sqlite:///{tmp_dir}/benchmark.db",
+                        recorder.CONF_BULK_INSERT: bulk_insert,
+                    }
+                }
+            ),
+        )
+        await hass.async_start()
+        instance = recorder.get_instance(hass)
+        await instance.async_block_till_done()
+
+        start = timer()
+        for entity_id, state, attributes in stream:
+            hass.states.async_set(entity_id, state, attributes)
+        await hass.async_block_till_done()
+        await instance.async_block_till_done()
+        runtime = timer() - start
+
+        await hass.async_stop()
+
+    print(f"Recorded {len(stream) / runtime:.0f} rows/sec")
+    return runtime
+
+
+@benchmark
+async def recorder_state_changed(hass):
+    """Replay 20k state changes into the recorder one ORM object at a time."""
+    return await _replay_state_stream_into_recorder(hass, False)
+
+
+@benchmark
+async def recorder_state_changed_bulk_insert(hass):
+    """Replay 20k state changes into the recorder with multi-row inserts."""
+    return await _replay_state_stream_into_recorder(hass, True)
+
+
+@benchmark
+async def reduce_statistics(hass):
+    """Reduce 3 years of hourly statistics for 40 meters to days, weeks and months."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import statistics
+
+    first_start = dt_util.parse_datetime("2021-01-01 00:00:00+00:00").timestamp()
+    hours = 3 * 365 * 24
+    stats = {}
+    for meter in range(40):
+        rows = []
+        total = 0.0
+        for hour in range(hours):
+            value = float((hour * (meter + 1)) % 97)
+            total += value
+            start = first_start + hour * 3600
+            rows.append(
+                {
+                    "start": start,
+                    "end": start + 3600,
+                    "mean": value,
+                    "min": value - 1,
+                    "max": value + 1,
+                    "last_reset": None,
+                    "state": total,
+                    "sum": total,
+                }
+            )
+        stats[f"sensor:meter_{meter}"] = rows
+    types = {"last_reset", "max", "mean", "min", "state", "sum"}
+
+    start = timer()
+    statistics._reduce_statistics_per_day(stats, types)  # noqa: SLF001
+    statistics._reduce_statistics_per_week(stats, types)  # noqa: SLF001
+    statistics._reduce_statistics_per_month(stats, types)  # noqa: SLF001
+    return timer() - start
+
+
+@benchmark
+async def mqtt_wildcard_subscriptions(hass):
+    """Match 10 seconds of MQTT traffic at 10k messages/sec to wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+
+    job = core.HassJob(lambda msg: None)
+    trie = SubscriptionTrie()
+    # 900 devices with a state and an availability subscription
+    # and a few hundred bridge and discovery wildcard subscriptions
+    for idx in range(900):
+        trie.add(Subscription(f"zigbee2mqtt/device_{idx}/+", False, job))
+        trie.add(Subscription(f"tele/tasmota_{idx}/+/availability", False, job))
+    for idx in range(300):
+        trie.add(Subscription(f"zigbee2mqtt/bridge_{idx}/#", False, job))
+    trie.add(Subscription("homeassistant/#", False, job))
+    trie.add(Subscription("+/+/+/config", False, job))
+    topics = [
+        topic
+        for idx in range(10**4)
+        for topic in (
+            f"zigbee2mqtt/device_{idx % 900}/state",
+            f"tele/tasmota_{idx % 900}/LWT/availability",
+            f"zigbee2mqtt/bridge_{idx % 300}/event/{idx}",
+            f"homeassistant/sensor/node_{idx}/config",
+            f"unrelated/topic_{idx}",
+        )
+    ]
+    messages = 10**5
+
+    start = timer()
+    match = trie.match
+    for idx in range(messages):
+        match(topics[idx % len(topics)])
+    runtime = timer() - start
+
+    print(f"Matched {messages / runtime:.0f} messages/sec")
+    return runtime
+
+
+@benchmark
+async def websocket_state_storm(hass):
+    """Send 10k state changes to 50 websocket clients subscribed to all entities."""
+    # pylint: disable=import-outside-toplevel
+    from aiohttp import ClientSession
+    from aiohttp.test_utils import TestServer
+
+    from homeassistant.auth import auth_manager_from_config
+    from homeassistant.components import websocket_api
+    from homeassistant.setup import async_setup_component
+
+    # pylint: enable=import-outside-toplevel
+
+    clients = 50
+    entities = 200
+    updates = 50
+    changes = entities * updates
+
+    async def client(session, url, access_token, ready, done):
+        """Subscribe to all entities and count the changes received."""
+        async with session.ws_connect(url) as websocket:
+            await websocket.receive_json()
+            await websocket.send_json({"type": "auth", "access_token": access_token})
+            await websocket.receive_json()
+            await websocket.send_json(
+                {
+                    "id": 1,
+                    "type": "supported_features",
+                    "features": {websocket_api.const.FEATURE_COALESCE_MESSAGES: 1},
+                }
+            )
+            await websocket.receive_json()
+            await websocket.send_json({"id": 2, "type": "subscribe_entities"})
+            received = -1
+            while received < changes:
+                msg = await websocket.receive_json()
+                for item in msg if isinstance(msg, list) else (msg,):
+                    if item["type"] != "event":
+                        continue
+                    if "a" in (event := item["event"]):
+                        # The initial states
+                        received = 0
+                        ready.release()
+                    received += len(event.get("c", ()))
+            done.release()
+
+    with TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        loader.async_setup(hass)
+        hass.auth = await auth_manager_from_config(hass, [], [])
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        user = await hass.auth.async_create_system_user(
+            "benchmark", group_ids=["system-admin"]
+        )
+        refresh_token = await hass.auth.async_create_refresh_token(user)
+        access_token = hass.auth.async_create_access_token(refresh_token)
+        assert await async_setup_component(hass, "websocket_api", {})
+        for idx in range(entities):
+            hass.states.async_set(f"sensor.storm_{idx}", "0")
+
+        async with TestServer(hass.http.app) as server, ClientSession() as session:
+            url = server.make_url(websocket_api.const.URL)
+            ready = asyncio.Semaphore(0)
+            done = asyncio.Semaphore(0)
+            tasks = [
+                asyncio.create_task(client(session, url, access_token, ready, done))
+                for _ in range(clients)
+            ]
+            for _ in range(clients):
+                await ready.acquire()
+
+            start = timer()
+            # Changes trickle in over many event loop iterations
+            for update in range(1, updates + 1):
+                for idx in range(entities):
+                    hass.states.async_set(f"sensor.storm_{idx}", str(update))
+                    if not idx % 10:
+                        await asyncio.sleep(0)
+            for _ in range(clients):
+                await done.acquire()
+            runtime = timer() - start
+            await asyncio.gather(*tasks)
+
+    metrics = websocket_api.http.async_get_batch_metrics(hass)
+    print(
+        f"Delivered {changes * clients / runtime:.0f} changes/sec in"
+        f" {metrics.batches} batches, mean size {metrics.mean_size:.1f},"
+        f" max size {metrics.max_size}, mean latency"
+        f" {metrics.mean_latency * 1000:.2f}ms, max latency"
+        f" {metrics.max_latency * 1000:.2f}ms"
+    )
+    return runtime
@@ -1,15 +1,18 @@
 """The tests for the camera component."""
 
+import asyncio
 from collections.abc import Generator
 from http import HTTPStatus
 import io
 from types import ModuleType
 from unittest.mock import AsyncMock, Mock, PropertyMock, mock_open, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import camera
 from homeassistant.components.camera.const import (
+    CAMERA_IMAGE_CACHE_MAX_AGE,
     DOMAIN,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
@@ -166,6 +169,67 @@ async def test_get_image_from_camera_with_width_height_scaled(
     assert image.content == EMPTY_8_6_JPEG
 
 
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_reuses_scaled_frame(hass: HomeAssistant) -> None:
+    """Test a frame is only scaled again when the camera returns a new one."""
+    with (
+        patch(
+            "homeassistant.components.camera.image_cache.scale_jpeg_camera_image",
+            return_value=EMPTY_8_6_JPEG,
+        ) as mock_scale,
+        patch(
+            "homeassistant.components.demo.camera.Path.read_bytes",
+            autospec=True,
+            return_value=b"Valid jpeg",
+        ) as mock_camera,
+    ):
+        for _ in range(2):
+            image = await camera.async_get_image(
+                hass, "camera.demo_camera", width=4, height=3
+            )
+            assert image.content == EMPTY_8_6_JPEG
+        assert mock_camera.call_count == 2
+        assert mock_scale.call_count == 1
+
+        await camera.async_get_image(hass, "camera.demo_camera", width=8, height=6)
+        assert mock_scale.call_count == 2
+
+        mock_camera.return_value = b"Next jpeg"
+        await camera.async_get_image(hass, "camera.demo_camera", width=4, height=3)
+        assert mock_scale.call_count == 3
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_scaled_frame_expires(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a scaled frame is dropped once it is not used for the max age."""
+    with (
+        patch(
+            "homeassistant.components.camera.image_cache.scale_jpeg_camera_image",
+            return_value=EMPTY_8_6_JPEG,
+        ) as mock_scale,
+        patch(
+            "homeassistant.components.demo.camera.Path.read_bytes",
+            autospec=True,
+            return_value=b"Valid jpeg",
+        ),
+    ):
+        await camera.async_get_image(hass, "camera.demo_camera", width=4, height=3)
+        assert mock_scale.call_count == 1
+
+        freezer.tick(CAMERA_IMAGE_CACHE_MAX_AGE / 2)
+        async_fire_time_changed(hass)
+        await camera.async_get_image(hass, "camera.demo_camera", width=4, height=3)
+        assert mock_scale.call_count == 1
+
+        freezer.tick(CAMERA_IMAGE_CACHE_MAX_AGE + 1)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        await camera.async_get_image(hass, "camera.demo_camera", width=4, height=3)
+        assert mock_scale.call_count == 2
+
+
 @pytest.mark.usefixtures("image_mock_url")
 async def test_get_image_from_camera_not_jpeg(hass: HomeAssistant) -> None:
     """Grab an image from camera entity that we cannot scale."""
@@ -619,6 +683,40 @@ async def test_camera_proxy_stream(hass_client: ClientSessionGenerator) -> None:
             assert response.status == HTTPStatus.BAD_GATEWAY
 
 
+@pytest.mark.usefixtures("mock_camera")
+async def test_camera_proxy_shares_fetch(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test concurrent requests for the same image share one fetch."""
+    client = await hass_client()
+    release = asyncio.Event()
+
+    async def _slow_camera_image(
+        width: int | None = None, height: int | None = None
+    ) -> bytes:
+        await release.wait()
+        return b"Test"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_slow_camera_image,
+    ) as mock_camera_image:
+        requests = [
+            hass.async_create_task(client.get("/api/camera_proxy/camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.1)
+        release.set()
+        for response in await asyncio.gather(*requests):
+            assert response.status == HTTPStatus.OK
+            assert await response.read() == b"Test"
+        assert mock_camera_image.call_count == 1
+
+        response = await client.get("/api/camera_proxy/camera.demo_camera")
+        assert response.status == HTTPStatus.OK
+        assert mock_camera_image.call_count == 2
+
+
 @pytest.mark.usefixtures("mock_camera_web_rtc")
 async def test_websocket_web_rtc_offer(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
@@ -9,7 +9,7 @@ import pytest
 
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
-from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder import Recorder, history as recorder_history
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
@@ -403,6 +403,181 @@ async def test_history_during_period_significant_domain(
     assert "lc" not in sensor_test_history[0]  # skipped if the same a last_updated (lu)
 
 
+@pytest.mark.parametrize(
+    ("minimal_response", "no_attributes"), [(False, False), (True, True)]
+)
+async def test_history_during_period_chunked(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Test history_during_period sends the states in chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for index in range(120):
+        state = "on" if index % 3 else "off"
+        for entity_id in ("light.kitchen", "sensor.test"):
+            hass.states.async_set(
+                entity_id, state, attributes={"any": f"{entity_id}{state}"}
+            )
+        hass.states.async_set("sensor.test", state, attributes={"any": "changed"})
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    request = {
+        "type": "history/history_during_period",
+        "start_time": now.isoformat(),
+        "entity_ids": ["light.kitchen", "sensor.test"],
+        "significant_changes_only": False,
+        "minimal_response": minimal_response,
+        "no_attributes": no_attributes,
+    }
+    client = await hass_ws_client()
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]
+    assert expected["light.kitchen"]
+    assert expected["sensor.test"]
+
+    await client.send_json_auto_id(request | {"chunk_size": 10})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+    await client.send_json_auto_id(request | {"chunk_size": 100})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+    chunks = []
+    while True:
+        response = await client.receive_json()
+        assert response["type"] == "event"
+        if response["event"].get("done"):
+            assert response["event"]["states"] == {}
+            break
+        chunks.append(response["event"]["states"])
+
+    assert len(chunks) > 2
+    merged: dict[str, list] = {}
+    for chunk in chunks:
+        assert sum(len(states) for states in chunk.values()) <= 100
+        for entity_id, states in chunk.items():
+            merged.setdefault(entity_id, []).extend(states)
+    assert merged == expected
+
+
+async def test_history_during_period_chunked_waits_for_writer(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test more chunks than the pending messages limit are sent to a client."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for index in range(400):
+        hass.states.async_set("sensor.test", str(index))
+        if index % 50 == 0:
+            await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch("homeassistant.components.websocket_api.http.MAX_PENDING_MSG", 2):
+        await client.send_json_auto_id(
+            {
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.test"],
+                "significant_changes_only": False,
+                "minimal_response": True,
+                "chunk_size": 100,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        states = []
+        while not (response := await client.receive_json())["event"].get("done"):
+            states.extend(response["event"]["states"]["sensor.test"])
+
+    assert [state["s"] for state in states] == [str(index) for index in range(400)]
+
+
+async def test_history_during_period_chunked_empty(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period in chunks without any states."""
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "history/history_during_period",
+            "start_time": (dt_util.utcnow() + timedelta(days=1)).isoformat(),
+            "entity_ids": ["sensor.test"],
+            "chunk_size": 100,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+    response = await client.receive_json()
+    assert response["event"] == {"states": {}, "done": True}
+
+
+async def test_history_during_period_shared(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test identical history_during_period requests share one query."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    request = {
+        "type": "history/history_during_period",
+        "start_time": now.isoformat(),
+        "entity_ids": ["sensor.test"],
+        "minimal_response": True,
+    }
+
+    async def _send_requests(count: int) -> list[dict]:
+        """Send the requests before waiting for any response."""
+        for _ in range(count):
+            await client.send_json_auto_id(request)
+        responses = [await client.receive_json() for _ in range(count)]
+        assert all(response["success"] for response in responses)
+        return [response["result"] for response in responses]
+
+    with patch(
+        "homeassistant.components.recorder.history.get_significant_states",
+        wraps=recorder_history.get_significant_states,
+    ) as get_significant_states_mock:
+        results = await _send_requests(3)
+        assert len(results[0]["sensor.test"]) == 1
+        assert results == [results[0]] * 3
+        assert get_significant_states_mock.call_count == 1
+
+        # Served from the cache
+        assert await _send_requests(1) == [results[0]]
+        assert get_significant_states_mock.call_count == 1
+
+        # New states invalidate the cache
+        hass.states.async_set("sensor.test", "off", attributes={"any": "attr"})
+        await async_wait_recording_done(hass)
+        results = await _send_requests(2)
+        assert len(results[0]["sensor.test"]) == 2
+        assert results[1] == results[0]
+        assert get_significant_states_mock.call_count == 2
+
+
 async def test_history_during_period_bad_start_time(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
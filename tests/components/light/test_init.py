@@ -1,7 +1,7 @@
 """The tests for the Light component."""
 
 from typing import Literal
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import AsyncMock, MagicMock, mock_open, patch
 
 import pytest
 import voluptuous as vol
@@ -911,6 +911,36 @@ async def test_light_turn_on_auth(
         )
 
 
+async def test_light_turn_off_not_batched(
+    hass: HomeAssistant, mock_light_entities: list[MockLight]
+) -> None:
+    """Test light services are called for each light with its own parameters."""
+    batch_handler = AsyncMock(return_value=[])
+    for entity in mock_light_entities[1:]:
+        entity.supported_features = light.LightEntityFeature.TRANSITION
+    platform = setup_test_component_platform(hass, light.DOMAIN, mock_light_entities)
+    platform.async_handle_entity_service_batch = batch_handler
+
+    assert await async_setup_component(hass, "light", {"light": {"platform": "test"}})
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        "light",
+        "turn_off",
+        {"entity_id": "all", light.ATTR_TRANSITION: 2},
+        blocking=True,
+    )
+
+    # The light component filters the parameters for each light
+    batch_handler.assert_not_called()
+    assert mock_light_entities[0].last_call("turn_off") == ("turn_off", {})
+    for entity in mock_light_entities[1:]:
+        assert entity.last_call("turn_off") == (
+            "turn_off",
+            {light.ATTR_TRANSITION: 2},
+        )
+
+
 async def test_light_brightness_step(hass: HomeAssistant) -> None:
     """Test that light context works."""
     entities = [
@@ -44,6 +44,7 @@ from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
+from homeassistant.util.ulid import ulid_to_bytes
 
 from .common import MockRow, mock_humanify
 
@@ -2964,6 +2965,78 @@ async def test_get_events_with_context_state(
     assert "context_event_type" not in results[3]
 
 
+@pytest.mark.usefixtures("recorder_mock")
+async def test_get_events_with_context_started_before_start_time(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events shows contexts which started before start_time."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    context = ha.Context(
+        id="01GTDGKBCH00GW0X476W5TVAAA",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.bus.async_fire(
+        EVENT_AUTOMATION_TRIGGERED,
+        {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: "automation.alarm"},
+        context=context,
+    )
+    await hass.async_block_till_done()
+    start_time = dt_util.utcnow()
+    hass.states.async_set("light.kitchen", STATE_ON, context=context)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events",
+            "start_time": start_time.isoformat(),
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    results = response["result"]
+    assert len(results) == 1
+    assert results[0]["entity_id"] == "light.kitchen"
+    assert results[0]["state"] == "on"
+    assert results[0]["context_event_type"] == "automation_triggered"
+    assert results[0]["context_entity_id"] == "automation.alarm"
+    assert results[0]["context_name"] == "Mock automation"
+    assert results[0]["context_user_id"] == "b400facee45711eaa9308bfd3d19e474"
+
+
+@pytest.mark.usefixtures("recorder_mock")
+async def test_context_origins_stop_at_shutdown(hass: HomeAssistant) -> None:
+    """Test the context origin index stops listening at shutdown."""
+    assert await async_setup_component(hass, "logbook", {})
+    await async_recorder_block_till_done(hass)
+    context_origins = hass.data[logbook.DOMAIN].context_origins
+
+    context = ha.Context(id="01GTDGKBCH00GW0X476W5TVAAA")
+    hass.states.async_set("light.kitchen", STATE_ON, context=context)
+    await hass.async_block_till_done()
+    origin = context_origins.get(ulid_to_bytes(context.id))
+    assert origin is not None
+    assert origin.entity_id == "light.kitchen"
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    assert context_origins.get(ulid_to_bytes(context.id)) is None
+
+    context = ha.Context(id="01GTDGKBCH00GW0X476W5TVBBB")
+    hass.states.async_set("light.kitchen", STATE_OFF, context=context)
+    await hass.async_block_till_done()
+    assert context_origins.get(ulid_to_bytes(context.id)) is None
+
+
 @pytest.mark.usefixtures("recorder_mock")
 async def test_logbook_with_empty_config(hass: HomeAssistant) -> None:
     """Test we handle a empty configuration."""
@@ -3037,3 +3037,66 @@ async def test_live_stream_with_changed_state_change(
     assert listeners_without_writes(
         hass.bus.async_listeners()
     ) == listeners_without_writes(init_listeners)
+
+
+@patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+async def test_live_streams_share_humanified_events(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test live events are humanified once for all streams."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    hass.states.async_set("light.small", STATE_ON)
+    hass.states.async_set("binary_sensor.is_light", STATE_ON)
+    await async_wait_recording_done(hass)
+
+    entities_client = await hass_ws_client()
+    all_client = await hass_ws_client()
+    for websocket_client, filters in (
+        (entities_client, {"entity_ids": ["light.small"]}),
+        (all_client, {}),
+    ):
+        await websocket_client.send_json(
+            {
+                "id": 7,
+                "type": "logbook/event_stream",
+                "start_time": now.isoformat(),
+                **filters,
+            }
+        )
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["success"]
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["event"]["partial"] is True
+        await get_instance(hass).async_block_till_done()
+        await hass.async_block_till_done()
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert "partial" not in msg["event"]
+
+    with patch(
+        "homeassistant.components.logbook.websocket_api.async_event_to_row",
+        wraps=websocket_api.async_event_to_row,
+    ) as event_to_row_mock:
+        hass.states.async_set("light.small", STATE_OFF)
+        hass.states.async_set("binary_sensor.is_light", STATE_OFF)
+        await hass.async_block_till_done()
+
+        msg = await asyncio.wait_for(entities_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["event"]["events"] == [
+            {"entity_id": "light.small", "state": "off", "when": ANY}
+        ]
+        msg = await asyncio.wait_for(all_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["event"]["events"] == [
+            {"entity_id": "light.small", "state": "off", "when": ANY},
+            {"entity_id": "binary_sensor.is_light", "state": "off", "when": ANY},
+        ]
+
+    # Each event is only humanified once
+    assert event_to_row_mock.call_count == 2
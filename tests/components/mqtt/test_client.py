@@ -9,10 +9,15 @@ from unittest.mock import MagicMock, Mock, call, patch
 
 import certifi
 import paho.mqtt.client as paho_mqtt
+from paho.mqtt.matcher import MQTTMatcher
 import pytest
 
 from homeassistant.components import mqtt
-from homeassistant.components.mqtt.client import RECONNECT_INTERVAL_SECONDS
+from homeassistant.components.mqtt.client import (
+    RECONNECT_INTERVAL_SECONDS,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.const import SUPPORTED_COMPONENTS
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -22,7 +27,13 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     UnitOfTemperature,
 )
-from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.dt import utcnow
 
@@ -575,6 +586,63 @@ async def test_subscribe_topic_level_wildcard_and_wildcard_no_match(
     assert len(recorded_calls) == 0
 
 
+def test_subscription_trie() -> None:
+    """Test the subscription trie matches like the paho matcher."""
+    topic_filters = (
+        "#",
+        "+",
+        "test/#",
+        "test/+",
+        "test/+/state",
+        "+/+/state",
+        "test/level/#",
+        "test/level/state",
+        "$SYS/#",
+        "$SYS/+/uptime",
+        "+/#",
+        "test//state",
+    )
+    topics = (
+        "test",
+        "test/level",
+        "test/level/state",
+        "test/level/state/extra",
+        "other/level/state",
+        "test//state",
+        "$SYS/broker/uptime",
+        "$SYS",
+        "",
+        "/",
+    )
+    trie = SubscriptionTrie()
+    subscriptions = [
+        Subscription(topic_filter, False, HassJob(lambda msg: None))
+        for topic_filter in topic_filters
+    ]
+    for subscription in subscriptions:
+        trie.add(subscription)
+    assert set(trie) == set(subscriptions)
+
+    for topic in topics:
+        paho_matcher = MQTTMatcher()
+        for subscription in subscriptions:
+            paho_matcher[subscription.topic] = subscription
+        assert sorted(sub.topic for sub in trie.match(topic)) == sorted(
+            sub.topic for sub in paho_matcher.iter_match(topic)
+        ), topic
+
+    assert trie.has_topic_filter("test/+/state")
+    assert not trie.has_topic_filter("other/+/state")
+    for subscription in subscriptions:
+        trie.remove(subscription)
+    assert not list(trie)
+    assert not trie.has_topic_filter("test/+/state")
+    # Levels without subscriptions are pruned
+    assert not trie._root.children
+    with pytest.raises(KeyError):
+        trie.remove(subscriptions[0])
+
+
 async def test_subscribe_topic_sys_root(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
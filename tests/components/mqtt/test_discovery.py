@@ -218,6 +218,55 @@ async def test_correct_config_discovery(
     assert ("binary_sensor", "bla") in hass.data["mqtt"].discovery_already_discovered
 
 
+async def test_discovery_messages_processed_together(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test discovery messages received together are added at once."""
+    await mqtt_mock_entry()
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Beer", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+
+    new_payloads: list[list[MQTTDiscoveryPayload]] = []
+
+    @callback
+    def _async_discovery_new(discovery_payloads: list[MQTTDiscoveryPayload]) -> None:
+        new_payloads.append(discovery_payloads)
+
+    unsub = async_dispatcher_connect(
+        hass, MQTT_DISCOVERY_NEW.format("binary_sensor", "mqtt"), _async_discovery_new
+    )
+    for idx in range(3):
+        async_fire_mqtt_message(
+            hass,
+            f"homeassistant/binary_sensor/milk_{idx}/config",
+            f'{{ "name": "Milk {idx}", "state_topic": "test-topic" }}',
+        )
+    # A repeated payload for the same item is dropped
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/milk_2/config",
+        '{ "name": "Milk 2", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    unsub()
+
+    assert len(new_payloads) == 1
+    assert [payload["name"] for payload in new_payloads[0]] == [
+        "Milk 0",
+        "Milk 1",
+        "Milk 2",
+    ]
+    for idx in range(3):
+        assert hass.states.get(f"binary_sensor.milk_{idx}") is not None
+    assert "binary_sensor milk_2, skipping duplicate" in caplog.text
+
+
 async def test_discovery_integration_info(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -794,6 +794,75 @@ async def test_handle_logging_on_writing_the_entity_state(
         )
 
 
+@pytest.mark.parametrize(
+    "hass_config",
+    [
+        {
+            mqtt.DOMAIN: {
+                "sensor": [
+                    {
+                        "name": "temperature",
+                        "state_topic": "test/state",
+                        "value_template": "{{ value_json.temperature }}",
+                    },
+                    {
+                        "name": "temperature_copy",
+                        "state_topic": "test/state",
+                        "value_template": "{{ value_json.temperature }}",
+                    },
+                    {
+                        "name": "humidity",
+                        "state_topic": "test/state",
+                        "value_template": "{{ value_json.humidity }}",
+                    },
+                    {
+                        "name": "own_name",
+                        "state_topic": "test/state",
+                        "value_template": "{{ name }}: {{ value_json.humidity }}",
+                    },
+                ]
+            }
+        }
+    ],
+)
+async def test_value_template_work_shared_between_subscribers(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test the payload is decoded once and identical renders are reused."""
+    await mqtt_mock_entry()
+    with (
+        patch(
+            "homeassistant.components.mqtt.models.json_loads",
+            wraps=mqtt.models.json_loads,
+        ) as json_loads_mock,
+        patch.object(
+            template.Template,
+            "async_render_with_possible_json_value",
+            autospec=True,
+            side_effect=template.Template.async_render_with_possible_json_value,
+        ) as render_mock,
+    ):
+        async_fire_mqtt_message(
+            hass, "test/state", '{"temperature": 21.5, "humidity": 40}'
+        )
+        await hass.async_block_till_done()
+
+    assert json_loads_mock.call_count == 1
+    # The copy of the temperature template is not rendered again
+    assert render_mock.call_count == 3
+    assert hass.states.get("sensor.temperature").state == "21.5"
+    assert hass.states.get("sensor.temperature_copy").state == "21.5"
+    assert hass.states.get("sensor.humidity").state == "40"
+    assert hass.states.get("sensor.own_name").state == "own_name: 40"
+
+    # Values are not reused between messages
+    async_fire_mqtt_message(hass, "test/state", '{"temperature": 22, "humidity": 41}')
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.temperature").state == "22"
+    assert hass.states.get("sensor.temperature_copy").state == "22"
+    assert hass.states.get("sensor.own_name").state == "own_name: 41"
+
+
 async def test_receiving_non_utf8_message_gets_logged(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -1907,6 +1976,8 @@ async def test_disabling_and_enabling_entry(
             config_alarm_control_panel,
         )
         async_fire_mqtt_message(hass, "homeassistant/light/abc/config", config_light)
+        # Discovery messages are processed in the next loop iteration
+        await hass.async_block_till_done()
 
     # Disable MQTT config entry
     await hass.config_entries.async_set_disabled_by(
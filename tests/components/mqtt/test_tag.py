@@ -3,11 +3,13 @@
 from collections.abc import Generator
 import copy
 import json
+from typing import Any
 from unittest.mock import ANY, AsyncMock, patch
 
 import pytest
 
 from homeassistant.components.device_automation import DeviceAutomationType
+from homeassistant.components.mqtt import tag as mqtt_tag
 from homeassistant.components.mqtt.const import DOMAIN as MQTT_DOMAIN
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
@@ -81,6 +83,43 @@ async def test_discover_bad_tag(
     tag_mock.assert_called_once_with(ANY, DEFAULT_TAG_ID, device_entry.id)
 
 
+@pytest.mark.no_fail_on_log_exception
+async def test_discover_tags_with_broken_payload(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    tag_mock: AsyncMock,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a broken payload does not fail the other tags discovered with it."""
+    await mqtt_mock_entry()
+    update_device = mqtt_tag.update_device
+
+    def _update_device(*args: Any) -> str | None:
+        if args[2]["topic"] == "foobar/broken":
+            raise RuntimeError("Boom")
+        return update_device(*args)
+
+    with patch(
+        "homeassistant.components.mqtt.tag.update_device", side_effect=_update_device
+    ):
+        async_fire_mqtt_message(
+            hass, "homeassistant/tag/broken/config", '{ "topic": "foobar/broken" }'
+        )
+        async_fire_mqtt_message(
+            hass, "homeassistant/tag/bla/config", json.dumps(DEFAULT_CONFIG)
+        )
+        await hass.async_block_till_done()
+
+    assert "Unexpected error setting up discovered MQTT tag" in caplog.text
+    assert ("tag", "broken") not in hass.data["mqtt"].discovery_already_discovered
+    assert ("tag", "bla") in hass.data["mqtt"].discovery_already_discovered
+
+    # Fake tag scan.
+    async_fire_mqtt_message(hass, "foobar/tag_scanned", DEFAULT_TAG_SCAN)
+    await hass.async_block_till_done()
+    tag_mock.assert_called_once_with(ANY, DEFAULT_TAG_ID, None)
+
+
 async def test_if_fires_on_mqtt_message_with_device(
     hass: HomeAssistant,
     device_registry: dr.DeviceRegistry,
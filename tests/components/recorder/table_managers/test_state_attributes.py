@@ -0,0 +1,64 @@
+"""Test state attributes table manager."""
+
+from unittest.mock import patch
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import Recorder
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+
+
+def _state_changed_event(
+    entity_id: str, old_state: State | None, new_state: State | None
+) -> Event[EventStateChangedData]:
+    """Create a state changed event."""
+    return Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": entity_id, "old_state": old_state, "new_state": new_state},
+    )
+
+
+async def test_serialize_reuses_unchanged_attributes(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test attributes kept from the old state are not serialized again."""
+    manager = recorder.get_instance(hass).state_attributes_manager
+    first = State("sensor.power", "1", {"unit_of_measurement": "W"})
+    second = State("sensor.power", "2", first.attributes)
+    third = State("sensor.power", "3", {"unit_of_measurement": "kW"})
+
+    with patch(
+        "homeassistant.components.recorder.table_managers.state_attributes."
+        "StateAttributes.shared_attrs_bytes_from_event",
+        wraps=recorder.db_schema.StateAttributes.shared_attrs_bytes_from_event,
+    ) as mock_serialize:
+        first_bytes = manager.serialize_from_event(
+            _state_changed_event("sensor.power", None, first)
+        )
+        assert first_bytes == b'{"unit_of_measurement":"W"}'
+        assert mock_serialize.call_count == 1
+
+        assert (
+            manager.serialize_from_event(
+                _state_changed_event("sensor.power", first, second)
+            )
+            is first_bytes
+        )
+        assert mock_serialize.call_count == 1
+
+        assert (
+            manager.serialize_from_event(
+                _state_changed_event("sensor.power", second, third)
+            )
+            == b'{"unit_of_measurement":"kW"}'
+        )
+        assert mock_serialize.call_count == 2
+
+        assert (
+            manager.serialize_from_event(
+                _state_changed_event("sensor.power", third, None)
+            )
+            == b"{}"
+        )
+        manager.serialize_from_event(_state_changed_event("sensor.power", None, third))
+        assert mock_serialize.call_count == 4
@@ -0,0 +1,244 @@
+"""Test the recorder backlog queue."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import backlog
+from homeassistant.components.recorder.backlog import (
+    PROCESS_SPILLED_EVENTS_TASK,
+    SEGMENT_SUFFIX,
+    RecorderQueue,
+)
+from homeassistant.components.recorder.history import get_significant_states
+from homeassistant.components.recorder.tasks import CommitTask
+from homeassistant.components.recorder.util import get_instance
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, HomeAssistant, State
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+def _spill_files(spill_dir: Path) -> list[Path]:
+    """Return the segment files in the spill directory."""
+    if not spill_dir.exists():
+        return []
+    return [path for path in spill_dir.iterdir() if path.suffix == SEGMENT_SUFFIX]
+
+
+class _SpillJobs:
+    """Hold the spill jobs of a queue until the test runs them."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the jobs."""
+        self._hass = hass
+        self._jobs: list[Callable[[], None]] = []
+
+    def add(self, target: Callable[..., None], *args: object) -> None:
+        """Hold a job instead of running it in the executor."""
+        self._jobs.append(partial(target, *args))
+
+    async def run(self) -> None:
+        """Run the held jobs one after the other in the executor."""
+        while self._jobs:
+            await self._hass.loop.run_in_executor(None, self._jobs.pop(0))
+
+
+def _state_changed_event(entity_id: str, state: str, old: State | None) -> Event:
+    """Create a state_changed event."""
+    new_state = State(
+        entity_id,
+        state,
+        {"friendly_name": "Test", "value": [1, 2, 3]},
+        context=Context(user_id="b" * 32),
+        state_info={"unrecorded_attributes": frozenset({"value"})},
+    )
+    return Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": entity_id, "old_state": old, "new_state": new_state},
+        context=new_state.context,
+    )
+
+
+async def test_queue_spills_and_replays_in_order(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test events beyond the in-memory limit are spilled and replayed in order."""
+    spill_dir = tmp_path / "spill"
+    queue = RecorderQueue(hass, str(spill_dir), 2, 1024**2)
+    events: list[Event] = []
+    old_state: State | None = None
+    for idx in range(20):
+        event = _state_changed_event("sensor.test", str(idx), old_state)
+        old_state = event.data["new_state"]
+        events.append(event)
+    events.append(Event("custom_event", {"key": "value"}))
+    commit_task = CommitTask()
+    jobs = _SpillJobs(hass)
+
+    with (
+        patch.object(backlog, "SEGMENT_SIZE", 256),
+        patch.object(hass, "async_add_executor_job", jobs.add),
+    ):
+        queue.put(events[0])
+        queue.put(events[1])
+        assert not queue.spilling
+        queue.put(events[2])
+        # Events are appended to the segment once it is open
+        await jobs.run()
+        for event in events[3:11]:
+            queue.put(event)
+        assert queue.spilling
+        # Tasks are never spilled
+        queue.put(commit_task)
+        for event in events[11:]:
+            queue.put(event)
+        await jobs.run()
+
+    assert queue.qsize() == len(events) + 2
+    assert len(_spill_files(spill_dir)) > 1
+    assert queue.get_nowait() is events[0]
+    assert queue.get_nowait() is events[1]
+    assert queue.get_nowait() is PROCESS_SPILLED_EVENTS_TASK
+    assert queue.get_nowait() is commit_task
+
+    replayed = await hass.async_add_executor_job(list, queue.iter_spilled())
+    assert not queue.spilling
+    assert queue.empty()
+    assert queue.qsize() == 0
+    assert _spill_files(spill_dir) == []
+
+    assert len(replayed) == len(events) - 2
+    for original, event in zip(events[2:], replayed, strict=True):
+        assert event.event_type == original.event_type
+        assert event.time_fired_timestamp == original.time_fired_timestamp
+        assert event.context.as_dict() == original.context.as_dict()
+    for original, event in zip(events[2:-1], replayed[:-1], strict=True):
+        assert event.data["entity_id"] == "sensor.test"
+        for key in ("old_state", "new_state"):
+            assert event.data[key].as_dict() == original.data[key].as_dict()
+        assert event.data["new_state"].state_info == {
+            "unrecorded_attributes": frozenset({"value"})
+        }
+    assert replayed[-1].data == {"key": "value"}
+
+    # New events go to memory again once the spill is empty
+    queue.put(events[0])
+    assert not queue.spilling
+    assert queue.get_nowait() is events[0]
+    await hass.async_add_executor_job(queue.close)
+
+
+async def test_queue_keeps_events_in_memory_when_spill_is_full(
+    hass: HomeAssistant, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test events are kept in memory in order when the spill is full."""
+    spill_dir = tmp_path / "spill"
+    queue = RecorderQueue(hass, str(spill_dir), 1, 300)
+    events = [Event("custom_event", {"idx": idx}) for idx in range(20)]
+    jobs = _SpillJobs(hass)
+
+    with (
+        patch.object(backlog, "SEGMENT_SIZE", 256),
+        patch.object(hass, "async_add_executor_job", jobs.add),
+    ):
+        for event in events:
+            queue.put(event)
+            await jobs.run()
+
+    assert "reached the maximum size of 300 bytes" in caplog.text
+    assert not queue.spilling
+    assert queue.get_nowait() is events[0]
+    assert queue.get_nowait() is PROCESS_SPILLED_EVENTS_TASK
+    spilled = await hass.async_add_executor_job(list, queue.iter_spilled())
+    in_memory: list[Event] = []
+    while not queue.empty():
+        in_memory.append(queue.get_nowait())
+    assert in_memory
+    assert in_memory == events[1 + len(spilled) :]
+    assert [event.data for event in spilled] == [
+        event.data for event in events[1 : 1 + len(spilled)]
+    ]
+    assert _spill_files(spill_dir) == []
+    await hass.async_add_executor_job(queue.close)
+
+
+async def test_queue_clear_and_close(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test clearing and closing the queue removes the spill."""
+    spill_dir = tmp_path / "spill"
+    stale_file = spill_dir / f"stale{SEGMENT_SUFFIX}"
+    spill_dir.mkdir()
+    stale_file.touch()
+    queue = RecorderQueue(hass, str(spill_dir), 1, 1024**2)
+    jobs = _SpillJobs(hass)
+    with patch.object(hass, "async_add_executor_job", jobs.add):
+        for idx in range(5):
+            queue.put(Event("custom_event", {"idx": idx}))
+        await jobs.run()
+    assert not stale_file.exists()
+    assert len(_spill_files(spill_dir)) == 1
+
+    queue.clear()
+    assert queue.empty()
+    assert queue.qsize() == 0
+    await hass.async_add_executor_job(queue.close)
+    assert _spill_files(spill_dir) == []
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_database_lock_spills_events_to_disk(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    tmp_path: Path,
+) -> None:
+    """Test events are spilled while the database is locked and written after.
+
+    This test is specific for SQLite: Locking is not implemented for other engines.
+
+    Use file DB, in memory DB cannot do write locks.
+    """
+    hass.config.config_dir = str(tmp_path)
+    spill_dir = tmp_path / recorder.const.QUEUE_SPILL_DIR
+    with (
+        patch.object(recorder.core, "MAX_QUEUE_BACKLOG_MIN_VALUE", 1),
+        patch.object(recorder.core, "DB_LOCK_QUEUE_CHECK_TIMEOUT", 0.01),
+        patch.object(recorder.core, "MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG", 0),
+        patch.object(
+            recorder.core.Recorder, "_available_memory", return_value=sys.maxsize
+        ),
+    ):
+        await async_setup_recorder_instance(hass, {recorder.CONF_COMMIT_INTERVAL: 0})
+        await async_wait_recording_done(hass)
+        instance = get_instance(hass)
+        start = dt_util.utcnow()
+
+        assert await instance.lock_database()
+        for idx in range(50):
+            hass.states.async_set("sensor.test", str(idx))
+        await hass.async_block_till_done()
+        assert instance.backlog >= 50
+        assert _spill_files(spill_dir)
+        assert not instance._reached_max_backlog()
+
+        assert instance.unlock_database()
+        await async_wait_recording_done(hass)
+
+    states = await instance.async_add_executor_job(
+        get_significant_states, hass, start, None, ["sensor.test"]
+    )
+    assert [state.state for state in states["sensor.test"]] == [
+        str(idx) for idx in range(50)
+    ]
+    assert _spill_files(spill_dir) == []
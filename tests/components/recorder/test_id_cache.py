@@ -0,0 +1,126 @@
+"""Test the recorder id cache is saved on shutdown and restored on startup."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import core
+from homeassistant.components.recorder.db_schema import SCHEMA_VERSION
+from homeassistant.components.recorder.id_cache import load_id_cache, save_id_cache
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+
+from .common import async_wait_recording_done
+
+from tests.common import async_test_home_assistant
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+def test_save_and_load_id_cache(tmp_path: Path) -> None:
+    """Test saving and loading the id cache."""
+    path = str(tmp_path / "id_cache")
+    sections = [[3, 2, 1], [], [2**40]]
+    save_id_cache(path, SCHEMA_VERSION, sections)
+
+    assert load_id_cache(path, SCHEMA_VERSION, 3) == sections
+    # The snapshot is removed once it is loaded
+    assert load_id_cache(path, SCHEMA_VERSION, 3) is None
+
+    save_id_cache(path, SCHEMA_VERSION, sections)
+    assert load_id_cache(path, SCHEMA_VERSION + 1, 3) is None
+    save_id_cache(path, SCHEMA_VERSION, sections)
+    assert load_id_cache(path, SCHEMA_VERSION, 2) is None
+
+
+def test_load_corrupt_id_cache(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a corrupt id cache is discarded."""
+    path = tmp_path / "id_cache"
+    save_id_cache(str(path), SCHEMA_VERSION, [[3, 2, 1]])
+    data = bytearray(path.read_bytes())
+    data[-10] ^= 0xFF
+    path.write_bytes(data)
+
+    assert load_id_cache(str(path), SCHEMA_VERSION, 1) is None
+    assert "Discarding corrupt recorder id cache" in caplog.text
+    assert not path.exists()
+
+    path.write_bytes(b"HAID")
+    assert load_id_cache(str(path), SCHEMA_VERSION, 1) is None
+
+
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_id_cache_restored_after_restart(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Test recently used ids are restored without looking them up by hash."""
+    attributes = {"friendly_name": "Test", "unit_of_measurement": "W"}
+
+    async with (
+        async_test_home_assistant() as hass,
+        async_test_recorder(hass) as instance,
+    ):
+        for idx in range(5):
+            hass.states.async_set(f"sensor.test_{idx}", "1", attributes | {"idx": idx})
+        await async_wait_recording_done(hass)
+        attributes_ids = instance.state_attributes_manager.get_recent_ids(10)
+        metadata_ids = instance.states_meta_manager.get_recent_ids(10)
+        assert len(attributes_ids) == 5
+        assert len(metadata_ids) == 5
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await hass.async_block_till_done()
+        await hass.async_stop()
+
+    with patch.object(
+        recorder.table_managers.state_attributes,
+        "get_shared_attributes",
+        side_effect=RuntimeError("Should not be called"),
+    ):
+        async with (
+            async_test_home_assistant() as hass,
+            async_test_recorder(hass) as instance,
+        ):
+            await async_wait_recording_done(hass)
+            assert (
+                instance.state_attributes_manager.get_recent_ids(10) == attributes_ids
+            )
+            assert instance.states_meta_manager.get_recent_ids(10) == metadata_ids
+            for idx in range(5):
+                hass.states.async_set(
+                    f"sensor.test_{idx}", "2", attributes | {"idx": idx}
+                )
+            await async_wait_recording_done(hass)
+            assert (
+                instance.state_attributes_manager.get_recent_ids(10) == attributes_ids
+            )
+            hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+            await hass.async_block_till_done()
+            await hass.async_stop()
+
+
+async def test_id_cache_not_saved_for_in_memory_database(
+    async_test_recorder: RecorderInstanceGenerator,
+    recorder_db_url: str,
+) -> None:
+    """Test the id cache is not saved for an in-memory database."""
+    if recorder_db_url != "sqlite://":
+        pytest.skip("Only relevant for an in-memory database")
+    with patch.object(core, "save_id_cache") as save_mock:
+        async with (
+            async_test_home_assistant() as hass,
+            async_test_recorder(hass) as instance,
+        ):
+            assert instance._id_cache_path is None
+            hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+            await hass.async_block_till_done()
+            await hass.async_stop()
+    save_mock.assert_not_called()
@@ -20,6 +20,7 @@ from homeassistant.components import recorder
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
     CONF_AUTO_REPACK,
+    CONF_BULK_INSERT,
     CONF_COMMIT_INTERVAL,
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
@@ -1469,6 +1470,92 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize(
+    "recorder_config", [{CONF_BULK_INSERT: True, CONF_COMMIT_INTERVAL: 1}]
+)
+async def test_saving_sets_old_state_bulk_insert(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test saving states with the bulk writer links old states in the same commit."""
+    instance = recorder.get_instance(hass)
+    assert instance.states_bulk_writer is not None
+
+    hass.states.async_set("test.one", "s1", {"shared": True})
+    hass.states.async_set("test.two", "s2", {"shared": True})
+    hass.states.async_set("test.one", "s3", {"shared": True})
+    hass.states.async_set("test.one", "s4", {"other": True})
+    hass.states.async_remove("test.two")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 5
+        states_by_state = {state.state: state for state in states}
+        assert session.query(StatesMeta).count() == 2
+        assert session.query(StateAttributes).count() == 3
+
+    assert states_by_state["s1"].entity_id == "test.one"
+    assert states_by_state["s2"].entity_id == "test.two"
+    assert states_by_state["s3"].entity_id == "test.one"
+    assert states_by_state["s4"].entity_id == "test.one"
+    assert states_by_state[None].entity_id == "test.two"
+
+    assert states_by_state["s1"].old_state_id is None
+    assert states_by_state["s2"].old_state_id is None
+    assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+    assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+    assert states_by_state[None].old_state_id == states_by_state["s2"].state_id
+    assert states_by_state["s1"].attributes_id == states_by_state["s3"].attributes_id
+    assert states_by_state["s4"].attributes_id != states_by_state["s3"].attributes_id
+
+    # The next commit links to the committed state without a query
+    assert instance.states_manager.pop_committed("test.two") is None
+    hass.states.async_set("test.one", "s5", {"other": True})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        s5 = session.query(States).filter(States.state == "s5").one()
+        assert s5.old_state_id == states_by_state["s4"].state_id
+        assert s5.attributes_id == states_by_state["s4"].attributes_id
+        assert session.query(StateAttributes).count() == 3
+
+
+@pytest.mark.parametrize(
+    "recorder_config", [{CONF_BULK_INSERT: True, CONF_COMMIT_INTERVAL: 1}]
+)
+async def test_bulk_insert_with_serializable_data(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
+) -> None:
+    """Test the bulk writer skips states that cannot be serialized."""
+    hass.states.async_set("test.one", "s1", {"fail": CannotSerializeMe()})
+    hass.states.async_set("test.two", "s2", {})
+    hass.states.async_set("test.two", "s3", {})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id, States.state_id, States.old_state_id, States.state
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 2
+        states_by_state = {state.state: state for state in states}
+        assert states_by_state["s2"].entity_id == "test.two"
+        assert states_by_state["s3"].entity_id == "test.two"
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s2"].state_id
+
+    assert "State is not JSON serializable" in caplog.text
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -1885,6 +1972,7 @@ async def test_database_lock_and_overflow(
 
     with (
         patch.object(recorder.core, "MAX_QUEUE_BACKLOG_MIN_VALUE", 1),
+        patch.object(recorder.core, "MAX_QUEUE_SPILL_BYTES", 0),
         patch.object(recorder.core, "DB_LOCK_QUEUE_CHECK_TIMEOUT", 0.01),
         patch.object(
             recorder.core, "MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG", sys.maxsize
@@ -1967,6 +2055,7 @@ async def test_database_lock_and_overflow_checks_available_memory(
 
     with (
         patch.object(recorder.core, "MAX_QUEUE_BACKLOG_MIN_VALUE", 1),
+        patch.object(recorder.core, "MAX_QUEUE_SPILL_BYTES", 0),
         patch.object(
             recorder.core,
             "MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG",
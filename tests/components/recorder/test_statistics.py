@@ -1844,6 +1844,193 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.parametrize("time_zone", ["Europe/Berlin"])
+async def test_reduce_statistics_per_period(
+    hass: HomeAssistant, time_zone: str
+) -> None:
+    """Test reducing hourly statistics with gaps and missing values."""
+    await hass.config.async_set_time_zone(time_zone)
+    # The period spans the end of daylight saving time in Europe/Berlin
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-10-29 00:00:00+02:00"))
+    hourly = [
+        (0, 1.0, 0.0, 2.0, 10.0),
+        (1, None, None, None, 11.0),
+        (23, 3.0, 1.0, 5.0, 12.0),
+        (24, None, None, None, 13.0),
+        (25, 5.0, 5.0, 5.0, 14.0),
+        (26, 6.0, 4.0, 9.0, 15.0),
+        (73, None, None, None, 16.0),
+    ]
+    stats = {
+        "test:total": [
+            {
+                "start": (start + timedelta(hours=hour)).timestamp(),
+                "end": (start + timedelta(hours=hour + 1)).timestamp(),
+                "mean": mean,
+                "min": min_,
+                "max": max_,
+                "sum": sum_,
+                "last_reset": None,
+                "state": sum_,
+            }
+            for hour, mean, min_, max_, sum_ in hourly
+        ]
+    }
+    types = {"last_reset", "max", "mean", "min", "state", "sum"}
+
+    def _day(day: str) -> tuple[float, float]:
+        day_start = dt_util.parse_datetime(f"2022-10-{day} 00:00:00")
+        day_start = day_start.replace(tzinfo=dt_util.get_default_time_zone())
+        return day_start.timestamp(), (day_start + timedelta(days=1)).timestamp()
+
+    def _row(
+        period: tuple[float, float],
+        mean: float | None,
+        min_: float | None,
+        max_: float | None,
+        sum_: float,
+    ) -> dict[str, Any]:
+        return {
+            "start": period[0],
+            "end": period[1],
+            "mean": mean,
+            "min": min_,
+            "max": max_,
+            "sum": sum_,
+            "last_reset": None,
+            "state": sum_,
+        }
+
+    # The 30th has 25 hours, hour 73 is on the 1st of November
+    nov_1 = dt_util.parse_datetime("2022-11-01 00:00:00").replace(
+        tzinfo=dt_util.get_default_time_zone()
+    )
+    assert statistics._reduce_statistics_per_day(stats, types) == {
+        "test:total": [
+            _row(_day("29"), 2.0, 0.0, 5.0, 12.0),
+            _row(_day("30"), 5.5, 4.0, 9.0, 15.0),
+            _row(
+                (nov_1.timestamp(), (nov_1 + timedelta(days=1)).timestamp()),
+                None,
+                None,
+                None,
+                16.0,
+            ),
+        ]
+    }
+    oct_1 = dt_util.parse_datetime("2022-10-01 00:00:00").replace(
+        tzinfo=dt_util.get_default_time_zone()
+    )
+    assert statistics._reduce_statistics_per_month(stats, types) == {
+        "test:total": [
+            _row((oct_1.timestamp(), nov_1.timestamp()), 3.75, 0.0, 9.0, 15.0),
+            _row(
+                (
+                    nov_1.timestamp(),
+                    nov_1.replace(month=12).timestamp(),
+                ),
+                None,
+                None,
+                None,
+                16.0,
+            ),
+        ]
+    }
+    # Weeks start on Monday the 24th and Monday the 31st
+    assert statistics._reduce_statistics_per_week(stats, {"mean"}) == {
+        "test:total": [
+            {"start": _day("24")[0], "end": _day("31")[0], "mean": 3.75},
+            {
+                "start": _day("31")[0],
+                "end": (nov_1 + timedelta(days=6)).timestamp(),
+                "mean": None,
+            },
+        ]
+    }
+    assert statistics._reduce_statistics_per_day({}, types) == {}
+
+
+@pytest.mark.parametrize(
+    "timezone",
+    ["America/Regina", "Europe/Vienna", "US/Pacific", "Australia/Lord_Howe", "UTC"],
+)
+@pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
+async def test_statistics_during_period_grouped_in_database(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    timezone: str,
+) -> None:
+    """Test grouping by period in the database matches reducing in Python."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+
+    # Hourly statistics from September to December with gaps and missing means
+    first_start = dt_util.parse_datetime("2021-09-20 05:00:00+00:00")
+    external_statistics = []
+    total = 0.0
+    for hour in range(24 * 80):
+        if hour % 50 < 3:
+            continue
+        total += hour % 7
+        external_statistics.append(
+            {
+                "start": first_start + timedelta(hours=hour),
+                "mean": None if hour % 11 == 0 else float(hour % 13),
+                "min": None if hour % 11 == 0 else float(hour % 13 - 1),
+                "max": None if hour % 11 == 0 else float(hour % 13 + 1),
+                "last_reset": None,
+                "state": float(hour % 7),
+                "sum": total,
+            }
+        )
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    start_time = dt_util.parse_datetime("2021-09-25 00:00:00+00:00")
+    end_time = dt_util.parse_datetime("2021-11-25 00:00:00+00:00")
+    for period in ("day", "week", "month"):
+        for end in (end_time, None):
+            for types in (
+                {"last_reset", "max", "mean", "min", "state", "sum"},
+                {"mean"},
+                {"sum"},
+                {"change"},
+            ):
+                kwargs = {
+                    "start_time": start_time,
+                    "end_time": end,
+                    "statistic_ids": {"test:total_energy_import"},
+                    "period": period,
+                    "units": {"energy": "Wh"},
+                    "types": types,
+                }
+                with patch.object(
+                    statistics,
+                    "_statistics_during_period_grouped",
+                    wraps=statistics._statistics_during_period_grouped,
+                ) as grouped_mock:
+                    grouped = statistics_during_period(hass, **kwargs)
+                    grouped_mock.assert_called_once()
+                    grouped_mock.reset_mock()
+                    # Without a known dialect the rows are reduced in Python
+                    with patch.object(recorder_mock, "dialect_name", None):
+                        reduced = statistics_during_period(hass, **kwargs)
+                    grouped_mock.assert_not_called()
+                assert grouped.keys() == reduced.keys()
+                # Means are converted before or after averaging
+                assert grouped["test:total_energy_import"] == [
+                    pytest.approx(row) for row in reduced["test:total_energy_import"]
+                ]
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
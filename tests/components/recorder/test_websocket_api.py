@@ -231,6 +231,88 @@ async def test_statistics_during_period(
     }
 
 
+async def test_statistics_during_period_shared(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test identical statistics_during_period requests share one query."""
+    now = get_start_time(dt_util.utcnow())
+
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set(
+        "sensor.test",
+        10,
+        attributes=POWER_SENSOR_KW_ATTRIBUTES,
+        timestamp=now.timestamp(),
+    )
+    await async_wait_recording_done(hass)
+    do_adhoc_statistics(hass, start=now)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+
+    async def _send_requests(*start_times: datetime.datetime) -> list[dict]:
+        """Send the requests before waiting for any response."""
+        for start_time in start_times:
+            await client.send_json_auto_id(
+                {
+                    "type": "recorder/statistics_during_period",
+                    "start_time": start_time.isoformat(),
+                    "statistic_ids": ["sensor.test"],
+                    "period": "5minute",
+                    "types": ["mean"],
+                }
+            )
+        responses = [await client.receive_json() for _ in start_times]
+        assert all(response["success"] for response in responses)
+        return [response["result"] for response in responses]
+
+    expected = {
+        "sensor.test": [
+            {
+                "start": int(now.timestamp() * 1000),
+                "end": int((now + timedelta(minutes=5)).timestamp() * 1000),
+                "mean": pytest.approx(10),
+            }
+        ]
+    }
+    with patch(
+        "homeassistant.components.recorder.websocket_api.statistics_during_period",
+        wraps=statistics_during_period,
+    ) as statistics_during_period_mock:
+        # Start times are rounded up to the next 5 minute statistics row
+        results = await _send_requests(
+            now, now - timedelta(minutes=1), now - timedelta(minutes=4)
+        )
+        assert results == [expected] * 3
+        assert statistics_during_period_mock.call_count == 1
+
+        # Served from the cache
+        assert await _send_requests(now) == [expected]
+        assert statistics_during_period_mock.call_count == 1
+
+        # Rounding up does not include the next statistics row
+        assert await _send_requests(now + timedelta(minutes=1)) == [{}]
+        assert statistics_during_period_mock.call_count == 2
+
+        # New statistics invalidate the cache
+        do_adhoc_statistics(hass, start=now + timedelta(minutes=5))
+        await async_wait_recording_done(hass)
+        assert await _send_requests(now) == [
+            {
+                "sensor.test": [
+                    *expected["sensor.test"],
+                    {
+                        "start": int((now + timedelta(minutes=5)).timestamp() * 1000),
+                        "end": int((now + timedelta(minutes=10)).timestamp() * 1000),
+                        "mean": pytest.approx(10),
+                    },
+                ]
+            }
+        ]
+        assert statistics_during_period_mock.call_count == 3
+
+
 @pytest.mark.freeze_time(datetime.datetime(2022, 10, 21, 7, 25, tzinfo=datetime.UTC))
 @pytest.mark.parametrize("offset", [0, 1, 2])
 async def test_statistic_during_period(
@@ -2551,6 +2633,7 @@ async def test_recorder_info_migration_queue_exhausted(
             new=create_engine_test,
         ),
         patch.object(recorder.core, "MAX_QUEUE_BACKLOG_MIN_VALUE", 1),
+        patch.object(recorder.core, "MAX_QUEUE_SPILL_BYTES", 0),
         patch.object(
             recorder.core, "MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG", sys.maxsize
         ),
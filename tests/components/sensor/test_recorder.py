@@ -34,7 +34,16 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    DOMAIN,
+    SensorDeviceClass,
+    recorder as sensor_recorder,
+)
+from homeassistant.components.sensor.accumulator import (
+    SensorStatisticsAccumulator,
+    get_accumulator,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component
@@ -2361,6 +2370,77 @@ async def test_compile_hourly_statistics_fails(
     assert "Error while processing event StatisticsTask" in caplog.text
 
 
+async def test_compile_statistics_from_running_aggregate(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test statistics compiled from the running aggregate match the database."""
+    # All states must be recorded after the recorder run started
+    zero = get_start_time(dt_util.utcnow() + timedelta(minutes=10))
+    end = zero + timedelta(minutes=5)
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    energy_attributes = {**ENERGY_SENSOR_ATTRIBUTES, "state_class": "total_increasing"}
+
+    freezer.move_to(zero - timedelta(minutes=1))
+    hass.states.async_set("sensor.power", "10", POWER_SENSOR_ATTRIBUTES)
+    hass.states.async_set("sensor.energy", "100", energy_attributes)
+    hass.states.async_set("sensor.temperature", "20", TEMPERATURE_SENSOR_ATTRIBUTES)
+    hass.states.async_set("sensor.pressure", "1000", PRESSURE_SENSOR_ATTRIBUTES)
+
+    freezer.move_to(zero)
+    get_accumulator(hass)
+    await hass.async_block_till_done()
+
+    freezer.move_to(zero + timedelta(seconds=30))
+    hass.states.async_set("sensor.power", "20", POWER_SENSOR_ATTRIBUTES)
+    hass.states.async_set("sensor.energy", "110", energy_attributes)
+    freezer.move_to(zero + timedelta(seconds=60))
+    hass.states.async_set("sensor.power", STATE_UNAVAILABLE, POWER_SENSOR_ATTRIBUTES)
+    hass.states.async_set("sensor.energy", "50", energy_attributes)
+    freezer.move_to(zero + timedelta(seconds=90))
+    hass.states.async_set("sensor.power", "30", POWER_SENSOR_ATTRIBUTES)
+    hass.states.async_set("sensor.energy", "70", energy_attributes)
+    freezer.move_to(zero + timedelta(seconds=120))
+    # Attribute changes are not significant
+    hass.states.async_set(
+        "sensor.power", "30", {**POWER_SENSOR_ATTRIBUTES, ATTR_FRIENDLY_NAME: "Power"}
+    )
+    freezer.move_to(zero + timedelta(seconds=200))
+    hass.states.async_set("sensor.temperature", "22", TEMPERATURE_SENSOR_ATTRIBUTES)
+    # Changes after the period are not included
+    freezer.move_to(end + timedelta(seconds=10))
+    hass.states.async_set("sensor.power", "50", POWER_SENSOR_ATTRIBUTES)
+    hass.states.async_set("sensor.energy", "80", energy_attributes)
+    await async_wait_recording_done(hass)
+
+    def _compile_statistics() -> list[dict[str, Any]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return sensor_recorder.compile_statistics(
+                hass, session, zero, end
+            ).platform_stats
+
+    instance = get_instance(hass)
+    with patch.object(SensorStatisticsAccumulator, "summarize", return_value=None):
+        expected = await instance.async_add_executor_job(_compile_statistics)
+    with patch.object(
+        history, "get_full_significant_states_with_session"
+    ) as get_full_significant_states_with_session:
+        compiled = await instance.async_add_executor_job(_compile_statistics)
+    get_full_significant_states_with_session.assert_not_called()
+
+    assert len(expected) == 4
+    expected_by_id = {result["meta"]["statistic_id"]: result for result in expected}
+    for result in compiled:
+        expected_result = expected_by_id.pop(result["meta"]["statistic_id"])
+        assert result["meta"] == expected_result["meta"]
+        expected_stat = dict(expected_result["stat"])
+        if "mean" in expected_stat:
+            expected_stat["mean"] = pytest.approx(expected_stat["mean"])
+        assert result["stat"] == expected_stat
+    assert not expected_by_id
+
+
 @pytest.mark.parametrize(
     (
         "state_class",
@@ -6,6 +6,7 @@ from http import HTTPStatus
 import itertools
 import math
 import re
+from unittest.mock import patch
 from urllib.parse import urlparse
 
 from aiohttp import web
@@ -22,6 +23,7 @@ from homeassistant.components.stream.const import (
     HLS_PROVIDER,
 )
 from homeassistant.components.stream.core import Part
+from homeassistant.components.stream.hls import HlsPlaylistView
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 
@@ -621,6 +623,72 @@ async def test_ll_hls_playlist_msn_part(
     stream_worker_sync.resume()
 
 
+async def test_ll_hls_playlist_shared_by_blocking_requests(
+    hass: HomeAssistant, hls_stream, stream_worker_sync, hls_sync
+) -> None:
+    """Test blocking requests for the same part share the rendered playlist."""
+    await async_setup_component(
+        hass,
+        "stream",
+        {
+            "stream": {
+                CONF_LL_HLS: True,
+                CONF_SEGMENT_DURATION: SEGMENT_DURATION,
+                CONF_PART_DURATION: TEST_PART_DURATION,
+            }
+        },
+    )
+
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+
+    hls = stream.add_provider(HLS_PROVIDER)
+
+    hls_client = await hls_stream(stream)
+
+    # Seed hls with 1 complete segment and 1 in process segment
+    segment = create_segment(sequence=0)
+    hls.put(segment)
+    for part in create_parts(SEQUENCE_BYTES):
+        segment.async_add_part(part, 0)
+        hls.part_put()
+    complete_segment(segment)
+    # The data of a complete segment is only joined once
+    assert segment.get_data() is segment.get_data()
+
+    segment = create_segment(sequence=1)
+    hls.put(segment)
+    remaining_parts = create_parts(SEQUENCE_BYTES)
+    segment.async_add_part(remaining_parts.pop(0), 0)
+
+    with patch.object(
+        HlsPlaylistView, "render", wraps=HlsPlaylistView.render
+    ) as mock_render:
+        hls_sync.reset_request_pool(3)
+        msn_requests = asyncio.gather(
+            *(hls_client.get("/playlist.m3u8?_HLS_msn=1&_HLS_part=1") for _ in range(3))
+        )
+        await hls_sync.wait_for_handler()
+        segment.async_add_part(remaining_parts.pop(0), 0)
+        hls.part_put()
+        msn_responses = await msn_requests
+
+        assert all(response.status == HTTPStatus.OK for response in msn_responses)
+        playlists = {await response.text() for response in msn_responses}
+        assert len(playlists) == 1
+        assert make_hint(1, 2) in playlists.pop()
+        assert mock_render.call_count == 1
+
+        # The playlist is rendered again once a part is added
+        segment.async_add_part(remaining_parts.pop(0), 0)
+        response = await hls_client.get("/playlist.m3u8")
+        assert response.status == HTTPStatus.OK
+        assert make_hint(1, 3) in await response.text()
+        assert mock_render.call_count == 2
+
+    stream_worker_sync.resume()
+
+
 async def test_get_part_segments(
     hass: HomeAssistant, hls_stream, stream_worker_sync, hls_sync
 ) -> None:
@@ -156,6 +156,8 @@ async def test_forecasts(
         },
     )
     await hass.async_block_till_done()
+    # The forecast templates render the state the template entity writes
+    await hass.async_block_till_done()
     state = hass.states.get("weather.forecast")
     assert state is not None
     assert state.state == "sunny"
@@ -187,7 +189,7 @@ async def test_forecasts(
         return_response=True,
     )
     assert response == snapshot
-
+    print("SECOND")
     hass.states.async_set(
         "weather.forecast",
         "sunny",
@@ -202,6 +204,9 @@ async def test_forecasts(
         },
     )
     await hass.async_block_till_done()
+    # The forecast templates render the state the template entity writes
+    await hass.async_block_till_done()
+    print("DONE")
     state = hass.states.get("weather.forecast")
     assert state is not None
     assert state.state == "sunny"
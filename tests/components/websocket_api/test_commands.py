@@ -18,6 +18,9 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
+from homeassistant.components.websocket_api.states_snapshot import (
+    async_get_states_snapshot,
+)
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
@@ -692,6 +695,41 @@ async def test_get_states(
     assert msg["result"] == states
 
 
+async def test_get_states_shares_snapshot(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_states reuses the snapshot until a state changes."""
+    hass.states.async_set("greeting.hello", "world")
+
+    with patch(
+        "homeassistant.components.websocket_api.commands._async_get_allowed_states"
+    ) as mock_get_allowed_states:
+        for id_ in (5, 6):
+            await websocket_client.send_json({"id": id_, "type": "get_states"})
+            msg = await websocket_client.receive_json()
+            assert msg["id"] == id_
+            assert msg["success"]
+            assert msg["result"] == [hass.states.get("greeting.hello").as_dict()]
+    # Admin users don't need the states filtered
+    mock_get_allowed_states.assert_not_called()
+
+    snapshot = async_get_states_snapshot(hass)
+    payload = snapshot.async_get_payload()
+    assert snapshot.async_get_payload() is payload
+
+    hass.states.async_set("greeting.bye", "universe")
+    assert snapshot.async_get_payload() is not payload
+
+    await websocket_client.send_json({"id": 7, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == [state.as_dict() for state in hass.states.async_all()]
+
+    hass.states.async_remove("greeting.hello")
+    await websocket_client.send_json({"id": 8, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == [hass.states.get("greeting.bye").as_dict()]
+
+
 async def test_get_services(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -2865,6 +2903,78 @@ async def test_integration_descriptions(
     assert response["result"]
 
 
+async def test_subscribe_entities_with_interned_strings(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribe entities referencing the string table."""
+    hass.states.async_set(
+        "sensor.kitchen",
+        "20",
+        {"friendly_name": "Kitchen", "unit_of_measurement": "°C"},
+    )
+    hass.states.async_set(
+        "sensor.attic", "15", {"friendly_name": "Attic", "unit_of_measurement": "°C"}
+    )
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_INTERNED_STRINGS: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    strings = msg["event"]["st"]
+    assert sorted(strings) == ["Attic", "Kitchen", "°C"]
+    kitchen = msg["event"]["a"]["sensor.kitchen"]
+    attic = msg["event"]["a"]["sensor.attic"]
+    assert kitchen["a"] == {}
+    assert kitchen["s"] == "20"
+    assert strings[kitchen["ai"]["friendly_name"]] == "Kitchen"
+    assert strings[kitchen["ai"]["unit_of_measurement"]] == "°C"
+    assert strings[attic["ai"]["friendly_name"]] == "Attic"
+    assert attic["ai"]["unit_of_measurement"] == kitchen["ai"]["unit_of_measurement"]
+
+    # Only new strings are sent with added entities
+    hass.states.async_set(
+        "sensor.garage",
+        "10",
+        {"friendly_name": "Garage", "unit_of_measurement": "°C", "color": "red"},
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["st"] == ["Garage"]
+    strings.extend(msg["event"]["st"])
+    garage = msg["event"]["a"]["sensor.garage"]
+    assert garage["a"] == {"color": "red"}
+    assert strings[garage["ai"]["friendly_name"]] == "Garage"
+    assert garage["ai"]["unit_of_measurement"] == kitchen["ai"]["unit_of_measurement"]
+
+    # Changes are sent as plain attribute diffs
+    hass.states.async_set(
+        "sensor.garage",
+        "11",
+        {"friendly_name": "Carport", "unit_of_measurement": "°C", "color": "red"},
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {
+            "sensor.garage": {
+                "+": {"a": {"friendly_name": "Carport"}, "c": ANY, "lc": ANY, "s": "11"}
+            }
+        }
+    }
+
+
 async def test_subscribe_entities_chained_state_change(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
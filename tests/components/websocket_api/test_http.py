@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 from typing import Any, cast
 from unittest.mock import patch
+import zlib
 
 from aiohttp import WSMsgType, WSServerHandshakeError, web
 import pytest
@@ -14,12 +15,23 @@ from homeassistant.components.websocket_api import (
     http,
     websocket_command,
 )
+from homeassistant.components.websocket_api.auth import (
+    TYPE_AUTH,
+    TYPE_AUTH_OK,
+    TYPE_AUTH_REQUIRED,
+)
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
-from tests.typing import MockHAClientWebSocket, WebSocketGenerator
+from tests.typing import (
+    ClientSessionGenerator,
+    MockHAClientWebSocket,
+    WebSocketGenerator,
+)
 
 
 @pytest.fixture
@@ -399,6 +411,62 @@ async def test_prepare_fail_connection_reset(
     assert "Connection reset by peer while preparing WebSocket" in caplog.text
 
 
+@pytest.mark.usefixtures("socket_enabled")
+@pytest.mark.parametrize(
+    ("transport_compress", "expect_binary"), [(0, True), (15, False)]
+)
+async def test_enable_compressed_messages(
+    hass: HomeAssistant,
+    aiohttp_client: ClientSessionGenerator,
+    hass_access_token: str,
+    transport_compress: int,
+    expect_binary: bool,
+) -> None:
+    """Test large messages are compressed unless the transport is compressed."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    client = await aiohttp_client(hass.http.app)
+    websocket_client = await client.ws_connect(const.URL, compress=transport_compress)
+    assert (await websocket_client.receive_json())["type"] == TYPE_AUTH_REQUIRED
+    await websocket_client.send_json(
+        {"type": TYPE_AUTH, "access_token": hass_access_token}
+    )
+    assert (await websocket_client.receive_json())["type"] == TYPE_AUTH_OK
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COMPRESSED_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+
+    # Small messages are always sent as text
+    await websocket_client.send_json({"id": 2, "type": "ping"})
+    msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.TEXT
+    assert json_loads(msg.data) == {"id": 2, "type": "pong"}
+
+    for idx in range(20):
+        hass.states.async_set(f"sensor.test_{idx}", "on", {"data": "x" * 1000})
+    await websocket_client.send_json({"id": 3, "type": "get_states"})
+    msg = await websocket_client.receive()
+    if expect_binary:
+        assert msg.type is WSMsgType.BINARY
+        data = zlib.decompress(msg.data)
+    else:
+        assert msg.type is WSMsgType.TEXT
+        data = msg.data
+    assert len(data) >= const.COMPRESSED_MESSAGE_MIN_SIZE
+    msg = json_loads(data)
+    assert msg["id"] == 3
+    assert msg["success"] is True
+    assert len(msg["result"]) == 20
+
+    await websocket_client.close()
+
+
 async def test_enable_coalesce(
     hass: HomeAssistant,
     hass_ws_client: WebSocketGenerator,
@@ -451,6 +519,145 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+class _ManualClockLoop:
+    """Event loop proxy whose clock and timers are advanced by the test."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Initialize the proxy."""
+        self._loop = loop
+        self._now = 0.0
+        self._timers: list[asyncio.TimerHandle] = []
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward everything else to the event loop."""
+        return getattr(self._loop, name)
+
+    def time(self) -> float:
+        """Return the manual time."""
+        return self._now
+
+    def call_at(self, when: float, callback: Any, *args: Any) -> asyncio.TimerHandle:
+        """Run callback once the manual time reaches when."""
+        handle = asyncio.TimerHandle(when, callback, args, self._loop)
+        self._timers.append(handle)
+        return handle
+
+    def advance(self, seconds: float) -> None:
+        """Advance the manual time and run the timers which are due."""
+        self._now += seconds
+        due = sorted(
+            (handle for handle in self._timers if handle.when() <= self._now),
+            key=lambda handle: handle.when(),
+        )
+        for handle in due:
+            self._timers.remove(handle)
+            if not handle.cancelled():
+                handle._run()
+
+
+async def test_adaptive_batching(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test messages are held back in batches once they are queued fast."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+
+    metrics = http.async_get_batch_metrics(hass)
+    batches_before = metrics.batches
+    clock = _ManualClockLoop(hass.loop)
+    instance._loop = cast(asyncio.AbstractEventLoop, clock)
+    # Each message is queued in a different event loop
+    # iteration, one millisecond after the previous one
+    for idx in range(100):
+        instance._send_message({"id": 2, "type": "event", "event": idx})
+        await asyncio.sleep(0)
+        clock.advance(0.001)
+    clock.advance(const.BATCH_MAX_DELAY)
+
+    received: list[int] = []
+    while len(received) < 100:
+        msg = await websocket_client.receive_json()
+        if isinstance(msg, dict):
+            msg = [msg]
+        received.extend(item["event"] for item in msg)
+    assert received == list(range(100))
+
+    assert metrics.batches - batches_before < 50
+    assert metrics.max_size > 1
+    assert 0 < metrics.mean_latency <= const.BATCH_MAX_DELAY
+    assert instance._batch_timer is None
+
+
+async def test_adaptive_batching_releases_large_batches(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test a batch which is held back is released once it gets too large."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+
+    # Pretend messages were queued fast so the next batch is held back
+    instance._message_rate = const.BATCH_MIN_RATE
+    instance._send_message({"id": 2, "type": "event", "event": "x" * 100})
+    assert instance._batch_timer is not None
+    instance._send_message(
+        {"id": 2, "type": "event", "event": "x" * const.BATCH_MAX_BYTES}
+    )
+    assert instance._batch_timer is None
+    assert http.async_get_batch_metrics(hass).max_size == 2
+
+    received: list[dict[str, Any]] = []
+    while len(received) < 2:
+        msg = await websocket_client.receive_json()
+        received.extend(msg if isinstance(msg, list) else [msg])
+    assert [len(item["event"]) for item in received] == [100, const.BATCH_MAX_BYTES]
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -1480,6 +1480,7 @@ async def async_test_recorder(
     enable_migrate_event_type_ids: bool,
     enable_migrate_entity_ids: bool,
     enable_migrate_event_ids: bool,
+    tmp_path_factory: pytest.TempPathFactory,
 ) -> AsyncGenerator[RecorderInstanceGenerator]:
     """Yield context manager to setup recorder instance."""
     # pylint: disable-next=import-outside-toplevel
@@ -1611,6 +1612,10 @@ async def async_test_recorder(
             side_effect=debug_session_scope,
             autospec=True,
         ),
+        patch(
+            "homeassistant.components.recorder.core.ID_CACHE_FILE",
+            str(tmp_path_factory.mktemp("recorder") / "id_cache"),
+        ),
     ):
 
         @asynccontextmanager
@@ -2210,6 +2210,59 @@ async def test_update_capabilities(
     assert entry.supported_features == 0
 
 
+async def test_attributes_version(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test attributes are only calculated again when their version changes."""
+
+    class VersionedEntity(entity.Entity):
+        _attr_attributes_version = 0
+        _attr_unique_id = "versioned"
+
+        def __init__(self) -> None:
+            self.attribute_calls = 0
+
+        @property
+        def extra_state_attributes(self) -> dict[str, Any]:
+            self.attribute_calls += 1
+            return {"static": "value"}
+
+    platform = MockEntityPlatform(hass, domain="test")
+    ent = VersionedEntity()
+    await platform.async_add_entities([ent])
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes == {"static": "value"}
+    assert ent.attribute_calls == 1
+
+    ent._attr_state = "on"
+    ent.async_write_ha_state()
+    new_state = hass.states.get(ent.entity_id)
+    assert new_state.state == "on"
+    assert new_state.attributes is state.attributes
+    assert ent.attribute_calls == 1
+
+    ent._attr_attributes_version = 1
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes is state.attributes
+    assert ent.attribute_calls == 2
+
+    entity_registry.async_update_entity(ent.entity_id, name="Renamed")
+    await hass.async_block_till_done()
+    assert hass.states.get(ent.entity_id).attributes == {
+        "friendly_name": "Renamed",
+        "static": "value",
+    }
+    assert ent.attribute_calls == 3
+
+    ent._attr_available = False
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.state == STATE_UNAVAILABLE
+    assert state.attributes == {"friendly_name": "Renamed"}
+    assert ent.attribute_calls == 3
+
+
 async def test_update_capabilities_no_unique_id(
     hass: HomeAssistant,
     entity_registry: er.EntityRegistry,
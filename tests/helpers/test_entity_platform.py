@@ -1586,6 +1586,72 @@ async def test_platforms_sharing_services(hass: HomeAssistant) -> None:
     assert entity2 in entities
 
 
+async def test_entity_service_batch_handler(hass: HomeAssistant) -> None:
+    """Test platforms can handle an entity service for many entities at once."""
+    calls: list[tuple[str, Entity, dict[str, Any]]] = []
+
+    class HelloEntity(MockEntity):
+        """Entity with a hello method."""
+
+        async def async_hello(self, **kwargs: Any) -> None:
+            """Say hello."""
+            calls.append(("entity", self, kwargs))
+
+    async def async_handle_entity_service_batch(
+        hass: HomeAssistant, method: str, entities: list[Entity], data: dict[str, Any]
+    ) -> list[Entity]:
+        """Say hello to all but the last entity at once."""
+        assert method == "async_hello"
+        calls.extend(("batch", entity, data) for entity in entities[:-1])
+        return entities[-1:]
+
+    platform = MockPlatform()
+    platform.async_handle_entity_service_batch = async_handle_entity_service_batch
+    entity_platform = MockEntityPlatform(
+        hass,
+        domain="mock_integration",
+        platform_name="mock_platform",
+        platform=platform,
+    )
+    entity1 = HelloEntity(entity_id="mock_integration.entity_1")
+    entity2 = HelloEntity(entity_id="mock_integration.entity_2")
+    entity3 = HelloEntity(entity_id="mock_integration.entity_3")
+    await entity_platform.async_add_entities([entity1, entity2, entity3])
+
+    other_platform = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    entity4 = HelloEntity(entity_id="mock_integration.entity_4")
+    await other_platform.async_add_entities([entity4])
+
+    entity_platform.async_register_entity_service(
+        "hello", {vol.Optional("word"): str}, "async_hello"
+    )
+
+    await hass.services.async_call(
+        "mock_platform", "hello", {"entity_id": "all", "word": "hi"}, blocking=True
+    )
+    assert sorted(calls, key=lambda call: call[1].entity_id) == [
+        ("batch", entity1, {"word": "hi"}),
+        ("batch", entity2, {"word": "hi"}),
+        ("entity", entity3, {"word": "hi"}),
+        ("entity", entity4, {"word": "hi"}),
+    ]
+
+    # A single entity is called directly
+    calls.clear()
+    await hass.services.async_call(
+        "mock_platform",
+        "hello",
+        {"entity_id": ["mock_integration.entity_1", "mock_integration.entity_4"]},
+        blocking=True,
+    )
+    assert sorted(calls, key=lambda call: call[1].entity_id) == [
+        ("entity", entity1, {}),
+        ("entity", entity4, {}),
+    ]
+
+
 async def test_register_entity_service_response_data(hass: HomeAssistant) -> None:
     """Test an entity service that does supports response data."""
 
@@ -3183,6 +3183,150 @@ async def test_async_track_template_result_multiple_templates(
     ]
 
 
+async def test_async_track_template_result_dependent_templates(
+    hass: HomeAssistant,
+) -> None:
+    """Test a template depending on another template is rendered once per change."""
+    hass.states.async_set("sensor.source", "0")
+    hass.states.async_set("sensor.double", "0")
+    template_sum = Template(
+        "{{ states('sensor.source') | int + states('sensor.double') | int }}", hass
+    )
+    template_double = Template("{{ states('sensor.source') | int * 2 }}", hass)
+
+    sum_runs = []
+
+    @ha.callback
+    def sum_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        sum_runs.append(updates.pop().result)
+
+    @ha.callback
+    def double_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        hass.states.async_set("sensor.double", updates.pop().result)
+
+    # The consumer is tracked before the template it depends on
+    async_track_template_result(hass, [TrackTemplate(template_sum, None)], sum_listener)
+    async_track_template_result(
+        hass, [TrackTemplate(template_double, None)], double_listener
+    )
+
+    hass.states.async_set("sensor.source", "1")
+    await hass.async_block_till_done()
+    # The written state is dispatched in the next loop iteration
+    await hass.async_block_till_done()
+    # The first change renders the consumer before
+    # the scheduler knows which tracker writes the state
+    assert sum_runs == [1, 3]
+    assert hass.states.get("sensor.double").state == "2"
+
+    sum_runs.clear()
+    hass.states.async_set("sensor.source", "2")
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    assert sum_runs == [6]
+    assert hass.states.get("sensor.double").state == "4"
+
+    # Changes in one loop iteration are rendered together
+    sum_runs.clear()
+    hass.states.async_set("sensor.source", "3")
+    hass.states.async_set("sensor.source", "4")
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    assert sum_runs == [12]
+    assert hass.states.get("sensor.double").state == "8"
+
+
+async def test_async_track_template_result_renders_during_state_churn(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates are rendered while other tracked entities keep changing."""
+    hass.states.async_set("sensor.a", "0")
+    async_track_state_change_event(hass, ["sensor.busy"], lambda event: None)
+
+    runs = []
+
+    @ha.callback
+    def listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    async_track_template_result(
+        hass,
+        [TrackTemplate(Template("{{ states('sensor.a') }}", hass), None)],
+        listener,
+    )
+
+    churning = True
+    count = 0
+
+    @ha.callback
+    def churn() -> None:
+        nonlocal count
+        if churning:
+            hass.loop.call_soon(churn)
+        count += 1
+        hass.states.async_set("sensor.busy", str(count))
+
+    churn()
+    hass.states.async_set("sensor.a", "1")
+    for _ in range(5):
+        await asyncio.sleep(0)
+    churning = False
+    assert runs == [1]
+    await hass.async_block_till_done()
+    assert runs == [1]
+
+
+async def test_async_track_template_result_renders_once_per_tick(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates are rendered once for dependencies changing together."""
+    for entity_id in ("sensor.a", "sensor.b", "sensor.c"):
+        hass.states.async_set(entity_id, "0")
+
+    template_abc = Template(
+        "{{ states('sensor.a') }}-{{ states('sensor.b') }}-{{ states('sensor.c') }}",
+        hass,
+    )
+    template_a = Template("{{ states('sensor.a') }}", hass)
+    runs = []
+
+    @ha.callback
+    def listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append((event.data["entity_id"], [update.result for update in updates]))
+
+    async_track_template_result(
+        hass,
+        [TrackTemplate(template_abc, None), TrackTemplate(template_a, None)],
+        listener,
+    )
+
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        autospec=True,
+        side_effect=Template.async_render_to_info,
+    ) as mock_render:
+        hass.states.async_set("sensor.a", "1")
+        hass.states.async_set("sensor.b", "2")
+        hass.states.async_set("sensor.c", "3")
+        await hass.async_block_till_done()
+
+    assert mock_render.call_count == 2
+    assert runs == [("sensor.c", [1, "1-2-3"])]
+
+
 async def test_async_track_template_result_multiple_templates_mixing_domain(
     hass: HomeAssistant,
 ) -> None:
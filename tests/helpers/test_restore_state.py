@@ -131,12 +131,22 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    # Nothing is written if no entity changed
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
         await hass.async_block_till_done()
 
+    assert not mock_write_data.called
+
+    data.async_restore_entity_added(entity)
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
+        await hass.async_block_till_done()
+
     assert mock_write_data.called
 
     with patch(
@@ -147,10 +157,11 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    data.async_restore_entity_added(entity)
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
-        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=45))
         await hass.async_block_till_done()
 
     assert not mock_write_data.called
@@ -197,6 +208,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    data.async_restore_entity_added(entity)
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -358,6 +370,103 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_changed_states(hass: HomeAssistant) -> None:
+    """Test only changed states are saved between full dumps."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for index in range(4):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{index}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+
+    data = async_get(hass)
+    data.async_setup_dump()
+    await hass.async_block_till_done()
+
+    hass.states.async_set("input_boolean.b1", "on")
+    with (
+        patch.object(data.store, "async_save") as mock_write_data,
+        patch.object(data.changes_store, "async_save") as mock_write_changes,
+    ):
+        await data.async_dump_changed_states()
+
+    assert not mock_write_data.called
+    assert mock_write_changes.called
+    written_states = [
+        json_round_trip(state) for state in mock_write_changes.mock_calls[0][1][0]
+    ]
+    assert [state["state"]["entity_id"] for state in written_states] == [
+        "input_boolean.b1"
+    ]
+    assert written_states[0]["state"]["state"] == "on"
+
+    # Nothing changed
+    with (
+        patch.object(data.store, "async_save") as mock_write_data,
+        patch.object(data.changes_store, "async_save") as mock_write_changes,
+    ):
+        await data.async_dump_changed_states()
+
+    assert not mock_write_data.called
+    assert not mock_write_changes.called
+
+    # Once most entities changed all states are dumped
+    hass.states.async_set("input_boolean.b2", "on")
+    hass.states.async_set("input_boolean.b3", "on")
+    with (
+        patch.object(data.store, "async_save") as mock_write_data,
+        patch.object(data.changes_store, "async_save") as mock_write_changes,
+        patch.object(data.changes_store, "async_remove") as mock_remove_changes,
+    ):
+        await data.async_dump_changed_states()
+
+    assert mock_write_data.called
+    assert len(mock_write_data.mock_calls[0][1][0]) == 4
+    assert not mock_write_changes.called
+    assert mock_remove_changes.called
+
+    # All states are dumped once the last full dump is too old
+    hass.states.async_set("input_boolean.b0", "on")
+    with (
+        patch.object(data.store, "async_save") as mock_write_data,
+        patch.object(data.changes_store, "async_save") as mock_write_changes,
+        patch(
+            "homeassistant.helpers.restore_state.dt_util.utcnow",
+            return_value=dt_util.utcnow() + timedelta(hours=5),
+        ),
+    ):
+        await data.async_dump_changed_states()
+
+    assert mock_write_data.called
+    assert not mock_write_changes.called
+
+
+async def test_load_changed_states(hass: HomeAssistant) -> None:
+    """Test changed states are applied on top of the last full dump."""
+    now = dt_util.utcnow()
+    data = async_get(hass)
+    await hass.async_block_till_done()
+    await data.store.async_save(
+        [
+            StoredState(State("input_boolean.b0", "on"), None, now).as_dict(),
+            StoredState(State("input_boolean.b1", "on"), None, now).as_dict(),
+        ]
+    )
+    await data.changes_store.async_save(
+        [StoredState(State("input_boolean.b1", "off"), None, now).as_dict()]
+    )
+
+    # Emulate a fresh load
+    hass.data.pop(DATA_RESTORE_STATE)
+    await async_load(hass)
+    data = async_get(hass)
+
+    assert data.last_states["input_boolean.b0"].state.state == "on"
+    assert data.last_states["input_boolean.b1"].state.state == "off"
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
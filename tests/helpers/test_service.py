@@ -38,6 +38,7 @@ from homeassistant.helpers import (
     area_registry as ar,
     device_registry as dr,
     entity_registry as er,
+    floor_registry as fr,
     service,
 )
 import homeassistant.helpers.config_validation as cv
@@ -46,6 +47,7 @@ from homeassistant.setup import async_setup_component
 from homeassistant.util.yaml.loader import parse_yaml
 
 from tests.common import (
+    MockConfigEntry,
     MockEntity,
     MockModule,
     MockUser,
@@ -745,6 +747,94 @@ async def test_extract_entity_ids_from_floor(hass: HomeAssistant) -> None:
     )
 
 
+async def test_extract_entity_ids_reuses_resolved_targets(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+    floor_registry: fr.FloorRegistry,
+) -> None:
+    """Test targets are resolved again only when the registries change."""
+    floor = floor_registry.async_create("Upstairs")
+    area = area_registry.async_create("Bedroom", floor_id=floor.floor_id)
+    entry = entity_registry.async_get_or_create(
+        "light", "hue", "1", suggested_object_id="bedroom"
+    )
+    entity_registry.async_update_entity(entry.entity_id, area_id=area.id)
+    await hass.async_block_till_done()
+    call = ServiceCall("light", "turn_on", {"floor_id": floor.floor_id})
+
+    with patch(
+        "homeassistant.helpers.service._async_resolve_registry_targets",
+        wraps=service._async_resolve_registry_targets,
+    ) as mock_resolve:
+        assert await service.async_extract_entity_ids(hass, call) == {"light.bedroom"}
+        referenced = service.async_extract_referenced_entity_ids(hass, call)
+        assert referenced.indirectly_referenced == {"light.bedroom"}
+        assert referenced.referenced_areas == {area.id}
+        assert mock_resolve.call_count == 1
+
+        # The returned sets are not shared with the index
+        referenced.indirectly_referenced.add("light.other")
+        assert await service.async_extract_entity_ids(hass, call) == {"light.bedroom"}
+
+        # Changes which do not affect targeting keep the index
+        entity_registry.async_update_entity(entry.entity_id, name="Bed")
+        await hass.async_block_till_done()
+        assert await service.async_extract_entity_ids(hass, call) == {"light.bedroom"}
+        assert mock_resolve.call_count == 1
+
+        entity_registry.async_update_entity(entry.entity_id, area_id=None)
+        await hass.async_block_till_done()
+        assert await service.async_extract_entity_ids(hass, call) == set()
+        assert mock_resolve.call_count == 2
+
+        area_registry.async_update(area.id, floor_id=None)
+        await hass.async_block_till_done()
+        assert (
+            service.async_extract_referenced_entity_ids(hass, call).referenced_areas
+            == set()
+        )
+        assert mock_resolve.call_count == 3
+
+        floor_registry.async_delete(floor.floor_id)
+        await hass.async_block_till_done()
+        assert service.async_extract_referenced_entity_ids(
+            hass, call
+        ).missing_floors == {floor.floor_id}
+        assert mock_resolve.call_count == 4
+
+
+async def test_extract_entity_ids_resolves_again_when_entity_enabled(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test resolved device targets are forgotten when an entity is enabled."""
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    entry = entity_registry.async_get_or_create(
+        "light",
+        "hue",
+        "1",
+        device_id=device.id,
+        disabled_by=er.RegistryEntryDisabler.USER,
+        suggested_object_id="test_1",
+    )
+    call = ServiceCall("light", "turn_on", {"device_id": device.id})
+
+    referenced = service.async_extract_referenced_entity_ids(hass, call)
+    assert referenced.indirectly_referenced == set()
+
+    entity_registry.async_update_entity(entry.entity_id, disabled_by=None)
+    await hass.async_block_till_done()
+    referenced = service.async_extract_referenced_entity_ids(hass, call)
+    assert referenced.indirectly_referenced == {"light.test_1"}
+
+
 @pytest.mark.usefixtures("label_mock")
 async def test_extract_entity_ids_from_labels(hass: HomeAssistant) -> None:
     """Test extract_entity_ids method with labels."""
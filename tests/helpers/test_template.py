@@ -13,6 +13,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+import jinja2
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -342,6 +343,60 @@ async def test_import_change(hass: HomeAssistant) -> None:
     assert to_test.async_render() == "macro2 variable2"
 
 
+async def test_bytecode_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled template code is saved and loaded after a restart."""
+    source = "{{ 1 + 1 }}"
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template(source, hass).async_render() == 2
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=template.BYTECODE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    data = hass_storage[template.BYTECODE_STORAGE_KEY]["data"]
+    assert list(data["codes"]) == [
+        f"normal-{jinja2.BytecodeCache().get_source_checksum(source)}"
+    ]
+
+    # Simulate a restart
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    with patch.object(
+        jinja2.Environment, "compile", side_effect=AssertionError("Compiled")
+    ):
+        assert template.Template(source, hass).async_render() == 2
+
+
+async def test_bytecode_cache_version_changed(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled template code is discarded when the version changes."""
+    source = "{{ 1 + 1 }}"
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template(source, hass).async_render() == 2
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=template.BYTECODE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    data = hass_storage[template.BYTECODE_STORAGE_KEY]["data"]
+    data["versions"][0] = "2000.1.0"
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    with patch.object(
+        jinja2.Environment,
+        "compile",
+        autospec=True,
+        side_effect=jinja2.Environment.compile,
+    ) as compile_mock:
+        assert template.Template(source, hass).async_render() == 2
+    assert compile_mock.call_count == 1
+
+
 def test_loop_controls(hass: HomeAssistant) -> None:
     """Test that loop controls are enabled."""
     assert (
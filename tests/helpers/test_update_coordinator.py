@@ -1,6 +1,7 @@
 """Tests for the update coordinator."""
 
 from datetime import datetime, timedelta
+from functools import partial
 import logging
 from unittest.mock import AsyncMock, Mock, patch
 import urllib.error
@@ -11,7 +12,7 @@ import pytest
 import requests
 
 from homeassistant import config_entries
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED
 from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
@@ -21,7 +22,7 @@ from homeassistant.exceptions import (
 from homeassistant.helpers import update_coordinator
 from homeassistant.util.dt import utcnow
 
-from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.common import MockConfigEntry, async_capture_events, async_fire_time_changed
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -492,6 +493,36 @@ async def test_async_set_updated_data(
     remove_callbacks()
 
 
+async def test_async_update_listeners_batches_state_writes(
+    hass: HomeAssistant,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test state changed events are fired once all listeners are updated."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    events_seen = []
+
+    def update_callback(entity_id: str) -> None:
+        events_seen.append(len(events))
+        hass.states.async_set(entity_id, str(crd.data))
+
+    remove_callbacks = [
+        crd.async_add_listener(partial(update_callback, f"sensor.test_{index}"))
+        for index in range(3)
+    ]
+    crd.async_set_updated_data(100)
+    await hass.async_block_till_done()
+
+    assert events_seen == [0, 0, 0]
+    assert [event.data["entity_id"] for event in events] == [
+        "sensor.test_0",
+        "sensor.test_1",
+        "sensor.test_2",
+    ]
+
+    for remove_callback in remove_callbacks:
+        remove_callback()
+
+
 async def test_stop_refresh_on_ha_stop(
     hass: HomeAssistant, crd: update_coordinator.DataUpdateCoordinator[int]
 ) -> None:
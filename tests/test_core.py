@@ -1492,6 +1492,84 @@ async def test_statemachine_remove(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting many states at once."""
+    hass.states.async_set("light.bowl", "on")
+    changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    reported_events: list[ha.Event[ha.EventStateReportedData]] = []
+
+    @ha.callback
+    def _state_reported_filter(event_data: ha.EventStateReportedData) -> bool:
+        """Accept all state reported events."""
+        return True
+
+    @ha.callback
+    def _state_reported(event: ha.Event[ha.EventStateReportedData]) -> None:
+        """Record state reported events."""
+        reported_events.append(event)
+
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED, _state_reported, event_filter=_state_reported_filter
+    )
+    states_seen: list[tuple[str | None, str | None]] = []
+
+    @ha.callback
+    def _state_changed(event: ha.Event[ha.EventStateChangedData]) -> None:
+        """Record the states set when the first event is fired."""
+        bowl = hass.states.get("light.bowl")
+        ceiling = hass.states.get("light.ceiling")
+        states_seen.append((bowl and bowl.state, ceiling and ceiling.state))
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _state_changed)
+
+    hass.states.async_set_many(
+        [
+            ("light.BOWL", "off", {"brightness": 0}),
+            ("light.ceiling", "on", None),
+            ("light.kitchen", "on", {}),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    # All states are set before the events of the batch are fired
+    assert states_seen == [("off", "on"), ("off", "on"), ("off", "on")]
+    assert [event.data["entity_id"] for event in changed_events] == [
+        "light.bowl",
+        "light.ceiling",
+        "light.kitchen",
+    ]
+    assert len({event.context.id for event in changed_events}) == 1
+    assert len({event.time_fired_timestamp for event in changed_events}) == 1
+    assert hass.states.get("light.bowl").attributes == {"brightness": 0}
+
+    hass.states.async_set_many(
+        [("light.bowl", "off", {"brightness": 0}), ("light.kitchen", "off", None)]
+    )
+    await hass.async_block_till_done()
+    assert len(changed_events) == 4
+    assert len(reported_events) == 1
+    assert reported_events[0].data["entity_id"] == "light.bowl"
+
+
+async def test_statemachine_batch(hass: HomeAssistant) -> None:
+    """Test events of states written in a batch are deferred."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with hass.states.async_batch():
+        hass.states.async_set("light.bowl", "on")
+        with hass.states.async_batch():
+            hass.states.async_set("light.ceiling", "on")
+        hass.states.async_remove("light.bowl")
+        assert hass.states.get("light.ceiling").state == "on"
+        await hass.async_block_till_done()
+        assert events == []
+
+    await hass.async_block_till_done()
+    assert [
+        (event.data["entity_id"], event.data["new_state"] is None) for event in events
+    ] == [("light.bowl", False), ("light.ceiling", False), ("light.bowl", True)]
+
+
 async def test_state_machine_case_insensitivity(hass: HomeAssistant) -> None:
     """Test setting and getting states entity_id insensitivity."""
     events = async_capture_events(hass, EVENT_STATE_CHANGED)